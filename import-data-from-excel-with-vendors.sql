@@ -1,7 +1,7 @@
 -- ============================================================================
 -- DATA IMPORT FROM Stock List 2024-2025.xlsx
 -- WITH ITEM-VENDOR RELATIONSHIPS SUPPORT
--- Generated: 2025-12-11 13:28:38
+-- Generated: 2026-10-18 11:48:20
 -- ============================================================================
 -- Features:
 -- - Splits multi-vendor entries (e.g., 'Robu / Vyom' → 2 vendors)
@@ -16172,7 +16172,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Coupling Hood'
+  AND i.code = 'COUPLING-HOOD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16187,7 +16187,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Battery Clamp'
+  AND i.code = 'BATTERY-CLAMP'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16217,7 +16217,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4 Square Nut'
+  AND i.code = 'M4-SQUARE-NUT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16262,7 +16262,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x12 plain washer'
+  AND i.code = 'M4X12-PLAIN-WASHER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16292,7 +16292,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x10 CSK Phillips'
+  AND i.code = 'M4X10-CSK-PHILLIPS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16307,7 +16307,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x20 CSK Phillips'
+  AND i.code = 'M4X20-CSK-PHILLIPS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16337,7 +16337,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Rotex14 Coupling'
+  AND i.code = 'ROTEX14-COUPLING'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16352,7 +16352,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16367,7 +16367,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Nozzle on Jet'
+  AND i.code = 'NOZZLE-ON-JET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16382,7 +16382,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon hose pipe clip 7mm'
+  AND i.code = 'SILICON-HOSE-PIPE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16412,7 +16412,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'ESC Mounting Plate'
+  AND i.code = 'ESC-MOUNTING-PLATE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16427,7 +16427,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Jet S52 Mounting plate'
+  AND i.code = 'JET-S52-MOUNTING'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16457,7 +16457,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Motor 5692 495 KV'
+  AND i.code = 'MOTOR-5692-495'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16487,7 +16487,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon Hose 4mm x 8mm'
+  AND i.code = 'SILICON-HOSE-4MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16502,7 +16502,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon Hose 3mm x 6mm'
+  AND i.code = 'SILICON-HOSE-3MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16532,7 +16532,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Jet Motor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Thread locker Activator'
+  AND i.code = 'THREAD-LOCKER-ACTIVATOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16564,7 +16564,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '5.5mm Female Bullet connector'
+  AND i.code = '55MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16579,7 +16579,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '4mm Male Bullet connector'
+  AND i.code = '4MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16594,7 +16594,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '4mm Female Bullet connector'
+  AND i.code = '4MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16639,7 +16639,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Ferrite Core'
+  AND i.code = 'FERRITE-CORE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16654,7 +16654,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '16AWG Lead'
+  AND i.code = '16AWG-LEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16669,7 +16669,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Heatshrink Tube 9:3'
+  AND i.code = 'HEATSHRINK-TUBE-93'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16684,7 +16684,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 4.8/1.2'
+  AND i.code = 'HEATSHRINK-TUBE-4812'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16699,7 +16699,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HV130 ESC'
+  AND i.code = 'HV130-ESC'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16731,7 +16731,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '5.5mm Female Bullet connector'
+  AND i.code = '55MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16746,7 +16746,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '4mm Male Bullet connector'
+  AND i.code = '4MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16761,7 +16761,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '4mm Female Bullet connector'
+  AND i.code = '4MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16791,7 +16791,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Ferrite Core'
+  AND i.code = 'FERRITE-CORE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16806,7 +16806,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '16AWG Lead'
+  AND i.code = '16AWG-LEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16821,7 +16821,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Heatshrink Tube 9:3'
+  AND i.code = 'HEATSHRINK-TUBE-93'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16836,7 +16836,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 4.8/1.2'
+  AND i.code = 'HEATSHRINK-TUBE-4812'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16851,7 +16851,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT_ESC Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HV130 ESC'
+  AND i.code = 'HV130-ESC'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16883,7 +16883,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '15 pin JST-XH housing'
+  AND i.code = '15-PIN-JSTXH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -16898,7 +16898,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '10cm one sided JST crimped Black'
+  AND i.code = '10CM-ONE-SIDED'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17123,7 +17123,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 1.5mm/1.6mm'
+  AND i.code = 'HEATSHRINK-TUBE-15MM16MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17138,7 +17138,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17153,7 +17153,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon RTV 734 Potting compound'
+  AND i.code = 'SILICON-RTV-734'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17168,7 +17168,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17200,7 +17200,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '15 pin JST-XH housing'
+  AND i.code = '15-PIN-JSTXH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17215,7 +17215,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '10cm one sided JST crimped Black'
+  AND i.code = '10CM-ONE-SIDED'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17440,7 +17440,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 1.5mm/1.6mm'
+  AND i.code = 'HEATSHRINK-TUBE-15MM16MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17455,7 +17455,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17470,7 +17470,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon RTV 734 Potting compound'
+  AND i.code = 'SILICON-RTV-734'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17485,7 +17485,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17517,7 +17517,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm male bullet connector'
+  AND i.code = '2MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17532,7 +17532,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm Female Bullet connector'
+  AND i.code = '2MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17547,7 +17547,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17577,7 +17577,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'LM61 Temperature Sensor'
+  AND i.code = 'LM61-TEMPERATURE-SENSOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17592,7 +17592,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '20Core Wire 14/38'
+  AND i.code = '20CORE-WIRE-1438'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17607,7 +17607,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Red 14/38 wire'
+  AND i.code = 'RED-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17652,7 +17652,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 4:1'
+  AND i.code = 'HEATSHRINK-TUBE-41'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17667,7 +17667,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 12:3'
+  AND i.code = 'HEATSHRINK-TUBE-123'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17682,7 +17682,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 1.5mm/1.6mm'
+  AND i.code = 'HEATSHRINK-TUBE-15MM16MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17697,7 +17697,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '1uF 0805 PANASONIC'
+  AND i.code = '1UF-0805-PANASONIC'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17712,7 +17712,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 3:1'
+  AND i.code = 'HEATSHRINK-TUBE-31'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17727,7 +17727,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon RTV 734 Potting compound'
+  AND i.code = 'SILICON-RTV-734'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17759,7 +17759,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm male bullet connector'
+  AND i.code = '2MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17774,7 +17774,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm Female Bullet connector'
+  AND i.code = '2MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17789,7 +17789,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17819,7 +17819,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'LM61 Temperature Sensor'
+  AND i.code = 'LM61-TEMPERATURE-SENSOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17834,7 +17834,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '20Core Wire 14/38'
+  AND i.code = '20CORE-WIRE-1438'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17849,7 +17849,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Black 14/38 Wire'
+  AND i.code = 'BLACK-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17894,7 +17894,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 4:1'
+  AND i.code = 'HEATSHRINK-TUBE-41'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17909,7 +17909,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 12:3'
+  AND i.code = 'HEATSHRINK-TUBE-123'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17924,7 +17924,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 1.5mm/1.6mm'
+  AND i.code = 'HEATSHRINK-TUBE-15MM16MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17939,7 +17939,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '1uF 0805 PANASONIC'
+  AND i.code = '1UF-0805-PANASONIC'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17954,7 +17954,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 3:1'
+  AND i.code = 'HEATSHRINK-TUBE-31'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -17969,7 +17969,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Signal CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon RTV 734 Potting compound'
+  AND i.code = 'SILICON-RTV-734'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18001,7 +18001,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm male bullet connector'
+  AND i.code = '2MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18061,7 +18061,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '13 pin JST-XH housing'
+  AND i.code = '13-PIN-JSTXH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18286,7 +18286,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Heatshrink Tube 6.4:1.6'
+  AND i.code = 'HEATSHRINK-TUBE-6416'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18301,7 +18301,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 4:1'
+  AND i.code = 'HEATSHRINK-TUBE-41'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18316,7 +18316,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 1.5mm/1.6mm'
+  AND i.code = 'HEATSHRINK-TUBE-15MM16MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18331,7 +18331,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18346,7 +18346,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging PM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon RTV 734 Potting compound'
+  AND i.code = 'SILICON-RTV-734'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18378,7 +18378,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '24v AC/DC module'
+  AND i.code = '24V-ACDC-MODULE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18393,7 +18393,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18423,7 +18423,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '3 pin 3 yrd power cord'
+  AND i.code = '3-PIN-3'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18438,7 +18438,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Black Microfit one side crimped wires'
+  AND i.code = '25CM-BLACK-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18453,7 +18453,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Green Microfit one side crimped wires'
+  AND i.code = '25CM-GREEN-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18468,7 +18468,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Violet Microfit one side crimped wires'
+  AND i.code = '25CM-VIOLET-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18483,7 +18483,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Yellow Microfit one side crimped wires'
+  AND i.code = '25CM-YELLOW-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18513,7 +18513,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Pink Microfit one side crimped wires'
+  AND i.code = '25CM-PINK-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18528,7 +18528,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm L.Brown Microfit one side crimped wires'
+  AND i.code = '25CM-LBROWN-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18543,7 +18543,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm D.Brown Microfit one side crimped wires'
+  AND i.code = '25CM-DBROWN-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18558,7 +18558,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm White Microfit one side crimped wires'
+  AND i.code = '25CM-WHITE-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18588,7 +18588,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Red Microfit one side crimped wires'
+  AND i.code = '25CM-RED-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18603,7 +18603,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Dark Blue Microfit one side crimped wires'
+  AND i.code = '25CM-DARK-BLUE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18618,7 +18618,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Orange Microfit one side crimped wires'
+  AND i.code = '25CM-ORANGE-MICROFIT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18633,7 +18633,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '18pin Microfit housing'
+  AND i.code = '18PIN-MICROFIT-HOUSING'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18648,7 +18648,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '12S Lipo Charger'
+  AND i.code = '12S-LIPO-CHARGER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18663,7 +18663,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '130x80x60 enclosure box'
+  AND i.code = '130X80X60-ENCLOSURE-BOX'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18678,7 +18678,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PG-7 Cable Gland'
+  AND i.code = 'PG7-CABLE-GLAND'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18708,7 +18708,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charger Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18770,7 +18770,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18800,7 +18800,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '20Core Wire 14/38'
+  AND i.code = '20CORE-WIRE-1438'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18815,7 +18815,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Charging CM Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'WY-28 Metal connector CM'
+  AND i.code = 'WY28-METAL-CONNECTOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18877,7 +18877,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'RPM Sensor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '47k 0805'
+  AND i.code = '47K-0805'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18907,7 +18907,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'RPM Sensor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '0.1uF 0805'
+  AND i.code = '01UF-0805'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18922,7 +18922,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'RPM Sensor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '0.01uF 0805'
+  AND i.code = '001UF-0805'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18937,7 +18937,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'RPM Sensor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'LED 0805 SMD'
+  AND i.code = 'LED-0805-SMD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18952,7 +18952,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'RPM Sensor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '1N4148 SMD'
+  AND i.code = '1N4148-SMD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -18999,7 +18999,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Current Sensor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PWB of Current Sensor'
+  AND i.code = 'PWB-OF-CURRENT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19014,7 +19014,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Current Sensor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'WCS1700 current Sensor'
+  AND i.code = 'WCS1700-CURRENT-SENSOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19029,7 +19029,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Current Sensor Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '0.1uF 0805'
+  AND i.code = '01UF-0805'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19076,7 +19076,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Receiver Module R9MM/R9MX/R9'
+  AND i.code = 'RECEIVER-MODULE-R9MMR9MXR9'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19091,7 +19091,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Free Wheel Diode SMD M7'
+  AND i.code = 'FREE-WHEEL-DIODE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19151,7 +19151,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '4mm Male Bullet connector'
+  AND i.code = '4MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19166,7 +19166,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '4mm Female Bullet connector'
+  AND i.code = '4MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19181,7 +19181,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm male bullet connector'
+  AND i.code = '2MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19196,7 +19196,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm Female Bullet connector'
+  AND i.code = '2MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19211,7 +19211,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '6mm male bullet connector'
+  AND i.code = '6MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19226,7 +19226,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '6mm female bullet connector'
+  AND i.code = '6MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19286,7 +19286,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Buck converter XL7015 50v'
+  AND i.code = 'BUCK-CONVERTER-XL7015'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19331,7 +19331,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead paste'
+  AND i.code = 'LEAD-PASTE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19346,7 +19346,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19361,7 +19361,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'LED 0805 SMD'
+  AND i.code = 'LED-0805-SMD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19376,7 +19376,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '18pF 0805 capacitor'
+  AND i.code = '18PF-0805-CAPACITOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19391,7 +19391,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '10uF 10v Tantalum Capacitor Case A'
+  AND i.code = '10UF-10V-TANTALUM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19406,7 +19406,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'SPST relay 5A-12v ANTI_S & KILL'
+  AND i.code = 'SPST-RELAY-5A12V'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19421,7 +19421,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Balancing 1A DPDT 24v Relay'
+  AND i.code = 'BALANCING-1A-DPDT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19436,7 +19436,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Balancing relay 5A/2A 24v SPST'
+  AND i.code = 'BALANCING-RELAY-5A2A'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19451,7 +19451,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'BlueTooth Module'
+  AND i.code = 'BLUETOOTH-MODULE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19466,7 +19466,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '24AWG Soldering Wire'
+  AND i.code = '24AWG-SOLDERING-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19481,7 +19481,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '12E 2W Resistor THT'
+  AND i.code = '12E-2W-RESISTOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19496,7 +19496,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '1k 0805 Resistor'
+  AND i.code = '1K-0805-RESISTOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19526,7 +19526,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '10k 0805 resistor'
+  AND i.code = '10K-0805-RESISTOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19541,7 +19541,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '330E 0805 Resistor'
+  AND i.code = '330E-0805-RESISTOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19556,7 +19556,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Female Bergstrip 40x1 2.54mm'
+  AND i.code = 'FEMALE-BERGSTRIP-40X1'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19571,7 +19571,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Male Bergstrip 40x1 2.54mm'
+  AND i.code = 'MALE-BERGSTRIP-40X1'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19586,7 +19586,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Conformal Coating'
+  AND i.code = 'CONFORMAL-COATING'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19676,7 +19676,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'JST-XH Crimping pins'
+  AND i.code = 'JSTXH-CRIMPING-PINS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19691,7 +19691,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Fuse 500mA'
+  AND i.code = 'FUSE-500MA'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19706,7 +19706,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'MCP3208'
+  AND i.code = 'MCP3208'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19721,7 +19721,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '23A 24v Power relay'
+  AND i.code = '23A-24V-POWER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19766,7 +19766,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '1uF 0805 PANASONIC'
+  AND i.code = '1UF-0805-PANASONIC'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19781,7 +19781,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '16MHz Crystal Oscillator'
+  AND i.code = '16MHZ-CRYSTAL-OSCILLATOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19796,7 +19796,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'ULN2004 SMD'
+  AND i.code = 'ULN2004-SMD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19811,7 +19811,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'SSR AQW282SX'
+  AND i.code = 'SSR-AQW282SX'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19856,7 +19856,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Heatshrink Tube 6.4:1.6'
+  AND i.code = 'HEATSHRINK-TUBE-6416'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19871,7 +19871,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Heatshrink Tube 9:3'
+  AND i.code = 'HEATSHRINK-TUBE-93'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19886,7 +19886,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Current Sensor Assy'
+  AND i.code = 'CURRENT-SENSOR-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19901,7 +19901,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'A21 MotherBoard Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'RPM Sensor Assy'
+  AND i.code = 'RPM-SENSOR-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19963,7 +19963,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Electronic Box Top Lid'
+  AND i.code = 'ELECTRONIC-BOX-TOP'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -19993,7 +19993,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'BlueRobotics Indicator'
+  AND i.code = 'BLUEROBOTICS-INDICATOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20023,7 +20023,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PG-7 Cable Gland'
+  AND i.code = 'PG7-CABLE-GLAND'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20038,7 +20038,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Electronic Box'
+  AND i.code = 'ELECTRONIC-BOX'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20068,7 +20068,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20083,7 +20083,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon RTV 732'
+  AND i.code = 'SILICON-RTV-732'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20098,7 +20098,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Power Switch Assy'
+  AND i.code = 'POWER-SWITCH-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20113,7 +20113,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x20 CSK Phillips'
+  AND i.code = 'M4X20-CSK-PHILLIPS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20128,7 +20128,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'STBD Signal PM Assy'
+  AND i.code = 'STBD-SIGNAL-PM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20143,7 +20143,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PORT Signal PM Assy'
+  AND i.code = 'PORT-SIGNAL-PM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20158,7 +20158,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Current Sensor Assy'
+  AND i.code = 'CURRENT-SENSOR-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20173,7 +20173,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Electronic Box Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'A21 MotherBoard Assy'
+  AND i.code = 'A21-MOTHERBOARD-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20205,7 +20205,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm male bullet connector'
+  AND i.code = '2MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20220,7 +20220,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PWB of STBD flash light'
+  AND i.code = 'PWB-OF-STBD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20235,7 +20235,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Red 14/38 wire'
+  AND i.code = 'RED-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20250,7 +20250,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Black 14/38 Wire'
+  AND i.code = 'BLACK-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20265,7 +20265,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Green 2835 SMD LED 1W'
+  AND i.code = 'GREEN-2835-SMD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20297,7 +20297,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm male bullet connector'
+  AND i.code = '2MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20312,7 +20312,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm Female Bullet connector'
+  AND i.code = '2MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20327,7 +20327,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PWB of PORT flash light'
+  AND i.code = 'PWB-OF-PORT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20342,7 +20342,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Red 14/38 wire'
+  AND i.code = 'RED-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20357,7 +20357,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Black 14/38 Wire'
+  AND i.code = 'BLACK-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20372,7 +20372,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Elec' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Red 2835 SMD LED 1W'
+  AND i.code = 'RED-2835-SMD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20419,7 +20419,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Flashing Light glass'
+  AND i.code = 'FLASHING-LIGHT-GLASS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20434,7 +20434,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Flashing Light bottom plate'
+  AND i.code = 'FLASHING-LIGHT-BOTTOM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20449,7 +20449,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Heatsink paste'
+  AND i.code = 'HEATSINK-PASTE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20479,7 +20479,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x12 Allen Head'
+  AND i.code = 'M4X12-ALLEN-HEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20494,7 +20494,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_STBD Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20541,7 +20541,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Flashing Light glass'
+  AND i.code = 'FLASHING-LIGHT-GLASS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20556,7 +20556,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Flashing Light bottom plate'
+  AND i.code = 'FLASHING-LIGHT-BOTTOM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20571,7 +20571,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Heatsink paste'
+  AND i.code = 'HEATSINK-PASTE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20601,7 +20601,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x12 Allen Head'
+  AND i.code = 'M4X12-ALLEN-HEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20616,7 +20616,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'FL_PORT Mech' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20678,7 +20678,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Battery Block Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Copper Strips 3x2 cells'
+  AND i.code = 'COPPER-STRIPS-3X2'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20693,7 +20693,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Battery Block Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '70mm Paper Separator'
+  AND i.code = '70MM-PAPER-SEPARATOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20708,7 +20708,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Battery Block Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Barley paper for 21700 cylindrical cell'
+  AND i.code = 'BARLEY-PAPER-FOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20723,7 +20723,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Battery Block Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '1" Masking Tape'
+  AND i.code = '1-MASKING-TAPE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20755,7 +20755,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '6mm female bullet connector'
+  AND i.code = '6MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20770,7 +20770,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '8mm male bullet connector'
+  AND i.code = '8MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20845,7 +20845,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm FRP 60x70mm with 18 mm hole'
+  AND i.code = '2MM-FRP-60X70MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20860,7 +20860,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '70mm Paper Separator'
+  AND i.code = '70MM-PAPER-SEPARATOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20875,7 +20875,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '16AWG Lead'
+  AND i.code = '16AWG-LEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20890,7 +20890,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 12:3'
+  AND i.code = 'HEATSHRINK-TUBE-123'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20905,7 +20905,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'STBD Signal CM Assy'
+  AND i.code = 'STBD-SIGNAL-CM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20920,7 +20920,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Battery Block Assy'
+  AND i.code = 'BATTERY-BLOCK-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20935,7 +20935,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 100mm'
+  AND i.code = 'HEATSHRINK-TUBE-100MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20950,7 +20950,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20982,7 +20982,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '4mm Female Bullet connector'
+  AND i.code = '4MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -20997,7 +20997,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm Female Bullet connector'
+  AND i.code = '2MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21012,7 +21012,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '8mm female bullet connector'
+  AND i.code = '8MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21102,7 +21102,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm FRP 60x70mm with 18 mm hole'
+  AND i.code = '2MM-FRP-60X70MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21117,7 +21117,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '70mm Paper Separator'
+  AND i.code = '70MM-PAPER-SEPARATOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21132,7 +21132,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '16AWG Lead'
+  AND i.code = '16AWG-LEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21147,7 +21147,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 12:3'
+  AND i.code = 'HEATSHRINK-TUBE-123'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21162,7 +21162,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PORT Signal CM Assy'
+  AND i.code = 'PORT-SIGNAL-CM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21177,7 +21177,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Battery Block Assy'
+  AND i.code = 'BATTERY-BLOCK-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21192,7 +21192,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 100mm'
+  AND i.code = 'HEATSHRINK-TUBE-100MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21207,7 +21207,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Battery Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21284,7 +21284,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x12 plain washer'
+  AND i.code = 'M4X12-PLAIN-WASHER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21299,7 +21299,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '3mm Silicon Rubber Gaskets (35mmx10mm)'
+  AND i.code = '3MM-SILICON-RUBBER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21329,7 +21329,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'STBD_ESC Assy'
+  AND i.code = 'STBDESC-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21344,7 +21344,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'STBD Battery Assy'
+  AND i.code = 'STBD-BATTERY-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21359,7 +21359,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x20 CSK Phillips'
+  AND i.code = 'M4X20-CSK-PHILLIPS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21374,7 +21374,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x16 Allen Head'
+  AND i.code = 'M4X16-ALLEN-HEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21451,7 +21451,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x12 plain washer'
+  AND i.code = 'M4X12-PLAIN-WASHER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21466,7 +21466,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '3mm Silicon Rubber Gaskets (35mmx10mm)'
+  AND i.code = '3MM-SILICON-RUBBER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21496,7 +21496,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PORT_ESC Assy'
+  AND i.code = 'PORTESC-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21511,7 +21511,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PORT Battery Assy'
+  AND i.code = 'PORT-BATTERY-ASSY'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21526,7 +21526,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Unit Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x20 CSK Phillips'
+  AND i.code = 'M4X20-CSK-PHILLIPS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21558,7 +21558,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Self Rightening Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'SR Structure'
+  AND i.code = 'SR-STRUCTURE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21573,7 +21573,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Self Rightening Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'SR Pillow'
+  AND i.code = 'SR-PILLOW'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21648,7 +21648,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Self Rightening Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21693,7 +21693,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Self Rightening Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '6mmx12mm Rubber Bush'
+  AND i.code = '6MMX12MM-RUBBER-BUSH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21723,7 +21723,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Self Rightening Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Instant Adhesive 407 for EPE sticking'
+  AND i.code = 'INSTANT-ADHESIVE-407'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21738,7 +21738,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Self Rightening Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'STBD SR Rubber Boot'
+  AND i.code = 'STBD-SR-RUBBER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21753,7 +21753,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Self Rightening Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PORT SR Rubber Boot'
+  AND i.code = 'PORT-SR-RUBBER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21813,7 +21813,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Self Rightening Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'RR Tape'
+  AND i.code = 'RR-TAPE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21845,7 +21845,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'QX7 Transmitter with R9M'
+  AND i.code = 'QX7-TRANSMITTER-WITH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21860,7 +21860,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PWB of Button -2'
+  AND i.code = 'PWB-OF-BUTTON'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21890,7 +21890,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '3 pin JST-XH housing'
+  AND i.code = '3-PIN-JSTXH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21905,7 +21905,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Red one side crimped wire'
+  AND i.code = '25CM-RED-ONE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21920,7 +21920,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Green one side crimped wire'
+  AND i.code = '25CM-GREEN-ONE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21935,7 +21935,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '25cm Black one side crimped wire'
+  AND i.code = '25CM-BLACK-ONE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21965,7 +21965,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'R9M Antenna Extension wire RP-SMA to Open'
+  AND i.code = 'R9M-ANTENNA-EXTENSION'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21980,7 +21980,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Black 14/38 Wire'
+  AND i.code = 'BLACK-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -21995,7 +21995,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'White 14/38 Wire'
+  AND i.code = 'WHITE-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22010,7 +22010,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Sky Blue 14/38 Wire'
+  AND i.code = 'SKY-BLUE-1438'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22025,7 +22025,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Red 14/38 wire'
+  AND i.code = 'RED-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22040,7 +22040,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Yellow 14/38 Wire'
+  AND i.code = 'YELLOW-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22055,7 +22055,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Orange 14/38 Wire'
+  AND i.code = 'ORANGE-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22070,7 +22070,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Green 14/38 Wire'
+  AND i.code = 'GREEN-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22085,7 +22085,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Purple 14/38 Wire'
+  AND i.code = 'PURPLE-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22100,7 +22100,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Brown 14/38 Wire'
+  AND i.code = 'BROWN-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22130,7 +22130,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'IP Remote Lower Shell'
+  AND i.code = 'IP-REMOTE-LOWER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22145,7 +22145,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'IP Remote Upper Shell'
+  AND i.code = 'IP-REMOTE-UPPER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22160,7 +22160,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PU Gasket Remote Lower Shell'
+  AND i.code = 'PU-GASKET-REMOTE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22175,7 +22175,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22310,7 +22310,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Polycarbonate Glass for Remote'
+  AND i.code = 'POLYCARBONATE-GLASS-FOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22325,7 +22325,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Joystick Water proof rubber'
+  AND i.code = 'JOYSTICK-WATER-PROOF'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22340,7 +22340,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Button Silicon Cover No. 1'
+  AND i.code = 'BUTTON-SILICON-COVER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22400,7 +22400,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M2x12 Allen Head SS304'
+  AND i.code = 'M2X12-ALLEN-HEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22415,7 +22415,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '32Gb SD Card'
+  AND i.code = '32GB-SD-CARD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22462,7 +22462,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Charging Cable Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '5v 2A USB Adapter'
+  AND i.code = '5V-2A-USB'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22492,7 +22492,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'IP Remote Charging Cable Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Rotary Knob Box 3D print'
+  AND i.code = 'ROTARY-KNOB-BOX'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22584,7 +22584,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lipo Indicator Casings'
+  AND i.code = 'LIPO-INDICATOR-CASINGS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22614,7 +22614,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Momentary Switch JCB'
+  AND i.code = 'MOMENTARY-SWITCH-JCB'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22629,7 +22629,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Latching Power switch JCB'
+  AND i.code = 'LATCHING-POWER-SWITCH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22644,7 +22644,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PWB for JCB'
+  AND i.code = 'PWB-FOR-JCB'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22689,7 +22689,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22704,7 +22704,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '16pin IC base'
+  AND i.code = '16PIN-IC-BASE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22734,7 +22734,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'iMAx B3 Charger'
+  AND i.code = 'IMAX-B3-CHARGER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22749,7 +22749,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '8core Wire 14/38'
+  AND i.code = '8CORE-WIRE-1438'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22764,7 +22764,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'LP12 4 pin plug male clip lock CM'
+  AND i.code = 'LP12-4-PIN'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22794,7 +22794,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '9v Piezo Electric Buzzer'
+  AND i.code = '9V-PIEZO-ELECTRIC'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22809,7 +22809,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Female Bergstrip 40x1 2.54mm'
+  AND i.code = 'FEMALE-BERGSTRIP-40X1'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22824,7 +22824,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Male Bergstrip 40x1 2.54mm'
+  AND i.code = 'MALE-BERGSTRIP-40X1'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22839,7 +22839,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Conformal Coating'
+  AND i.code = 'CONFORMAL-COATING'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22869,7 +22869,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2 pin JST-XH housing'
+  AND i.code = '2-PIN-JSTXH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22914,7 +22914,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '10cm one sided JST crimped Black'
+  AND i.code = '10CM-ONE-SIDED'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22959,7 +22959,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Red 14/38 wire'
+  AND i.code = 'RED-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22974,7 +22974,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Black 14/38 Wire'
+  AND i.code = 'BLACK-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -22989,7 +22989,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Yellow 14/38 Wire'
+  AND i.code = 'YELLOW-1438-WIRE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23004,7 +23004,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '3S BMS'
+  AND i.code = '3S-BMS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23019,7 +23019,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '130x80x60 enclosure box'
+  AND i.code = '130X80X60-ENCLOSURE-BOX'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23034,7 +23034,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm male bullet connector'
+  AND i.code = '2MM-MALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23049,7 +23049,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2mm Female Bullet connector'
+  AND i.code = '2MM-FEMALE-BULLET'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23064,7 +23064,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'HeatShrink Tube 3:1'
+  AND i.code = 'HEATSHRINK-TUBE-31'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23079,7 +23079,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Elec Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23111,7 +23111,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'JCB Body cum mounting frame'
+  AND i.code = 'JCB-BODY-CUM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23126,7 +23126,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'flow sensor Clamp'
+  AND i.code = 'FLOW-SENSOR-CLAMP'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23171,7 +23171,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x12 Allen Head'
+  AND i.code = 'M4X12-ALLEN-HEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23186,7 +23186,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x16 Allen Head'
+  AND i.code = 'M4X16-ALLEN-HEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23231,7 +23231,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x12 plain washer'
+  AND i.code = 'M4X12-PLAIN-WASHER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23246,7 +23246,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Brass nozzle for water outlet from JCB'
+  AND i.code = 'BRASS-NOZZLE-FOR'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23261,7 +23261,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '8 mm OD pneaumatic pipe'
+  AND i.code = '8-MM-OD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23291,7 +23291,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '12mm OD pneumatic pipe'
+  AND i.code = '12MM-OD-PNEUMATIC'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23306,7 +23306,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'AMCA Mech Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Silicon Hose 3mm x 6mm'
+  AND i.code = 'SILICON-HOSE-3MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23338,7 +23338,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x20 Allen Head'
+  AND i.code = 'M4X20-ALLEN-HEAD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23368,7 +23368,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Teroson MS930'
+  AND i.code = 'TEROSON-MS930'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23383,7 +23383,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Rope 8mm'
+  AND i.code = 'ROPE-8MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23398,7 +23398,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Ferrole'
+  AND i.code = 'FERROLE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23413,7 +23413,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Hook Sticker STBD'
+  AND i.code = 'HOOK-STICKER-STBD'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23428,7 +23428,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Hook Stiker PORT'
+  AND i.code = 'HOOK-STIKER-PORT'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23443,7 +23443,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Hold here sticker STBD'
+  AND i.code = 'HOLD-HERE-STICKER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23473,7 +23473,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M4x12 plain washer'
+  AND i.code = 'M4X12-PLAIN-WASHER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23488,7 +23488,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '915MHz Antenna'
+  AND i.code = '915MHZ-ANTENNA'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23533,7 +23533,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Craft Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '8kg Hull'
+  AND i.code = '8KG-HULL'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23580,7 +23580,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Bottom Block Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Bottom Mesh (120mm x 100mm, 5"x4")'
+  AND i.code = 'BOTTOM-MESH-120MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23610,7 +23610,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Bottom Block Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'M3x8 CSK Phillips'
+  AND i.code = 'M3X8-CSK-PHILLIPS'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23657,7 +23657,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Aft Plate Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'STBD Aft Plate'
+  AND i.code = 'STBD-AFT-PLATE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23687,7 +23687,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Aft Plate Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'SS Cooling Water Outlet nozzle'
+  AND i.code = 'SS-COOLING-WATER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23702,7 +23702,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'STBD Aft Plate Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Greasing nozzle'
+  AND i.code = 'GREASING-NOZZLE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23749,7 +23749,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Aft Plate Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'PORT Aft Plate'
+  AND i.code = 'PORT-AFT-PLATE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23779,7 +23779,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Aft Plate Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'SS Cooling Water Outlet nozzle'
+  AND i.code = 'SS-COOLING-WATER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23794,7 +23794,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Aft Plate Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Greasing nozzle'
+  AND i.code = 'GREASING-NOZZLE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23809,7 +23809,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'PORT Aft Plate Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Air nozzle'
+  AND i.code = 'AIR-NOZZLE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23840,7 +23840,7 @@ SELECT
     NOW(), 
     NOW()
 FROM items 
-WHERE name = 'R9MX Adapter' AND type IN ('SUB_ASSEMBLY'::item_type, 'FINISHED_GOODS'::item_type)
+WHERE code = 'R9MX-ADAPTER' AND type IN ('SUB_ASSEMBLY'::item_type, 'FINISHED_GOODS'::item_type)
   AND NOT EXISTS (
       SELECT 1 FROM bom_headers bh2 
       WHERE bh2.item_id = items.id
@@ -23855,7 +23855,7 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'R9MX Adapter' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'R9MX-ADAPTER' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
   AND i.name = 'PWB of R9MX adapter'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
@@ -23870,7 +23870,7 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'R9MX Adapter' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'R9MX-ADAPTER' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
   AND i.name = 'Female Bergstrip 40x1 2.0mm'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
@@ -23885,7 +23885,7 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'R9MX Adapter' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'R9MX-ADAPTER' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
   AND i.name = 'Male Bergstrip 40x1 2.0mm'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
@@ -23900,8 +23900,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'R9MX Adapter' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Lead wire 22AWG'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'R9MX-ADAPTER' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = 'LEAD-WIRE-22AWG'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23915,7 +23915,7 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'R9MX Adapter' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'R9MX-ADAPTER' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
   AND i.name = 'LM1117 5.0v'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
@@ -23930,8 +23930,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'R9MX Adapter' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '10uF 10v Tantalum Capacitor Case A'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'R9MX-ADAPTER' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = '10UF-10V-TANTALUM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23947,7 +23947,7 @@ SELECT
     NOW(), 
     NOW()
 FROM items 
-WHERE name = 'Final Packing' AND type IN ('SUB_ASSEMBLY'::item_type, 'FINISHED_GOODS'::item_type)
+WHERE code = 'FINAL-PACKING' AND type IN ('SUB_ASSEMBLY'::item_type, 'FINISHED_GOODS'::item_type)
   AND NOT EXISTS (
       SELECT 1 FROM bom_headers bh2 
       WHERE bh2.item_id = items.id
@@ -23962,7 +23962,7 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
   AND i.name = '66 No. Box for chraging cable & Tool box'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
@@ -23977,8 +23977,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '22 No. Box for SR structure screws'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = '22-NO-BOX'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -23992,8 +23992,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '10mm Nut Driver with 15mm Depth'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = '10MM-NUT-DRIVER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -24007,7 +24007,7 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
   AND i.name = '4mm T-Handle'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
@@ -24022,8 +24022,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Greasing Pump'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = 'GREASING-PUMP'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -24037,8 +24037,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Grease'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = 'GREASE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -24052,8 +24052,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'EPE sheet 20mm 48"x72"'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = 'EPE-SHEET-20MM'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -24067,7 +24067,7 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
   AND i.name = 'HardBox FRP/HDPE/CARTON/EPE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
@@ -24082,8 +24082,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'User Manual'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = 'USER-MANUAL'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -24097,8 +24097,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Envelope for User Manual'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = 'ENVELOPE-FOR-USER'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -24112,7 +24112,7 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
   AND i.name = '2.5mm T handle'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
@@ -24127,8 +24127,8 @@ SELECT
     NOW()
 FROM bom_headers bh
 CROSS JOIN items i
-WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Final Packing' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'Oring AFT plate'
+WHERE bh.item_id = (SELECT id FROM items WHERE code = 'FINAL-PACKING' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
+  AND i.code = 'ORING-AFT-PLATE'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -24160,7 +24160,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Power Switch Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = 'IP68 Rotary main Switch'
+  AND i.code = 'IP68-ROTARY-MAIN'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -24190,7 +24190,7 @@ SELECT
 FROM bom_headers bh
 CROSS JOIN items i
 WHERE bh.item_id = (SELECT id FROM items WHERE name = 'Power Switch Assy' AND type = 'SUB_ASSEMBLY'::item_type LIMIT 1)
-  AND i.name = '2 pin JST-XH housing'
+  AND i.code = '2-PIN-JSTXH'
   AND NOT EXISTS (
       SELECT 1 FROM bom_items WHERE bom_id = bh.id AND item_id = i.id
   )
@@ -0,0 +1,421 @@
+"""
+Plan stock reservations for a batch of job orders at once (FEFO / FIFO)
+
+POST /inventory/reservations reserves one item in one warehouse per call and
+nothing decides which stock a job order should get. This planner takes every
+selected open job order (all of them, a --from/--to start-date window, or
+--jobs), works out what each still needs and hands out stock_entries lots:
+
+    needs       job_order_materials.required - issued per line, less what the
+                job order already holds in unreleased stock_reservations
+                (spread over its lines for the item, in order);
+                a job order without material lines is exploded through its
+                BOM (bom_explosion.py) for quantity - completed
+    order       job orders by priority (URGENT, HIGH, NORMAL, LOW), then due
+                date, start date and number; each takes all it can before
+                the next one
+    lots        per item and warehouse, a heap of lots with free stock
+                (available - allocated), earliest expiry first then oldest
+                (--rule fefo) or oldest first (--rule fifo); expired lots
+                and lots without a warehouse are skipped and the unreleased stock_reservations of the
+                item and warehouse are taken off the front. A line's own
+                warehouse is drained first, then whichever warehouse has
+                the best lot.
+
+Everything is read in a handful of queries and solved in memory. The plan
+(--plan) is one transaction for review: the allocations are loaded into a
+temp table, the lots they come from are locked and checked (it raises if any
+lot, or any item and warehouse less its unreleased reservations, no longer
+has the free stock planned, so a plan cannot be run twice), and one
+stock_reservations row per job order, item and warehouse is inserted, with
+increment_reserved_quantity() when the database has it. That is what POST
+/inventory/reservations does, and --json writes the same reservations as
+its bodies, so either way the API's release undoes a reservation entirely.
+The lots are picked but not marked (stock_entries.allocated_quantity is left
+alone, as the API's release would never lower it); the next run keeps off
+them through the reservations instead. Job orders without created_by (the
+reservation's reserved_by) are skipped.
+
+Usage:
+    python scripts/allocate_stock.py --dsn "$DATABASE_URL" [--tenant TENANT_ID]
+    python scripts/allocate_stock.py --dsn "$DATABASE_URL" --from 2025-06-02 --to 2025-06-08 --rule fifo
+    python scripts/allocate_stock.py --dsn "$DATABASE_URL" --jobs JO-2025-0141 JO-2025-0142 --json reservations.json
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bom_explosion import BomCycleError, BomGraph, bom_lines  # noqa: E402
+from erp_db import TENANT, column, fmt, quote  # noqa: E402
+from shortage_scan import OPEN_STATUSES, PRIORITIES  # noqa: E402
+
+PLAN = 'allocation-plan.sql'
+RULES = ('fefo', 'fifo')
+REFERENCE_TYPE = 'PRODUCTION_ORDER'
+INSERT_ROWS = 1000
+PLAN_QUOTE = '$allocate$'
+
+JOBS_SQL = f"""
+    SELECT jo.id::text, jo.job_order_number, jo.tenant_id::text, jo.created_by::text, jo.item_id::text,
+           jo.quantity - COALESCE(jo.completed_quantity, 0), jo.priority, jo.end_date
+    FROM production_job_orders jo
+    WHERE jo.status::text = ANY(%(statuses)s) AND {TENANT.format(alias='jo')}
+      AND (%(jobs)s::text[] IS NULL OR jo.job_order_number = ANY(%(jobs)s::text[]))
+      AND (%(start)s::date IS NULL OR jo.start_date >= %(start)s::date)
+      AND (%(end)s::date IS NULL OR jo.start_date < %(end)s::date + 1)
+    ORDER BY array_position(%(priorities)s, upper(jo.priority)), jo.end_date NULLS LAST, jo.start_date,
+             jo.job_order_number"""
+
+LOTS_SQL = f"""
+    SELECT se.id::text, se.item_id::text, se.warehouse_id::text, se.batch_number, se.expiry_date, se.created_at,
+           se.available_quantity - COALESCE(se.allocated_quantity, 0)
+    FROM stock_entries se
+    WHERE se.item_id = ANY(%(items)s::uuid[]) AND {TENANT.format(alias='se')}
+      AND se.available_quantity - COALESCE(se.allocated_quantity, 0) > 0"""
+
+
+# Plan guard: per item and warehouse, the free stock the planner saw (unexpired lots less unreleased
+# stock_reservations) must still cover what is planned; the plan's own reservations are not in yet
+RESERVED_GUARD = """
+    SELECT count(*) INTO n FROM (
+        SELECT p.item_id
+        FROM (SELECT tenant_id, item_id, warehouse_id, SUM(quantity) AS quantity
+              FROM planned_allocation GROUP BY tenant_id, item_id, warehouse_id) p
+        WHERE p.quantity > (SELECT COALESCE(SUM(se.available_quantity - COALESCE(se.allocated_quantity, 0)), 0)
+                            FROM stock_entries se
+                            WHERE se.tenant_id = p.tenant_id AND se.item_id = p.item_id
+                              AND se.warehouse_id = p.warehouse_id
+                              AND se.available_quantity - COALESCE(se.allocated_quantity, 0) > 0
+                              AND (se.expiry_date IS NULL OR se.expiry_date >= CURRENT_DATE))
+                         - (SELECT COALESCE(SUM(r.reserved_quantity), 0)
+                            FROM stock_reservations r
+                            WHERE r.tenant_id = p.tenant_id AND r.item_id = p.item_id
+                              AND r.warehouse_id = p.warehouse_id AND NOT COALESCE(r.released, false))
+    ) short;
+    IF n > 0 THEN
+        RAISE EXCEPTION '% item / warehouse pair(s) no longer have the free stock planned once unreleased reservations are counted (stock or reservations changed since the plan was made)', n;
+    END IF;"""
+
+
+class JobOrder:
+    __slots__ = ('id', 'number', 'tenant_id', 'user_id', 'product', 'quantity', 'priority', 'due', 'lines')
+
+    def __init__(self, id, number, tenant_id, user_id, product, quantity, priority, due):
+        self.id = id
+        self.number = number
+        self.tenant_id = tenant_id
+        self.user_id = user_id
+        self.product = product
+        self.quantity = Decimal(quantity or 0)
+        self.priority = priority
+        self.due = due.date() if isinstance(due, datetime) else due
+        self.lines: list[Line] = []
+
+
+class Line:
+    """What one job order still needs of one item (and the warehouse it asks for)"""
+
+    __slots__ = ('job', 'item_id', 'warehouse_id', 'need', 'allocations')
+
+    def __init__(self, job: JobOrder, item_id: str, warehouse_id: str | None, need: Decimal):
+        self.job = job
+        self.item_id = item_id
+        self.warehouse_id = warehouse_id
+        self.need = need
+        self.allocations: list[tuple[Lot, Decimal]] = []
+
+    @property
+    def short(self) -> Decimal:
+        return self.need - sum((qty for _, qty in self.allocations), Decimal(0))
+
+
+class Lot:
+    """One stock_entries row and the free stock left on it while planning"""
+
+    __slots__ = ('id', 'item_id', 'warehouse_id', 'batch', 'expiry', 'received', 'free')
+
+    def __init__(self, id, item_id, warehouse_id, batch, expiry, received, free):
+        self.id = id
+        self.item_id = item_id
+        self.warehouse_id = warehouse_id
+        self.batch = batch
+        self.expiry = expiry
+        self.received = received
+        self.free = Decimal(free)
+
+    def key(self, rule: str) -> tuple:
+        received = self.received or datetime.min
+        if rule == 'fifo':
+            return (received, self.id)
+        return (self.expiry or date.max, received, self.id)
+
+
+class Allocator:
+    """Per item, per warehouse heaps of lots; allocate() hands them out line by line"""
+
+    def __init__(self, lots, rule: str = 'fefo', today: date | None = None,
+                 reserved: dict[tuple[str, str], Decimal] | None = None):
+        self.rule = rule
+        self.expired = 0
+        self.unplaced = 0
+        self.heaps: dict[str, dict[str, list]] = defaultdict(dict)
+        today = today or date.today()
+        for lot in lots:
+            if lot.expiry is not None and lot.expiry < today:
+                self.expired += 1
+                continue
+            if lot.warehouse_id is None:
+                # stock_reservations.warehouse_id is NOT NULL: nothing to reserve it against
+                self.unplaced += 1
+                continue
+            self.heaps[lot.item_id].setdefault(lot.warehouse_id, []).append((lot.key(rule), lot))
+        for item_id, by_warehouse in self.heaps.items():
+            for warehouse_id, heap in by_warehouse.items():
+                heapq.heapify(heap)
+                self._take(heap, (reserved or {}).get((item_id, warehouse_id), Decimal(0)), [])
+
+    def _take(self, heap: list, need: Decimal, taken: list) -> Decimal:
+        while need > 0 and heap:
+            lot = heap[0][1]
+            qty = min(lot.free, need)
+            lot.free -= qty
+            need -= qty
+            taken.append((lot, qty))
+            if not lot.free:
+                heapq.heappop(heap)
+        return need
+
+    def allocate(self, line: Line) -> None:
+        by_warehouse = self.heaps.get(line.item_id)
+        if not by_warehouse:
+            return
+        need = line.need
+        if line.warehouse_id in by_warehouse:
+            need = self._take(by_warehouse[line.warehouse_id], need, line.allocations)
+        while need > 0:
+            heaps = [heap for heap in by_warehouse.values() if heap]
+            if not heaps:
+                break
+            best = min(heaps, key=lambda heap: heap[0][0])
+            qty = min(best[0][1].free, need)
+            self._take(best, qty, line.allocations)
+            need -= qty
+
+
+# =============================================================================
+# LOAD
+# =============================================================================
+
+def load(cur, tenant_id: str | None, jobs: list[str] | None, start: date | None, end: date | None,
+         log=print) -> tuple[list[JobOrder], list, dict, dict[str, str], bool, bool]:
+    """
+    Job orders with their open lines, lots of the items they need, what is
+    reserved per item and warehouse, item codes and database features
+    """
+    params = {'tenant': tenant_id, 'statuses': list(OPEN_STATUSES), 'priorities': list(PRIORITIES),
+              'jobs': jobs or None, 'start': start, 'end': end}
+    cur.execute(JOBS_SQL, params)
+    orders = []
+    for job in (JobOrder(*row) for row in cur.fetchall()):
+        if job.user_id is None:
+            # stock_reservations.reserved_by is NOT NULL
+            log(f"-- {job.number}: no created_by to reserve as, skipped")
+            continue
+        orders.append(job)
+    by_id = {job.id: job for job in orders}
+    ids = list(by_id)
+
+    cur.execute("SELECT to_regclass('stock_reservations') IS NOT NULL, "
+                "to_regproc('increment_reserved_quantity') IS NOT NULL")
+    reservations, increment = cur.fetchone()
+    held: dict[tuple[str, str], Decimal] = {}
+    if reservations and ids:
+        cur.execute("""SELECT reference_id::text, item_id::text, SUM(reserved_quantity) FROM stock_reservations
+                       WHERE reference_id = ANY(%s::uuid[]) AND NOT COALESCE(released, false)
+                       GROUP BY 1, 2""", (ids,))
+        held = {(job, item): qty for job, item, qty in cur}
+
+    variant = column(cur, 'job_order_materials', ('selected_variant_id',))
+    material = f"COALESCE(m.{variant}, m.item_id)" if variant else 'm.item_id'
+    cur.execute(f"""SELECT m.job_order_id::text, {material}::text, m.warehouse_id::text,
+                           GREATEST(m.required_quantity - COALESCE(m.issued_quantity, 0), 0)
+                    FROM job_order_materials m WHERE m.job_order_id = ANY(%s::uuid[])
+                    ORDER BY m.created_at, m.id""", (ids,))
+    listed = set()
+    for job_id, item_id, warehouse_id, need in cur:
+        listed.add(job_id)
+        by_id[job_id].lines.append(Line(by_id[job_id], item_id, warehouse_id, need))
+
+    unlisted = [job for job in orders if job.id not in listed and job.quantity > 0]
+    if unlisted:
+        graph = BomGraph()
+        for parent, component, quantity, scrap in bom_lines(cur, tenant_id):
+            graph.add(parent, component, float(quantity), float(scrap))
+        for job in unlisted:
+            if not graph.is_assembly(job.product):
+                log(f"-- {job.number}: no material lines and no active BOM, skipped")
+                continue
+            for item_id, per_unit in graph.rollup(job.product).items():
+                need = (Decimal(repr(per_unit)) * job.quantity).quantize(Decimal('0.01'))
+                job.lines.append(Line(job, item_id, None, need))
+
+    for job in orders:
+        for line in job.lines:
+            covered = min(held.get((job.id, line.item_id), Decimal(0)), line.need)
+            if covered > 0:
+                held[job.id, line.item_id] -= covered
+                line.need -= covered
+        job.lines = [line for line in job.lines if line.need > 0]
+
+    items = sorted({line.item_id for job in orders for line in job.lines})
+    cur.execute(LOTS_SQL, {'tenant': tenant_id, 'items': items})
+    lots = [Lot(*row) for row in cur.fetchall()]
+    reserved: dict[tuple[str, str], Decimal] = {}
+    if reservations and items:
+        cur.execute(f"""SELECT r.item_id::text, r.warehouse_id::text, SUM(r.reserved_quantity) FROM stock_reservations r
+                        WHERE r.item_id = ANY(%(items)s::uuid[]) AND NOT COALESCE(r.released, false)
+                          AND {TENANT.format(alias='r')}
+                        GROUP BY 1, 2""", {'tenant': tenant_id, 'items': items})
+        reserved = {(item, warehouse): qty for item, warehouse, qty in cur}
+    cur.execute("SELECT id::text, code FROM items WHERE id = ANY(%s::uuid[])", (items,))
+    codes = dict(cur.fetchall())
+    return orders, lots, reserved, codes, reservations, increment
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def reservations(orders: list[JobOrder]) -> list[dict]:
+    """POST /inventory/reservations bodies: one per job order, item and warehouse"""
+    totals: dict[tuple, Decimal] = defaultdict(Decimal)
+    for job in orders:
+        for line in job.lines:
+            for lot, qty in line.allocations:
+                totals[job, line.item_id, lot.warehouse_id] += qty
+    return [{'item_id': item_id, 'warehouse_id': warehouse_id, 'reserved_quantity': float(qty),
+             'reference_type': REFERENCE_TYPE, 'reference_id': job.id, 'reference_number': job.number}
+            for (job, item_id, warehouse_id), qty in totals.items()]
+
+
+def write_plan(path: str, orders: list[JobOrder], rule: str, reserve: bool, increment: bool) -> int:
+    """Allocation SQL for review; returns the number of lots it allocates from"""
+    rows = [(lot.id, job.id, job.number, job.tenant_id, job.user_id, line.item_id, lot.warehouse_id, qty)
+            for job in orders for line in job.lines for lot, qty in line.allocations]
+    lots = len({row[0] for row in rows})
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("-- Job-order stock allocation plan (scripts/allocate_stock.py)\n")
+        f.write(f"-- {rule.upper()}: {len(rows)} allocation(s) from {lots} stock lot(s) for "
+                f"{len({row[1] for row in rows})} job order(s); review before running.\n")
+        f.write("-- Raises if any lot, or any item and warehouse less its unreleased reservations, no longer\n"
+                "-- has the free stock planned for it (so running the plan twice fails). Reserves through\n"
+                "-- stock_reservations only, like POST /inventory/reservations, so the API's release undoes it.\n")
+        f.write("\nBEGIN;\n\nCREATE TEMP TABLE planned_allocation (\n"
+                "    entry_id uuid, job_order_id uuid, job_order_number text, tenant_id uuid, reserved_by uuid,\n"
+                "    item_id uuid, warehouse_id uuid, quantity numeric\n) ON COMMIT DROP;\n")
+        for start in range(0, len(rows), INSERT_ROWS):
+            values = ',\n'.join('    (' + ', '.join(quote(v) for v in row[:-1]) + f', {fmt(row[-1])})'
+                                for row in rows[start:start + INSERT_ROWS])
+            f.write(f"\nINSERT INTO planned_allocation VALUES\n{values};\n")
+        f.write(f"""
+DO {PLAN_QUOTE}
+DECLARE n integer;
+BEGIN
+    SELECT count(*) INTO n FROM (
+        SELECT se.id
+        FROM stock_entries se
+        JOIN (SELECT entry_id, SUM(quantity) AS quantity FROM planned_allocation GROUP BY entry_id) p
+          ON p.entry_id = se.id
+        WHERE se.available_quantity - COALESCE(se.allocated_quantity, 0) >= p.quantity
+        FOR UPDATE OF se
+    ) still_free;
+    IF n <> {lots} THEN
+        RAISE EXCEPTION 'planned {lots} stock lot(s), % still have the free stock (stock changed since the plan was made)', n;
+    END IF;{RESERVED_GUARD if reserve else ''}
+END {PLAN_QUOTE};
+""")
+        if reserve:
+            f.write(f"""
+INSERT INTO stock_reservations (tenant_id, item_id, warehouse_id, reserved_quantity, reference_type, reference_id,
+                                reference_number, reserved_by)
+SELECT tenant_id, item_id, warehouse_id, SUM(quantity), '{REFERENCE_TYPE}', job_order_id, job_order_number, reserved_by
+FROM planned_allocation
+GROUP BY tenant_id, item_id, warehouse_id, job_order_id, job_order_number, reserved_by;
+""")
+        if increment:
+            f.write("""
+SELECT increment_reserved_quantity(p_tenant_id => tenant_id, p_item_id => item_id, p_warehouse_id => warehouse_id,
+                                   p_quantity => SUM(quantity))
+FROM planned_allocation
+GROUP BY tenant_id, item_id, warehouse_id;
+""")
+        f.write("\nCOMMIT;\n")
+    return lots
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True, help='Postgres database to plan against')
+    parser.add_argument('--tenant', help='Tenant id to plan for (default: all rows)')
+    parser.add_argument('--jobs', nargs='+', metavar='NUMBER', help='Only these job order numbers')
+    parser.add_argument('--from', dest='start', type=date.fromisoformat, help='Job orders starting on or after this date')
+    parser.add_argument('--to', dest='end', type=date.fromisoformat, help='Job orders starting on or before this date')
+    parser.add_argument('--rule', choices=RULES, default='fefo', help='Earliest expiry first, or oldest stock first')
+    parser.add_argument('--plan', default=PLAN, help=f'Allocation SQL to write (default {PLAN})')
+    parser.add_argument('--json', metavar='PATH', help='Also write the reservations as POST /inventory/reservations bodies')
+    parser.add_argument('--limit', type=int, default=20, help='Job orders listed as short (0 = all)')
+    args = parser.parse_args()
+
+    import psycopg2
+
+    start = time.perf_counter()
+    with psycopg2.connect(args.dsn) as conn, conn.cursor() as cur:
+        try:
+            orders, lots, reserved, codes, reserve, increment = load(cur, args.tenant, args.jobs, args.start, args.end)
+        except BomCycleError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    allocator = Allocator(lots, args.rule, reserved=reserved)
+    for job in orders:
+        for line in job.lines:
+            allocator.allocate(line)
+    solved = time.perf_counter() - start
+
+    lines = [line for job in orders for line in job.lines]
+    planned = write_plan(args.plan, orders, args.rule, reserve, increment)
+    bodies = reservations(orders)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(bodies, f, indent=2)
+
+    short = [job for job in orders if any(line.short > 0 for line in job.lines)]
+    print(f"{len(orders)} job order(s), {len(lines)} open line(s), {len(lots)} lot(s) with free stock "
+          f"({allocator.expired} expired, {allocator.unplaced} without a warehouse, skipped): loaded in {loaded:.2f}s, "
+          f"allocated ({args.rule.upper()}) in {solved * 1000:.1f} ms")
+    print(f"  {len(bodies)} reservation(s) from {planned} lot(s) -> {args.plan}"
+          + ('' if reserve else ' (no stock_reservations table: the plan only checks the lots)'))
+    print(f"  {len(orders) - len(short)} job order(s) fully covered, {len(short)} short")
+    for job in short if args.limit <= 0 else short[:args.limit]:
+        missing = [line for line in job.lines if line.short > 0]
+        worst = ', '.join(f"{codes.get(line.item_id, line.item_id)} {fmt(line.short)}" for line in missing[:3])
+        print(f"    {job.number:<20} {job.priority or '':<7} due {str(job.due or '-'):<10}  {len(missing)} line(s) "
+              f"short: {worst}{', ...' if len(missing) > 3 else ''}")
+    if args.limit > 0 and len(short) > args.limit:
+        print(f"    ... {len(short) - args.limit} more (--limit 0 for all)")
+    return 1 if short else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
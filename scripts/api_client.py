@@ -0,0 +1,114 @@
+"""
+Keep-alive JSON client for the ERP API, shared by the scripts in this folder
+"""
+
+import base64
+import http.client
+import json
+import os
+import threading
+import urllib.parse
+from typing import Any
+
+BASE = os.environ.get("API_BASE", "http://127.0.0.1:4000/api/v1")
+
+# Retried once on a fresh connection: the server closed an idle keep-alive socket
+STALE_CONNECTION = (http.client.RemoteDisconnected, http.client.CannotSendRequest, BrokenPipeError,
+                    ConnectionResetError)
+
+
+class ApiClient:
+    """GET-only JSON client with one keep-alive connection per thread; close() closes them all"""
+
+    def __init__(self, base: str = BASE, token: str | None = None, timeout: float = 30.0):
+        url = urllib.parse.urlsplit(base)
+        self.https = url.scheme == "https"
+        self.netloc = url.netloc
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[http.client.HTTPConnection] = []
+
+    def _connection(self, fresh: bool = False) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or fresh:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            new = self._local.conn = cls(self.netloc, timeout=self.timeout)
+            with self._lock:
+                if conn is not None:
+                    conn.close()
+                    self._connections.remove(conn)
+                self._connections.append(new)
+            conn = new
+        return conn
+
+    def get(self, path: str, params: dict[str, str] | None = None,
+            headers: dict[str, str] | None = None) -> tuple[int | None, dict[str, str], str]:
+        """(status, response headers, body text); status None and the error text on connection failure"""
+        url = f"{self.prefix}{path}"
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        for attempt in range(2):
+            conn = self._connection(fresh=attempt > 0)
+            try:
+                conn.request("GET", url, headers={**self.headers, **(headers or {})})
+                r = conn.getresponse()
+                raw = r.read().decode("utf-8", errors="replace")
+                return r.status, {k.lower(): v for k, v in r.getheaders()}, raw
+            except STALE_CONNECTION as e:
+                if attempt:
+                    return None, {}, repr(e)
+            except Exception as e:
+                self._connection(fresh=True)
+                return None, {}, repr(e)
+        return None, {}, "unreachable"
+
+    def fetch_json(self, path: str, params: dict[str, str] | None = None) -> tuple[int | None, Any, str]:
+        status, _, raw = self.get(path, params)
+        if status != 200:
+            return status, None, raw
+        try:
+            return status, json.loads(raw), raw
+        except ValueError as e:
+            return status, None, f"{e!r}: {raw[:200]}"
+
+    def close(self) -> None:
+        """Close every thread's connection (the pool workers' included)"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+def unwrap(body: Any) -> list[dict]:
+    if isinstance(body, list):
+        return [x for x in body if isinstance(x, dict)]
+    if isinstance(body, dict):
+        maybe = body.get("data") or body.get("items") or []
+        if isinstance(maybe, list):
+            return [x for x in maybe if isinstance(x, dict)]
+    return []
+
+
+def to_float(value: Any) -> float:
+    try:
+        if value is None:
+            return 0.0
+        return float(value)
+    except Exception:
+        return 0.0
+
+
+def token_tenant(token: str | None) -> str | None:
+    """tenantId claim of a JWT (read without verifying; only used as a cache key)"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return str(claims["tenantId"])
+    except Exception:
+        return None
@@ -0,0 +1,261 @@
+"""
+Register UIDs in bulk for stock that has none (one UID per whole unit)
+
+generate-uids-for-existing-stock-v2.sql walks stock_entries in PL/pgSQL and,
+for every unit, counts uid_registry to pick the next number before inserting
+one row - quadratic in units, and numbered apart from the uid_sequence_*
+sequences generate_next_uid() draws from, so the next GRN can collide with a
+backfilled UID. This does the same backfill in bulk:
+
+    pending     stock entries with available_quantity >= 1, less the UIDs
+                already registered for them (metadata stock_entry_id), read
+                in one query joined to items, warehouses, grns and job orders
+    reserve     each uid_sequence_* is first moved past the highest number in
+                uid_registry for its type, then one statement takes every
+                block: SELECT array(SELECT nextval(...) FROM generate_series(1, n))
+                per entity type
+    format      UID-{tenant}-{plant}-{type}-{seq:06d}-{seq % 97:02d}, as
+                generate_next_uid() builds it, done here
+    load        COPY uid_registry FROM STDIN (csv), same transaction
+
+Numbers come from the sequences the API uses, so they never collide with UIDs
+issued while the backfill runs (blocks are contiguous only when nothing else
+draws at the same time). A transaction-scoped advisory lock keeps two
+backfills from registering the same units, and a failed load rolls back and
+leaves a gap in the sequences, not duplicates. The entity type follows the
+item category, else its type: FINISHED -> FG, ASSEMBLY -> SA, COMPONENT -> CP,
+anything else RM. Rows match the v2 script: status ACTIVE, a RECEIVED
+lifecycle entry at the stock entry's created_at, metadata with the item and
+stock entry and created_retroactively.
+
+Usage:
+    python scripts/backfill_uids.py --dsn "$DATABASE_URL" [--tenant TENANT_ID] --dry-run
+    python scripts/backfill_uids.py --dsn "$DATABASE_URL" --tenant-code SAIF --plant-code MFG
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from erp_db import TENANT, column  # noqa: E402
+from excel_import import copy_field, spool  # noqa: E402
+
+TENANT_CODE = 'SAIF'
+PLANT_CODE = 'MFG'
+SEQUENCES = {'RM': 'uid_sequence_rm', 'CP': 'uid_sequence_cp', 'FG': 'uid_sequence_fg', 'SA': 'uid_sequence_sa'}
+LOCK = 'backfill_uids'
+
+PENDING_SQL = """
+    SELECT se.id::text, se.tenant_id::text, se.item_id::text, i.code, i.name, {kind}, w.name, se.batch_number,
+           se.created_at, {grn}, {job},
+           FLOOR(se.available_quantity)::int - COALESCE(u.registered, 0)
+    FROM stock_entries se
+    JOIN items i ON i.id = se.item_id
+    LEFT JOIN warehouses w ON w.id = se.warehouse_id
+    LEFT JOIN (
+        SELECT metadata->>'stock_entry_id' AS stock_entry_id, COUNT(*) AS registered
+        FROM uid_registry
+        WHERE metadata ? 'stock_entry_id'
+        GROUP BY 1
+    ) u ON u.stock_entry_id = se.id::text
+    {joins}
+    WHERE se.available_quantity >= 1 AND {tenant}
+      AND FLOOR(se.available_quantity)::int > COALESCE(u.registered, 0)
+    ORDER BY se.created_at, se.id"""
+
+GRN_JOIN = """
+    LEFT JOIN LATERAL (
+        SELECT id FROM grns WHERE grn_number = se.metadata->>'grn_reference' LIMIT 1
+    ) g ON true"""
+
+JOB_JOIN = """
+    LEFT JOIN production_job_orders jo ON jo.id::text = se.metadata->>'job_order_id'"""
+
+# Highest sequence number already registered per type; other UID formats are ignored
+HIGHEST_SQL = """
+    SELECT entity_type, MAX(split_part(uid, '-', 5)::bigint)
+    FROM uid_registry
+    WHERE uid ~ '^UID-[^-]+-[^-]+-[A-Z]+-[0-9]+-[0-9]+$'
+    GROUP BY entity_type"""
+
+COLUMNS = ('tenant_id', 'uid', 'entity_type', 'entity_id', 'grn_id', 'batch_number', 'location', 'status',
+           'lifecycle', 'metadata', 'created_at')
+
+
+def entity_type(kind: str | None) -> str:
+    """UID entity type for an item category (or item type), as the v2 backfill decides it"""
+    kind = (kind or '').upper()
+    if 'FINISHED' in kind:
+        return 'FG'
+    if 'ASSEMBLY' in kind:
+        return 'SA'
+    if 'COMPONENT' in kind:
+        return 'CP'
+    return 'RM'
+
+
+def format_uid(tenant_code: str, plant_code: str, entity: str, sequence: int) -> str:
+    return f"UID-{tenant_code}-{plant_code}-{entity}-{sequence:06d}-{sequence % 97:02d}"
+
+
+def ranges(numbers: list[int]) -> str:
+    """Compact '1-500, 503-610' form of sorted sequence numbers"""
+    spans = []
+    for n in numbers:
+        if spans and n == spans[-1][1] + 1:
+            spans[-1][1] = n
+        else:
+            spans.append([n, n])
+    return ', '.join(str(a) if a == b else f"{a}-{b}" for a, b in spans)
+
+
+# =============================================================================
+# DATABASE
+# =============================================================================
+
+def pending(cur, tenant_id: str | None) -> list[tuple]:
+    """Stock entries still short of UIDs, with the item, warehouse, GRN and job order"""
+    cur.execute("SELECT to_regclass('grns') IS NOT NULL, to_regclass('production_job_orders') IS NOT NULL")
+    grns, jobs = cur.fetchone()
+    kind = 'COALESCE(i.category, i.type::text)' if column(cur, 'items', ('category',)) else 'i.type::text'
+    joins = (GRN_JOIN if grns else '') + (JOB_JOIN if jobs else '')
+    sql = PENDING_SQL.format(kind=kind, joins=joins, tenant=TENANT.format(alias='se'),
+                             grn=f"{'g.id::text' if grns else 'NULL'}, se.metadata->>'grn_reference'",
+                             job="jo.id::text, jo.job_order_number" if jobs else 'NULL, NULL')
+    cur.execute(sql, {'tenant': tenant_id})
+    return cur.fetchall()
+
+
+def sequence_last(cur) -> dict[str, int]:
+    """Last number each uid_sequence_* handed out"""
+    cur.execute("SELECT " + ", ".join(
+        f"(SELECT CASE WHEN is_called THEN last_value ELSE last_value - 1 END FROM {seq})"
+        for seq in SEQUENCES.values()))
+    return dict(zip(SEQUENCES, cur.fetchone()))
+
+
+def issued(cur) -> dict[str, int]:
+    """sequence_last(), raised to the highest number in uid_registry for each type"""
+    last = sequence_last(cur)
+    cur.execute(HIGHEST_SQL)
+    for entity, highest in cur.fetchall():
+        entity = entity if entity in SEQUENCES else 'RM'
+        last[entity] = max(last[entity], highest)
+    return last
+
+
+def sync_sequences(cur, log=print):
+    """setval() any sequence that is behind uid_registry (UIDs written before the sequences existed)"""
+    last = sequence_last(cur)
+    for entity, highest in issued(cur).items():
+        if highest > last[entity]:
+            cur.execute("SELECT setval(%s, %s)", (SEQUENCES[entity], highest))
+            log(f"   {SEQUENCES[entity]} moved from {last[entity]} to {highest}")
+
+
+def reserve(cur, counts: dict[str, int]) -> dict[str, list[int]]:
+    """Take counts[type] numbers from each sequence in a single statement"""
+    types = [entity for entity in SEQUENCES if counts.get(entity)]
+    if not types:
+        return {}
+    cur.execute("SELECT " + ", ".join(
+        f"array(SELECT nextval('{SEQUENCES[entity]}') FROM generate_series(1, %s))" for entity in types),
+        [counts[entity] for entity in types])
+    return {entity: sorted(numbers) for entity, numbers in zip(types, cur.fetchone())}
+
+
+def registry_rows(entries, reserved: dict[str, list[int]], tenant_code: str, plant_code: str):
+    """uid_registry rows (COLUMNS, then job_order_id) for every missing unit"""
+    taken = Counter()
+    for (entry_id, tenant_id, item_id, code, name, kind, warehouse, batch, created, grn_id, grn_number,
+         job_id, job_number, missing) in entries:
+        entity = entity_type(kind)
+        location = warehouse or 'Warehouse'
+        reference = f"GRN {grn_number}" if grn_number else f"JO {job_number}" if job_number else 'EXISTING_STOCK'
+        lifecycle = json.dumps([{'stage': 'RECEIVED', 'timestamp': created.isoformat(), 'location': location,
+                                 'reference': reference, 'user': 'SYSTEM'}])
+        metadata = json.dumps({'item_code': code, 'item_name': name, 'stock_entry_id': entry_id,
+                               'created_retroactively': True, 'grn_reference': grn_number,
+                               'job_order_reference': job_number})
+        numbers = reserved[entity][taken[entity]:taken[entity] + missing]
+        taken[entity] += missing
+        for sequence in numbers:
+            yield (tenant_id, format_uid(tenant_code, plant_code, entity, sequence), entity, item_id, grn_id,
+                   batch, location, 'ACTIVE', lifecycle, metadata, created.isoformat(), job_id)
+
+
+def load(cur, rows, job_column: bool) -> int:
+    """COPY rows into uid_registry; returns how many"""
+    columns = COLUMNS + (('job_order_id',) if job_column else ())
+    n = 0
+    with spool() as f:
+        for n, row in enumerate(rows, start=1):
+            f.write(','.join(copy_field(v) for v in row[:len(columns)]) + '\n')
+        f.seek(0)
+        cur.copy_expert(f"COPY uid_registry ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", f)
+    return n
+
+
+def backfill(dsn: str, tenant_id: str | None = None, tenant_code: str = TENANT_CODE, plant_code: str = PLANT_CODE,
+             dry_run: bool = False, log=print) -> Counter:
+    """Register the missing UIDs; returns how many per entity type"""
+    import psycopg2
+
+    with psycopg2.connect(dsn) as conn, conn.cursor() as cur:
+        cur.execute("SELECT " + " AND ".join(f"to_regclass('{seq}') IS NOT NULL" for seq in SEQUENCES.values()))
+        if not cur.fetchone()[0]:
+            raise SystemExit("uid_sequence_* sequences missing: run fix-uid-generation-race-condition.sql first")
+        cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (LOCK,))
+
+        start = time.perf_counter()
+        entries = pending(cur, tenant_id)
+        counts = Counter()
+        for entry in entries:
+            counts[entity_type(entry[5])] += entry[-1]
+        log(f"   {len(entries)} stock entries short of {sum(counts.values())} UIDs  "
+            f"{time.perf_counter() - start:.2f}s")
+        if not counts:
+            return counts
+        if dry_run:
+            last = issued(cur)
+            for entity, n in sorted(counts.items()):
+                log(f"   {entity}  {n:>9} UIDs from {format_uid(tenant_code, plant_code, entity, last[entity] + 1)}")
+            conn.rollback()
+            return counts
+
+        start = time.perf_counter()
+        sync_sequences(cur, log)
+        reserved = reserve(cur, counts)
+        for entity, numbers in reserved.items():
+            log(f"   {entity}  {len(numbers):>9} reserved  {ranges(numbers)}")
+        log(f"   reserved in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        job_column = column(cur, 'uid_registry', ('job_order_id',)) is not None
+        n = load(cur, registry_rows(entries, reserved, tenant_code, plant_code), job_column)
+        log(f"   {n} rows copied into uid_registry  {time.perf_counter() - start:.2f}s")
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True, help='Postgres database to backfill')
+    parser.add_argument('--tenant', help='Tenant id to backfill (default: all rows)')
+    parser.add_argument('--tenant-code', default=TENANT_CODE, help=f'Tenant code in the UID (default {TENANT_CODE})')
+    parser.add_argument('--plant-code', default=PLANT_CODE, help=f'Plant code in the UID (default {PLANT_CODE})')
+    parser.add_argument('--dry-run', action='store_true', help='Count the missing UIDs without reserving any')
+    args = parser.parse_args()
+
+    counts = backfill(args.dsn, args.tenant, args.tenant_code, args.plant_code, args.dry_run)
+    summary = ', '.join(f"{entity} {n}" for entity, n in sorted(counts.items())) or 'nothing to do'
+    print(f"{'🔍 would register' if args.dry_run else '✅ registered'} {sum(counts.values())} UIDs ({summary})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,357 @@
+"""
+Synthetic-scale benchmark for the Excel import pipeline.
+
+Writes workbooks with the layout of Stock List 2024-2025.xlsx (RM,
+CombineSFG, S-BOM and A-BOM with the same title and header rows) at the
+given item counts, with multi-vendor SUPPLIER strings ("Robu / Vyom",
+"Synergy, Cable Fort") and sub-assemblies nested several levels deep. Then
+it runs each pipeline stage in its own process and records wall time, peak
+RSS and output size:
+
+    generate            write the synthetic workbook
+    parse:stream        openpyxl row iteration of the importer sheets
+    parse:vectorized    pd.read_excel of the importer sheets
+    records:stream      parse + clean + code stages (StreamSource)
+    records:vectorized  parse + clean + code stages (FrameSource)
+    explode             multi-level BOM rollup of every final assembly
+    sql:v1              generate-import-sql.py (deprecated, legacy schema)
+    sql:v2              generate-import-sql-v2.py (statements, stream engine)
+    sql:v2-bulk         generate-import-sql-v2.py --mode=bulk
+    sql:v2-vectorized   generate-import-sql-v2.py --engine=vectorized
+
+Results are appended to bench-results.jsonl with the git commit, and each
+stage is compared with the latest run of another commit on the same machine.
+Slowdowns (or RSS growth) past --threshold, and above a small absolute floor,
+are reported as regressions.
+
+Usage:
+    python scripts/bench_import.py                          # 1k, 10k, 100k items
+    python scripts/bench_import.py --sizes 1000 --stages sql:v2 sql:v2-bulk
+    python scripts/bench_import.py --sizes 10000 --fail-on-regression
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(ROOT, 'bench-results.jsonl')
+SIZES = (1000, 10000, 100000)
+
+SFG_HEADER = ['SL', 'SEMI FINISHED GOODS', 'PART NUMBER', 'UoM', 'RAW MATERIAL', 'PART NUMBER', 'UoM', 'COMBINE']
+SBOM_HEADER = ['SL NO', 'SUB ASSEMBLY NAME', 'RAW MATERIAL NAME', 'UNITS', 'UoM', 'RM USED', 'RM AVAILABLE', 'HOW MANY']
+ABOM_HEADER = ['SL', 'FINAL ASSEMBLY NAME', 'SUB ASSEMBLY / PART NAME', 'QUANTITY', 'UoM', 'NOTES']
+
+MATERIALS = ['Stainless Steel', 'Aluminium', 'Brass', 'Nylon', 'PVC', 'Copper', 'Carbon Fibre', 'ABS', 'Silicone',
+             'Neoprene', 'Mild Steel', 'Polycarbonate']
+PARTS = ['Hex Bolt', 'Washer', 'Bracket', 'Hinge', 'Cable', 'Connector', 'Bearing', 'Gasket', 'Clamp', 'Spacer',
+         'Sleeve', 'Propeller', 'Shaft', 'Coupling', 'Bushing', 'Relay', 'Fuse Holder', 'Heat Shrink', 'Lug',
+         'Bullet connector', 'Receiver Module', 'Battery Pack']
+SPECS = ['M3x10', 'M4x16', 'M5x20', 'M6x25', 'M8x40', '12V', '24V', '5A', '30A', '4mm', '6mm', '10mm', '500mm',
+         '1m', 'R9MM', '2200mAh', '10AWG', '16AWG']
+ASSEMBLIES = ['Jet Motor', 'Power Switch', 'Battery', 'Hull', 'Control Box', 'Antenna Mast', 'Thruster', 'Rudder',
+              'Charging Port', 'Lighting', 'Pump', 'Frame', 'Harness', 'Sensor Pod']
+VENDOR_WORDS = ['Robu', 'Vyom', 'Synergy', 'Cable Fort', 'Amazon', 'Mouser', 'Element14', 'Sharma Traders',
+                'Apex Fasteners', 'Bharat Metals', 'Kumar Electricals', 'Deccan Polymers', 'Precision Tools',
+                'Star Hardware', 'Sai Engineering', 'Omkar Industries']
+UOMS = ['Number', 'Number', 'Number', 'Meter', 'Kg', 'Set', 'Litre', 'PCS']
+
+STAGES = ('generate', 'parse:stream', 'parse:vectorized', 'records:stream', 'records:vectorized', 'explode',
+          'sql:v1', 'sql:v2', 'sql:v2-bulk', 'sql:v2-vectorized')
+
+# Script stages: command line after the interpreter (workbook and output are appended)
+SCRIPTS = {
+    'sql:v1': ['generate-import-sql.py'],
+    'sql:v2': ['generate-import-sql-v2.py'],
+    'sql:v2-bulk': ['generate-import-sql-v2.py', '--mode=bulk'],
+    'sql:v2-vectorized': ['generate-import-sql-v2.py', '--engine=vectorized'],
+}
+
+
+# =============================================================================
+# SYNTHETIC WORKBOOK
+# =============================================================================
+
+def vendor_names(rng, count):
+    names = list(VENDOR_WORDS)
+    while len(names) < count:
+        names.append(f"{rng.choice(VENDOR_WORDS)} {rng.choice(['Enterprises', 'Traders', 'Pvt Ltd', 'Supplies'])} {len(names)}")
+    return names[:count]
+
+
+def supplier_string(rng, vendors):
+    """Empty, one vendor, or several joined the ways the real sheet does"""
+    roll = rng.random()
+    if roll < 0.08:
+        return None
+    picks = rng.sample(vendors, 1 if roll < 0.6 else rng.choice((2, 2, 3)))
+    return rng.choice((' / ', '/', ', ', ' , ')).join(picks)
+
+
+def item_name(rng, n):
+    return f"{rng.choice(MATERIALS)} {rng.choice(PARTS)} {rng.choice(SPECS)} {n}"
+
+
+def plan(items, seed=0, depth=5):
+    """Item names per sheet and BOM edges for a catalogue of `items` items"""
+    rng = random.Random(seed)
+    n_fg = max(1, items // 200)
+    n_sfg = max(depth, items // 8)
+    n_rm = max(1, items - n_sfg - n_fg)
+
+    rm = [item_name(rng, i) for i in range(n_rm)]
+    # Sub-assemblies by level: level 0 uses raw materials only, level k also uses levels below it
+    levels = [[] for _ in range(depth)]
+    for i in range(n_sfg):
+        levels[i % depth].append(f"{rng.choice(ASSEMBLIES)} Assy {i}")
+    s_bom = []
+    for level, names in enumerate(levels):
+        lower = [name for below in levels[:level] for name in below]
+        for name in names:
+            for _ in range(rng.randint(3, 12)):
+                component = rng.choice(lower) if lower and rng.random() < 0.25 else rng.choice(rm)
+                s_bom.append((name, component, float(rng.choice((1, 1, 1, 2, 2, 4, 0.5, 10)))))
+    top = levels[-1] + levels[-2] if depth > 1 else levels[-1]
+    fg = [f"Saif Seas Life - {rng.choice(['DSR', 'MK2', 'Pro', 'Lite'])} {i}" for i in range(n_fg)]
+    a_bom = [(name, component, float(rng.randint(1, 4)))
+             for name in fg for component in rng.sample(top, min(len(top), rng.randint(4, 10)))]
+    return rng, rm, [name for names in levels for name in names], s_bom, fg, a_bom
+
+
+def write_workbook(path, items, seed=0):
+    """Synthetic workbook with the real sheet layout; returns rows written per sheet"""
+    from openpyxl import Workbook
+
+    from excel_import import FG_HEADER, RM_HEADER
+
+    rng, rm, sfg, s_bom, fg, a_bom = plan(items, seed)
+    vendors = vendor_names(rng, max(8, items // 25))
+    wb = Workbook(write_only=True)
+
+    ws = wb.create_sheet('RM')
+    ws.append([None, 'RAW MATERIALS', None, None, 'Desired Production: ->', 30.0])
+    ws.append(RM_HEADER)
+    for i, name in enumerate(rm, start=1):
+        stock = rng.choice((0, 0.0, rng.randint(1, 500), float(rng.randint(1, 50)), None))
+        cost = rng.choice((round(rng.uniform(1, 15000), 2), rng.randint(5, 900), '#N/A', None))
+        ws.append([i, name, stock, rng.randint(-20, 60), None, rng.choice((None, f"SAS-{i:05d}")),
+                   rng.choice(UOMS), cost, supplier_string(rng, vendors), float(rng.randint(0, 4)), 30,
+                   float(rng.randint(0, 200)), stock])
+
+    ws = wb.create_sheet('CombineSFG')
+    ws.append(SFG_HEADER)
+    for name in sfg:
+        ws.append([None, name, None, 'Number', None, None, None])
+
+    ws = wb.create_sheet('S-BOM')
+    ws.append([9.0, 'SUB-ASSEMBLY BILL OF MATERIAL SHEET'])
+    ws.append(SBOM_HEADER)
+    for i, (assembly, component, qty) in enumerate(s_bom, start=1):
+        ws.append([i, assembly, component, qty, 0, 0, None, 0])
+
+    ws = wb.create_sheet('A-BOM')
+    ws.append([None, 'FINAL ASSEMBLY BILL OF MATERIAL SHEET'])
+    ws.append(ABOM_HEADER)
+    for i, (assembly, component, qty) in enumerate(a_bom, start=1):
+        ws.append([i, assembly, component, qty, '#N/A', None])
+
+    ws = wb.create_sheet('FG')
+    ws.append([None, 'FINISHED GOODS NAME SHEET'])
+    ws.append(FG_HEADER)
+    for i, name in enumerate(fg, start=1):
+        ws.append([i, name, None, 'Number', None])
+
+    wb.save(path)
+    return {'RM': len(rm), 'CombineSFG': len(sfg), 'S-BOM': len(s_bom), 'A-BOM': len(a_bom), 'FG': len(fg)}
+
+
+# =============================================================================
+# STAGES (each runs in a fresh process: python bench_import.py --run STAGE ...)
+# =============================================================================
+
+def run_stage(stage, workbook, items):
+    """Run one in-process stage; returns {'rows': ..., 'output_bytes': ...}"""
+    if stage == 'generate':
+        rows = write_workbook(workbook, items)
+        return {'rows': sum(rows.values()), 'output_bytes': os.path.getsize(workbook)}
+
+    if stage == 'parse:stream':
+        from excel_import import iter_sheet, open_workbook
+        book = open_workbook(workbook)
+        rows = sum(1 for sheet in ('RM', 'CombineSFG', 'S-BOM') for _ in iter_sheet(book, sheet))
+        return {'rows': rows}
+
+    if stage == 'parse:vectorized':
+        from excel_vectorized import read_sheets
+        return {'rows': sum(len(df) for df in read_sheets(workbook).values())}
+
+    if stage.startswith('records:'):
+        from excel_import import open_source
+        source = open_source(workbook, stage.split(':')[1])
+        vendor_map = source.vendor_codes(source.vendor_names())
+        rows = len(vendor_map)
+        for records in (source.rm_records(), source.sfg_records(), source.bom_records()):
+            rows += sum(1 for _ in records)
+        return {'rows': rows}
+
+    if stage == 'explode':
+        from bom_explosion import from_workbook
+        graph = from_workbook(workbook)
+        roots = graph.roots()
+        leaves = graph.explode({node: 1.0 for node in roots})
+        return {'rows': len(leaves), 'assemblies': graph.computed}
+
+    raise ValueError(f"unknown stage {stage!r}")
+
+
+def measure(stage, workbook, items, tmpdir):
+    """Run a stage in a child process; wall time, peak RSS (MB) and output size"""
+    output = os.path.join(tmpdir, stage.replace(':', '-') + '.sql')
+    if stage in SCRIPTS:
+        script, *options = SCRIPTS[stage]
+        cmd = [sys.executable, os.path.join(ROOT, script), *options, '--workbook', workbook, '--output', output]
+    else:
+        cmd = [sys.executable, os.path.abspath(__file__), '--run', stage, '--workbook', workbook,
+               '--items', str(items)]
+
+    with tempfile.TemporaryFile('w+') as out:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=tmpdir, stdout=out, stderr=subprocess.STDOUT, text=True)
+        peak = None
+        if hasattr(os, 'wait4'):
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is KiB on Linux, bytes on macOS
+            peak = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+        else:
+            proc.wait()
+        seconds = time.perf_counter() - start
+        out.seek(0)
+        log = out.read()
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"{stage} failed ({proc.returncode}):\n{log[-2000:]}")
+    result = {'seconds': round(seconds, 3), 'peak_rss_mb': round(peak, 1) if peak is not None else None}
+    if stage in SCRIPTS:
+        result['output_bytes'] = os.path.getsize(output)
+    else:
+        result.update(json.loads(log.strip().splitlines()[-1]))
+    return result
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+def git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                               capture_output=True, text=True).stdout.strip()
+        return commit + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def load_results(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def baseline(history, record):
+    """Latest earlier result for the same stage, size and machine from another commit"""
+    for old in reversed(history):
+        if (old['stage'], old['items'], old['machine']) == (record['stage'], record['items'], record['machine']) \
+                and old['commit'] != record['commit']:
+            return old
+    return None
+
+
+# Smallest absolute increase counted as a regression (small stages are noisy)
+NOISE = {'seconds': 0.25, 'peak_rss_mb': 5.0}
+
+
+def compare(record, old, threshold):
+    """Printable change against the baseline and whether it is a regression"""
+    if old is None:
+        return '', False
+    notes, regressed = [], False
+    for field, label in (('seconds', 'time'), ('peak_rss_mb', 'rss')):
+        if record.get(field) and old.get(field):
+            change = record[field] / old[field] - 1
+            notes.append(f"{label} {change:+.0%}")
+            regressed = regressed or (change > threshold and record[field] - old[field] > NOISE[field])
+    return f"vs {old['commit']}: {', '.join(notes)}" + ('  REGRESSION' if regressed else ''), regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='Item counts to benchmark')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES), help='Stages to run')
+    parser.add_argument('--results', default=RESULTS, help='JSON-lines file results are appended to')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative slowdown / RSS growth reported as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit 1 when a stage regressed')
+    parser.add_argument('--keep', metavar='DIR', help='Keep synthetic workbooks and outputs in DIR')
+    parser.add_argument('--run', choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument('--workbook', help=argparse.SUPPRESS)
+    parser.add_argument('--items', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:  # child process: one stage, result on the last stdout line
+        print(json.dumps(run_stage(args.run, args.workbook, args.items)))
+        return 0
+
+    history = load_results(args.results)
+    commit = git_commit()
+    machine = f"{platform.node()} {platform.machine()} {os.cpu_count()}cpu"
+    stages = ['generate'] + [stage for stage in args.stages if stage != 'generate']
+    regressions = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for items in args.sizes:
+            workdir = os.path.join(args.keep or tmp, f"items-{items}")
+            os.makedirs(workdir, exist_ok=True)
+            workbook = os.path.join(workdir, f"synthetic-{items}.xlsx")
+            print(f"\n=== {items:,} items ===")
+            for stage in stages:
+                result = measure(stage, workbook, items, workdir)
+                record = {
+                    'timestamp': datetime.now().isoformat(timespec='seconds'),
+                    'commit': commit,
+                    'machine': machine,
+                    'python': platform.python_version(),
+                    'items': items,
+                    'stage': stage,
+                    **result,
+                }
+                note, regressed = compare(record, baseline(history, record), args.threshold)
+                regressions += regressed
+                rss = f"{record['peak_rss_mb']:8.1f} MB" if record['peak_rss_mb'] is not None else '       - MB'
+                size = f"{record['output_bytes'] / 1e6:9.2f} MB out" if 'output_bytes' in record else ' ' * 16
+                print(f"  {stage:<20} {record['seconds']:8.2f}s {rss} {size}  {note}")
+                with open(args.results, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + '\n')
+                history.append(record)
+
+    print(f"\nResults appended to {args.results} ({commit})")
+    if regressions:
+        print(f"{regressions} stage(s) regressed by more than {args.threshold:.0%}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,257 @@
+"""
+Multi-level BOM explosion with memoized sub-assembly rollups.
+
+The BOM graph is read from the database (active bom_headers / bom_items,
+including nested child_bom_id rows from add-multilevel-bom-support.sql) or
+from the workbook (A-BOM: final assembly -> sub-assemblies, S-BOM:
+sub-assembly -> raw materials). Every edge carries its quantity times
+(1 + scrap_percentage / 100).
+
+Each assembly's per-unit rollup (leaf item -> quantity) is computed once and
+reused wherever the assembly appears, so shared sub-assemblies are expanded a
+single time however many products use them. A cycle raises BomCycleError
+with the offending path. Any item with an active BOM is exploded through it.
+
+Usage:
+    python scripts/bom_explosion.py "Saif Seas Life - DSR" --qty 10
+    python scripts/bom_explosion.py FG-001 --qty 5 --dsn "$DATABASE_URL" [--tenant TENANT_ID]
+    python scripts/bom_explosion.py --all --json
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import Iterable, Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from excel_import import WORKBOOK, clean_number, is_missing, iter_sheet, open_workbook  # noqa: E402
+
+# (parent column, component column, quantity column) per workbook BOM sheet
+WORKBOOK_BOMS = {
+    'A-BOM': ('FINAL ASSEMBLY NAME', 'SUB ASSEMBLY / PART NAME', 'QUANTITY'),
+    'S-BOM': ('SUB ASSEMBLY NAME', 'RAW MATERIAL NAME', 'UNITS'),
+}
+
+
+class BomCycleError(ValueError):
+    def __init__(self, path: list[str]):
+        self.path = path
+        super().__init__("BOM cycle: " + " -> ".join(path))
+
+
+class BomGraph:
+    """Assembly -> [(component, quantity incl. scrap)]; nodes without children are leaves"""
+
+    def __init__(self) -> None:
+        self.children: dict[str, list[tuple[str, float]]] = defaultdict(list)
+        self.labels: dict[str, str] = {}
+        self._rollups: dict[str, dict[str, float]] = {}
+
+    def add(self, parent: str, child: str, quantity: float, scrap_percentage: float = 0.0) -> None:
+        self.children[parent].append((child, quantity * (1 + scrap_percentage / 100)))
+        self._rollups.clear()
+
+    def replace(self, parent: str, lines: Iterable[tuple[str, float]]) -> list[tuple[str, float]]:
+        """Swap in a new BOM for parent (no lines = no BOM); returns the old lines"""
+        old = self.children.pop(parent, [])
+        lines = list(lines)
+        if lines:
+            self.children[parent] = lines
+        self._rollups.clear()
+        return old
+
+    @property
+    def computed(self) -> int:
+        """Number of memoized assembly rollups"""
+        return len(self._rollups)
+
+    def label(self, node: str) -> str:
+        return self.labels.get(node, node)
+
+    def is_assembly(self, node: str) -> bool:
+        return node in self.children
+
+    def roots(self) -> list[str]:
+        """Assemblies that are not a component of anything (finished goods)"""
+        used = {child for lines in self.children.values() for child, _ in lines}
+        return [node for node in self.children if node not in used]
+
+    def rollup(self, node: str) -> dict[str, float]:
+        """
+        Leaf quantities for one unit of node.
+
+        Post-order walk with an explicit stack; each assembly's rollup is
+        memoized, a component already on the current path is a cycle.
+        """
+        if node in self._rollups:
+            return self._rollups[node]
+        if not self.is_assembly(node):
+            return {node: 1.0}
+
+        path = [node]
+        on_path = {node}
+        stack = [iter(self.children[node])]
+        while stack:
+            for child, _ in stack[-1]:
+                if child in on_path:
+                    raise BomCycleError(path[path.index(child):] + [child])
+                if self.is_assembly(child) and child not in self._rollups:
+                    path.append(child)
+                    on_path.add(child)
+                    stack.append(iter(self.children[child]))
+                    break
+            else:
+                stack.pop()
+                done = path.pop()
+                on_path.discard(done)
+                totals: dict[str, float] = defaultdict(float)
+                for child, qty in self.children[done]:
+                    if self.is_assembly(child):
+                        for leaf, leaf_qty in self._rollups[child].items():
+                            totals[leaf] += qty * leaf_qty
+                    else:
+                        totals[child] += qty
+                self._rollups[done] = dict(totals)
+        return self._rollups[node]
+
+    def explode(self, demand: dict[str, float]) -> dict[str, float]:
+        """Leaf requirements for {assembly or item: quantity}"""
+        totals: dict[str, float] = defaultdict(float)
+        for node, quantity in demand.items():
+            for leaf, qty in self.rollup(node).items():
+                totals[leaf] += quantity * qty
+        return dict(totals)
+
+    def tree(self, node: str, quantity: float = 1.0, depth: int = 0) -> Iterator[tuple[int, str, float]]:
+        """(depth, node, extended quantity) for an indented multi-level listing"""
+        self.rollup(node)  # raises on cycles before walking
+        yield depth, node, quantity
+        for child, qty in self.children.get(node, ()):
+            yield from self.tree(child, quantity * qty, depth + 1)
+
+
+# =============================================================================
+# LOAD
+# =============================================================================
+
+def _name(value) -> str | None:
+    if is_missing(value):
+        return None
+    text = str(value).strip()
+    return text if text and text != 'nan' else None
+
+
+def from_workbook(path: str = WORKBOOK) -> BomGraph:
+    """A-BOM + S-BOM sheets, nodes keyed by item name (missing quantity = 1, as in the importer)"""
+    graph = BomGraph()
+    workbook = open_workbook(path)
+    for sheet, (parent_col, child_col, qty_col) in WORKBOOK_BOMS.items():
+        if sheet not in workbook.sheetnames:
+            continue
+        for _, row in iter_sheet(workbook, sheet, header=1, numeric=(qty_col,)):
+            parent, child = _name(row[parent_col]), _name(row[child_col])
+            if parent and child:
+                graph.add(parent, child, clean_number(row[qty_col]) or 1)
+    return graph
+
+
+def bom_lines(cur, tenant_id: str | None = None, item_ids: list[str] | None = None) -> list[tuple]:
+    """
+    (item id, component id, quantity, scrap %) of the latest active BOM per
+    item, in sequence order; item_ids limits it to those items' BOMs.
+    """
+    cur.execute("""SELECT 1 FROM information_schema.columns
+                   WHERE table_name = 'bom_items' AND column_name = 'child_bom_id'""")
+    nested = cur.fetchone() is not None
+    child = "COALESCE(bi.item_id, ch.item_id)" if nested else "bi.item_id"
+    join_child = "LEFT JOIN bom_headers ch ON ch.id = bi.child_bom_id" if nested else ""
+    cur.execute(f"""
+        WITH heads AS (
+            SELECT DISTINCT ON (item_id) id, item_id
+            FROM bom_headers
+            WHERE is_active AND (%(tenant)s::uuid IS NULL OR tenant_id = %(tenant)s::uuid)
+              AND (%(items)s::uuid[] IS NULL OR item_id = ANY(%(items)s::uuid[]))
+            ORDER BY item_id, version DESC, created_at DESC
+        )
+        SELECT h.item_id::text, {child}::text, bi.quantity, COALESCE(bi.scrap_percentage, 0)
+        FROM heads h
+        JOIN bom_items bi ON bi.bom_id = h.id
+        {join_child}
+        WHERE {child} IS NOT NULL
+        ORDER BY h.item_id, bi.sequence NULLS LAST
+    """, {'tenant': tenant_id, 'items': item_ids})
+    return cur.fetchall()
+
+
+def from_database(dsn: str, tenant_id: str | None = None) -> BomGraph:
+    """Latest active BOM per item, nodes keyed by item id and labelled with the item code"""
+    import psycopg2
+
+    with psycopg2.connect(dsn) as conn, conn.cursor() as cur:
+        graph = BomGraph()
+        for parent, component, quantity, scrap in bom_lines(cur, tenant_id):
+            graph.add(parent, component, float(quantity), float(scrap))
+        cur.execute("SELECT id::text, code FROM items WHERE (%(tenant)s::uuid IS NULL OR tenant_id = %(tenant)s::uuid)",
+                    {'tenant': tenant_id})
+        graph.labels = dict(cur.fetchall())
+    return graph
+
+
+def resolve(graph: BomGraph, names: Iterable[str]) -> list[str]:
+    """Map codes / names given on the command line to graph nodes"""
+    by_label = {label: node for node, label in graph.labels.items()}
+    nodes = []
+    for name in names:
+        node = by_label.get(name, name)
+        if not graph.is_assembly(node):
+            raise SystemExit(f"No BOM for {name!r}")
+        nodes.append(node)
+    return nodes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('assemblies', nargs='*', help='Item codes (--dsn) or names (workbook) to explode')
+    parser.add_argument('--qty', type=float, default=1.0, help='Quantity of each assembly')
+    parser.add_argument('--all', action='store_true', help='Explode every top-level assembly')
+    parser.add_argument('--tree', action='store_true', help='Print the indented multi-level BOM as well')
+    parser.add_argument('--json', action='store_true', help='Print {leaf: quantity} as JSON')
+    parser.add_argument('--workbook', default=WORKBOOK, help='Workbook with A-BOM / S-BOM sheets')
+    parser.add_argument('--dsn', help='Read bom_headers / bom_items from this Postgres database instead')
+    parser.add_argument('--tenant', help='Tenant id to read (--dsn)')
+    args = parser.parse_args()
+
+    graph = from_database(args.dsn, args.tenant) if args.dsn else from_workbook(args.workbook)
+    nodes = graph.roots() if args.all else resolve(graph, args.assemblies)
+    if not nodes:
+        parser.error('give assemblies to explode, or --all')
+
+    try:
+        requirements = graph.explode({node: args.qty for node in nodes})
+    except BomCycleError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps({graph.label(leaf): qty for leaf, qty in sorted(requirements.items(),
+                                                                          key=lambda kv: graph.label(kv[0]))}, indent=2))
+        return 0
+
+    if args.tree:
+        for node in nodes:
+            for depth, part, qty in graph.tree(node, args.qty):
+                print(f"{'    ' * depth}{graph.label(part)}  x{qty:g}")
+            print()
+
+    print(f"{len(nodes)} assembl{'y' if len(nodes) == 1 else 'ies'} x {args.qty:g}: "
+          f"{len(requirements)} leaf items, {graph.computed} assembly rollups computed")
+    for leaf, qty in sorted(requirements.items(), key=lambda kv: graph.label(kv[0])):
+        print(f"  {graph.label(leaf):<50} {qty:>12,.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
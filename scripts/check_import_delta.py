@@ -0,0 +1,150 @@
+"""
+Round-trip check for generate-import-sql-v2.py --delta.
+
+Writes a small synthetic workbook (scripts/bench_import.py), then a copy
+without one stocked raw material and without every S-BOM line of one
+sub-assembly. Into a scratch tenant it applies, with --delta:
+
+    full workbook -> workbook with the rows removed -> full workbook again
+
+and compares that tenant's items, vendors, item-vendor links, BOMs and stock
+with a second scratch tenant that got the full workbook in one plain run.
+Both tenants are deleted afterwards. Needs a database with the ERP schema
+(database-schema.sql and add-item-vendor-relationships.sql); run from the
+repo root:
+
+    python scripts/check_import_delta.py --dsn "$DATABASE_URL"
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_import import write_workbook  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = ROOT / "generate-import-sql-v2.py"
+ITEMS = 300
+
+# Tenant state compared between the delta and the one-shot import
+STATE = {
+    "items": "SELECT code, name, type::text, uom, is_active FROM items WHERE tenant_id = %(t)s",
+    "vendors": "SELECT code, name, is_active FROM vendors WHERE tenant_id = %(t)s",
+    "item_vendors": """SELECT i.code, v.code, iv.priority, iv.unit_price FROM item_vendors iv
+                       JOIN items i ON i.id = iv.item_id JOIN vendors v ON v.id = iv.vendor_id
+                       WHERE i.tenant_id = %(t)s""",
+    "bom_headers": """SELECT i.code, bh.is_active FROM bom_headers bh JOIN items i ON i.id = bh.item_id
+                      WHERE bh.tenant_id = %(t)s""",
+    "bom_items": """SELECT a.code, i.code, bi.quantity FROM bom_items bi JOIN bom_headers bh ON bh.id = bi.bom_id
+                    JOIN items a ON a.id = bh.item_id JOIN items i ON i.id = bi.item_id
+                    WHERE bh.tenant_id = %(t)s""",
+    "stock_entries": """SELECT i.code, se.quantity, se.available_quantity FROM stock_entries se
+                        JOIN items i ON i.id = se.item_id WHERE se.tenant_id = %(t)s""",
+}
+
+
+def remove_rows(full: Path, path: Path) -> tuple[str, str]:
+    """Copy of the workbook without one stocked RM row and one sub-assembly's S-BOM lines"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(full)
+    rm = wb["RM"]
+    row = next(r for r in range(3, rm.max_row + 1)
+               if isinstance(rm.cell(r, 13).value, (int, float)) and rm.cell(r, 13).value > 0 and rm.cell(r, 9).value)
+    material = rm.cell(row, 2).value
+    rm.delete_rows(row)
+
+    sbom = wb["S-BOM"]
+    assembly = sbom.cell(3, 2).value
+    for r in range(sbom.max_row, 2, -1):
+        if sbom.cell(r, 2).value == assembly:
+            sbom.delete_rows(r)
+    wb.save(path)
+    return material, assembly
+
+
+def create_tenant(cur, label: str) -> str:
+    tenant = str(uuid.uuid4())
+    cur.execute("INSERT INTO tenants (id, name, subdomain) VALUES (%s, %s, %s)",
+                (tenant, f"check_import_delta {label}", f"check-delta-{tenant}"))
+    cur.execute("INSERT INTO warehouses (tenant_id, code, name) VALUES (%s, 'MAIN', 'Main')", (tenant,))
+    return tenant
+
+
+def apply(cur, tenant: str, workbook: Path, output: Path, *extra: str):
+    """Generate the SQL for workbook into tenant and run it"""
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT), "--workbook", str(workbook), "--output", str(output), "--tenant", tenant,
+         *extra],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"FAIL {SCRIPT.name} {' '.join(extra)}: exit {proc.returncode}\n{proc.stderr[-2000:]}")
+    cur.execute(output.read_text(encoding="utf-8"))
+
+
+def state(cur, tenant: str) -> dict[str, list[tuple]]:
+    result = {}
+    for table, sql in STATE.items():
+        cur.execute(sql, {"t": tenant})
+        result[table] = sorted(cur.fetchall(), key=repr)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True, help="Scratch Postgres database with the ERP schema")
+    args = parser.parse_args()
+
+    import psycopg2
+
+    failures = 0
+    conn = psycopg2.connect(args.dsn)
+    conn.autocommit = True
+    tenants = []
+    try:
+        with conn.cursor() as cur, tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            full, reduced, manifest = tmp / "full.xlsx", tmp / "reduced.xlsx", tmp / "manifest.json"
+            write_workbook(full, ITEMS, seed=7)
+            material, assembly = remove_rows(full, reduced)
+
+            delta, plain = create_tenant(cur, "delta"), create_tenant(cur, "plain")
+            tenants += [delta, plain]
+            for step, workbook in enumerate((full, reduced, full)):
+                apply(cur, delta, workbook, tmp / f"delta-{step}.sql", "--delta", str(manifest))
+                if step == 1:
+                    cur.execute("SELECT is_active FROM items WHERE tenant_id = %s AND name = %s", (delta, material))
+                    if cur.fetchone() != (False,):
+                        print(f"FAIL removed raw material {material!r} was not deactivated")
+                        failures += 1
+            apply(cur, plain, full, tmp / "plain.sql")
+
+            got, want = state(cur, delta), state(cur, plain)
+            for table in STATE:
+                if got[table] == want[table]:
+                    print(f"ok   remove -> re-add -> apply: {table} matches a one-shot import ({len(want[table])} rows)")
+                else:
+                    extra = set(got[table]) ^ set(want[table])
+                    print(f"FAIL remove -> re-add -> apply: {table} differs "
+                          f"({material!r} / {assembly!r}): {sorted(extra, key=repr)[:5]}")
+                    failures += 1
+    finally:
+        with conn.cursor() as cur:
+            for tenant in tenants:
+                # bom_items references items without ON DELETE CASCADE
+                cur.execute("DELETE FROM bom_items USING bom_headers bh WHERE bom_items.bom_id = bh.id "
+                            "AND bh.tenant_id = %s", (tenant,))
+                cur.execute("DELETE FROM tenants WHERE id = %s", (tenant,))
+        conn.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""
+Golden-output check for the Excel importers.
+
+Regenerates the SQL with every engine and compares it byte for byte with the
+checked-in files (the "-- Generated:" timestamp line is ignored). The
+vectorized engine is also run under the 'spawn' start method (the default on
+Windows and macOS), with the sheet-parsing process pool forced on: worker
+processes re-import the importer, which must not run an import of its own.
+Run from the repo root:
+
+    python scripts/check_import_golden.py
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+GOLDEN = [
+    ("generate-import-sql-v2.py", "import-data-from-excel-with-vendors.sql"),
+    ("generate-import-sql.py", "import-data-from-excel.sql"),
+]
+ENGINES = ["stream", "vectorized"]
+
+# Runs an importer as __main__ under 'spawn', with enough CPUs for read_sheets() to use its process pool
+SPAWN = """
+import multiprocessing, os, runpy, sys
+multiprocessing.set_start_method('spawn')
+os.cpu_count = lambda: 4
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name='__main__')
+"""
+
+
+def read_lines(path: Path) -> list[str]:
+    text = path.read_text(encoding="utf-8")
+    return [line for line in text.splitlines(keepends=True) if not line.startswith("-- Generated:")]
+
+
+def first_difference(expected: list[str], actual: list[str]) -> str:
+    for lineno, (want, got) in enumerate(zip(expected, actual), start=1):
+        if want != got:
+            return f"line {lineno}: expected {want!r}, got {got!r}"
+    return f"length differs: expected {len(expected)} lines, got {len(actual)}"
+
+
+def main() -> int:
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for script, golden in GOLDEN:
+            expected = read_lines(ROOT / golden)
+            runs = [(f"--engine={engine}", [str(ROOT / script), "--engine", engine]) for engine in ENGINES]
+            runs.append(("--engine=vectorized (spawn)", ["-c", SPAWN, str(ROOT / script), "--engine", "vectorized"]))
+            for n, (label, command) in enumerate(runs):
+                output = Path(tmp) / f"{n}-{golden}"
+                proc = subprocess.run(
+                    [sys.executable, *command, "--output", str(output)],
+                    cwd=ROOT,
+                    capture_output=True,
+                    text=True,
+                )
+                if proc.returncode != 0:
+                    print(f"FAIL {script} {label}: exit {proc.returncode}\n{proc.stderr[-2000:]}")
+                    failures += 1
+                    continue
+                runs_of_import = proc.stdout.count("Reading Excel file...")
+                if runs_of_import != 1:
+                    print(f"FAIL {script} {label}: the import ran {runs_of_import} times (worker processes re-ran it)")
+                    failures += 1
+                    continue
+                actual = read_lines(output)
+                if actual == expected:
+                    print(f"ok   {script} {label} == {golden}")
+                else:
+                    print(f"FAIL {script} {label} != {golden}: {first_difference(expected, actual)}")
+                    failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,125 +1,181 @@
-import json
+"""
+Stock check for job-order items through the API.
+
+Each item code is resolved with a filtered /items?search= request and only
+that item's /inventory/stock rows are fetched, instead of downloading every
+item and every stock row. Codes are checked concurrently by a bounded thread
+pool; each worker keeps one keep-alive connection, and stock rows are folded
+into per-item totals as each response arrives.
+
+Item ids come from the on-disk master data cache (master_cache.py): within
+--ttl no /items request is made at all, after it the item list is only
+revalidated (304) unless it changed. Codes missing from the cache fall back
+to the per-code search and are added to it.
+
+Usage:
+    python scripts/check_job_order_stock.py RAD-TRR-QX71W915 RAD-TRR-R9MI1W915
+    python scripts/check_job_order_stock.py --codes-file codes.txt --workers 8
+    python scripts/check_job_order_stock.py --no-cache CODE
+    API_BASE=https://erp.example.com/api/v1 API_TOKEN=... python scripts/check_job_order_stock.py CODE
+"""
+
+import argparse
+import os
 import sys
-import urllib.error
-import urllib.request
-from typing import Any
-
-BASE = "http://127.0.0.1:4000/api/v1"
-CODES = [
-    "RAD-TRR-QX71W915",
-    "RAD-TRR-R9MI1W915",
-]
-
-
-def fetch_json(path: str) -> tuple[int | None, Any, str]:
-    url = f"{BASE}{path}"
-    try:
-        with urllib.request.urlopen(url) as r:
-            raw = r.read().decode("utf-8", errors="replace")
-            return r.status, json.loads(raw), raw
-    except urllib.error.HTTPError as e:
-        raw = e.read().decode("utf-8", errors="replace") if e.fp else ""
-        return e.code, None, raw
-    except Exception as e:
-        return None, None, repr(e)
-
-
-def unwrap(body: Any) -> list[dict]:
-    if isinstance(body, list):
-        return [x for x in body if isinstance(x, dict)]
-    if isinstance(body, dict):
-        maybe = body.get("data") or body.get("items") or []
-        if isinstance(maybe, list):
-            return [x for x in maybe if isinstance(x, dict)]
-    return []
-
-
-def to_float(value: Any) -> float:
-    try:
-        if value is None:
-            return 0.0
-        return float(value)
-    except Exception:
-        return 0.0
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from api_client import BASE, ApiClient, to_float, unwrap  # noqa: E402
+from master_cache import CACHE, open_cache  # noqa: E402
+
+
+class StockTotals:
+    """Running per-item totals of stock rows"""
+
+    def __init__(self, item_id: str):
+        self.item_id = item_id
+        self.rows = 0
+        self.quantity = 0.0
+        self.available_quantity = 0.0
+        self.allocated_quantity = 0.0
+        self.total_quantity = 0.0
+        self.keys: set[str] = set()
+        self.sample: dict | None = None
+
+    def add(self, entry: dict) -> None:
+        self.rows += 1
+        self.quantity += to_float(entry.get("quantity"))
+        self.available_quantity += to_float(entry.get("available_quantity"))
+        self.allocated_quantity += to_float(entry.get("allocated_quantity"))
+        self.total_quantity += to_float(entry.get("total_quantity"))
+        self.keys.update(entry.keys())
+        if self.sample is None:
+            self.sample = entry
+
+
+class CheckResult:
+    """Outcome for one code: totals, or a status (ITEM_NOT_FOUND, ITEMS_ERROR, STOCK_ERROR) with detail"""
+
+    def __init__(self, code: str, totals: StockTotals | None = None, status: str = "OK", detail: str = ""):
+        self.code = code
+        self.totals = totals
+        self.status = status
+        self.detail = detail
+
+
+def resolve_item_id(client: ApiClient, code: str) -> tuple[str | None, CheckResult | None]:
+    """Exact code match from a filtered item search (inactive items included)"""
+    status, body, raw = client.fetch_json("/items", {"search": code, "includeInactive": "true"})
+    if status != 200:
+        return None, CheckResult(code, status="ITEMS_ERROR", detail=f"status={status} {raw[:500]}")
+    for item in unwrap(body):
+        if item.get("code") == code and item.get("id"):
+            return str(item["id"]), None
+    return None, CheckResult(code, status="ITEM_NOT_FOUND")
+
+
+def check_code(client: ApiClient, code: str, item_id: str | None = None) -> CheckResult:
+    if item_id is None:
+        item_id, failed = resolve_item_id(client, code)
+        if failed:
+            return failed
+    status, body, raw = client.fetch_json("/inventory/stock", {"item_id": item_id})
+    if status != 200:
+        return CheckResult(code, status="STOCK_ERROR", detail=f"status={status} {raw[:500]}")
+    totals = StockTotals(item_id)
+    for entry in unwrap(body):
+        if str(entry.get("item_id") or entry.get("itemId")) == item_id:
+            totals.add(entry)
+    return CheckResult(code, totals, status="OK" if totals.rows else "NO_STOCK_ROWS")
+
+
+def check_codes(client: ApiClient, codes: Iterable[str], workers: int = 8,
+                item_ids: dict[str, str] | None = None) -> Iterable[CheckResult]:
+    """
+    Check codes concurrently (at most `workers` requests in flight); results
+    come back in input order. Codes found in item_ids skip the item search.
+    """
+    item_ids = item_ids or {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(lambda code: check_code(client, code, item_ids.get(code)), codes)
+
+
+def read_codes(args_codes: list[str], codes_file: str | None) -> list[str]:
+    codes = list(args_codes)
+    if codes_file:
+        with open(codes_file, encoding="utf-8") as f:
+            codes += [line.split("#", 1)[0].strip() for line in f]
+    return list(dict.fromkeys(code for code in codes if code))
+
+
+def print_result(result: CheckResult) -> None:
+    if result.status in ("ITEM_NOT_FOUND", "ITEMS_ERROR", "STOCK_ERROR"):
+        print(f"\n{result.code}: {result.status} {result.detail}".rstrip())
+        return
+    agg = result.totals
+    if result.status == "NO_STOCK_ROWS":
+        print(f"\n{result.code}: NO_STOCK_ROWS item_id={agg.item_id}")
+        return
+
+    print(
+        f"\n{result.code}: rows={agg.rows} quantity_sum={agg.quantity} available_sum={agg.available_quantity} allocated_sum={agg.allocated_quantity} total_quantity_sum={agg.total_quantity}"
+    )
+    sample = agg.sample or {}
+    sample_keys = [
+        "warehouse_id",
+        "warehouseId",
+        "quantity",
+        "available_quantity",
+        "allocated_quantity",
+        "total_quantity",
+        "total_qty",
+        "updated_at",
+        "created_at",
+    ]
+    print("sample_row", {k: sample.get(k) for k in sample_keys if k in sample})
+    print("all_keys", sorted(list(agg.keys)))
 
 
 def main() -> int:
-    items_status, items_body, items_raw = fetch_json("/items")
-    print("items_status", items_status)
-    if items_status != 200:
-        print("items_error_body", items_raw[:1000])
-        return 2
-
-    items = unwrap(items_body)
-    code_to_id = {it.get("code"): it.get("id") for it in items if it.get("code")}
-    print("item_ids", {c: code_to_id.get(c) for c in CODES})
-
-    stock_status, stock_body, stock_raw = fetch_json("/inventory/stock")
-    print("stock_status", stock_status)
-    if stock_status != 200:
-        print("stock_error_body", stock_raw[:1000])
-        return 3
-
-    stock_rows = unwrap(stock_body)
-
-    # Aggregate by item_id
-    stock_by_item: dict[str, dict[str, Any]] = {}
-    for e in stock_rows:
-        item_id = e.get("item_id") or e.get("itemId")
-        if not item_id:
-            continue
-
-        agg = stock_by_item.setdefault(
-            str(item_id),
-            {
-                "rows": 0,
-                "quantity": 0.0,
-                "available_quantity": 0.0,
-                "allocated_quantity": 0.0,
-                "total_quantity": 0.0,
-                "keys": set(),
-                "sample": None,
-            },
-        )
-        agg["rows"] += 1
-        agg["quantity"] += to_float(e.get("quantity"))
-        agg["available_quantity"] += to_float(e.get("available_quantity"))
-        agg["allocated_quantity"] += to_float(e.get("allocated_quantity"))
-        agg["total_quantity"] += to_float(e.get("total_quantity"))
-        agg["keys"].update(e.keys())
-        if agg["sample"] is None:
-            agg["sample"] = e
-
-    for code in CODES:
-        iid = code_to_id.get(code)
-        if not iid:
-            print(f"\n{code}: ITEM_NOT_FOUND")
-            continue
-
-        agg = stock_by_item.get(str(iid))
-        if not agg:
-            print(f"\n{code}: NO_STOCK_ROWS item_id={iid}")
-            continue
-
-        print(
-            f"\n{code}: rows={agg['rows']} quantity_sum={agg['quantity']} available_sum={agg['available_quantity']} allocated_sum={agg['allocated_quantity']} total_quantity_sum={agg['total_quantity']}"
-        )
-        sample = agg["sample"] or {}
-        sample_keys = [
-            "warehouse_id",
-            "warehouseId",
-            "quantity",
-            "available_quantity",
-            "allocated_quantity",
-            "total_quantity",
-            "total_qty",
-            "updated_at",
-            "created_at",
-        ]
-        print("sample_row", {k: sample.get(k) for k in sample_keys if k in sample})
-        print("all_keys", sorted(list(agg["keys"])))
-
-    return 0
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("codes", nargs="*", help="Item codes to check")
+    parser.add_argument("--codes-file", help="File with one item code per line (# comments allowed)")
+    parser.add_argument("--base", default=BASE, help="API base URL (env API_BASE)")
+    parser.add_argument("--token", default=os.environ.get("API_TOKEN"), help="Bearer token (env API_TOKEN)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--cache", default=CACHE, help="Master data cache file")
+    parser.add_argument("--ttl", type=float, default=3600, help="Seconds the cached item list is used without revalidating")
+    parser.add_argument("--no-cache", action="store_true", help="Resolve every code with an item search")
+    args = parser.parse_args()
+
+    codes = read_codes(args.codes, args.codes_file)
+    if not codes:
+        parser.error("give item codes or --codes-file")
+
+    client = ApiClient(args.base, args.token)
+    cache, item_ids = None, {}
+    if not args.no_cache:
+        cache = open_cache(client, args.base, args.token, args.cache, args.ttl)
+        try:
+            item_ids = {code: item["id"] for code, item in cache.get("items").items() if item.get("id")}
+        except RuntimeError as e:
+            print(f"item cache unavailable, searching per code: {e}", file=sys.stderr)
+
+    exit_code = 0
+    try:
+        for result in check_codes(client, codes, args.workers, item_ids):
+            print_result(result)
+            if cache and result.totals and result.code not in item_ids:
+                cache.put("items", result.code, {"id": result.totals.item_id})
+            if result.status == "ITEMS_ERROR":
+                exit_code = exit_code or 2
+            elif result.status == "STOCK_ERROR":
+                exit_code = exit_code or 3
+    finally:
+        client.close()
+    return exit_code
 
 
 if __name__ == "__main__":
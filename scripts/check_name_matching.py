@@ -0,0 +1,60 @@
+"""
+Pair check for scripts/name_matching.py.
+
+Each pair is grouped on its own by a NameMatcher (items or vendors, similar
+matching on) and must come out merged or kept apart as listed. Run from the
+repo root:
+
+    python scripts/check_name_matching.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from name_matching import NameMatcher, normalize_item, normalize_vendor  # noqa: E402
+
+# (normalize, a, b): names that are one spelling of the same thing
+SAME = [
+    (normalize_vendor, "Robu", "ROBU.in"),
+    (normalize_vendor, "Innovine", "Innovine Pvt. Ltd."),
+    (normalize_item, "Spring washer", "Springwasher"),
+    (normalize_item, "Bullet  Connector 4mm", "bullet connector 4mm"),
+    (normalize_item, "Bullet Connector 4mm", "Bullet Conector 4mm"),
+    (normalize_item, "Cap 4.7uF", "Cap 4.7 uF"),
+]
+
+# (normalize, a, b): different parts, never merged
+DIFFERENT = [
+    (normalize_item, "Male Connector", "Female Connector"),
+    (normalize_item, "Bracket LHS", "Bracket RHS"),
+    (normalize_item, "Hex Bolt M4", "Hex Bolt M5"),
+    (normalize_item, "Wire 8AWG", "Wire 12AWG"),
+    (normalize_item, "Cap 4.7uF", "Cap 47uF"),
+    (normalize_item, "Heat Shrink 1.5mm", "Heat Shrink 15mm"),
+    (normalize_item, "Wire 2.5 sq mm", "Wire 25 sq mm"),
+]
+
+
+def merged(normalize, a: str, b: str) -> bool:
+    matcher = NameMatcher(normalize)
+    matcher.add(a)
+    matcher.add(b)
+    return bool(matcher.groups())
+
+
+def main() -> int:
+    failures = 0
+    for expected, pairs in ((True, SAME), (False, DIFFERENT)):
+        for normalize, a, b in pairs:
+            if merged(normalize, a, b) == expected:
+                print(f"ok   {a!r} {'==' if expected else '!='} {b!r}")
+            else:
+                print(f"FAIL {a!r} and {b!r} should {'' if expected else 'not '}be merged")
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
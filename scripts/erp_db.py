@@ -0,0 +1,54 @@
+"""
+Shared helpers for the scripts that read the ERP database
+(reconcile_grn_stock.py, export_stock_list.py, shortage_scan.py, allocate_stock.py, backfill_uids.py,
+where_used.py, stock_snapshots.py)
+
+Tenant filter, column detection on schemas that differ between environments,
+server-side cursors for large reads, a credential-free key for saved
+indexes / snapshots and literal formatting for the fix-up / plan SQL the
+scripts write for review.
+"""
+
+from decimal import Decimal
+
+FETCH = 5000
+
+# Every row with --tenant unset, else only that tenant's
+TENANT = "(%(tenant)s::uuid IS NULL OR {alias}.tenant_id = %(tenant)s::uuid)"
+
+# grn_items column names differ between environments (fix-grn-2025-12-004-stock.sql)
+ACCEPTED_COLUMNS = ('accepted_quantity', 'accepted_qty')
+PRICE_COLUMNS = ('unit_price', 'rate')
+
+
+def column(cur, table: str, candidates: tuple[str, ...]) -> str | None:
+    """First of candidates that exists on table (in the current schema, not a backup copy of it)"""
+    cur.execute("SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = %s AND column_name = ANY(%s)",
+                (table, list(candidates)))
+    found = {name for name, in cur.fetchall()}
+    return next((name for name in candidates if name in found), None)
+
+
+def stream(conn, name: str, sql: str, params: dict, fetch: int = FETCH):
+    """Rows of sql through a server-side (named) cursor, fetch rows per round trip"""
+    with conn.cursor(name=name) as cur:
+        cur.itersize = fetch
+        cur.execute(sql, params)
+        yield from cur
+
+
+def database_source(dsn: str, tenant_id: str | None) -> str:
+    """Key for data read from a database: host, port, database and tenant, without the user or password"""
+    from psycopg2.extensions import parse_dsn
+
+    params = parse_dsn(dsn)
+    return f"dsn:{params.get('host', '')}:{params.get('port', '')}/{params.get('dbname', '')}:{tenant_id or ''}"
+
+
+def quote(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def fmt(value: Decimal) -> str:
+    return f"{value.normalize():f}" if value else '0'
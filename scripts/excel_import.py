@@ -0,0 +1,461 @@
+"""
+Shared helpers for the Excel -> SQL importers (generate-import-sql.py, generate-import-sql-v2.py)
+
+Rows are read lazily from the workbook (openpyxl read-only mode) and flow
+through generator stages (clean -> code -> render) straight into the output
+file, so memory stays flat whatever the workbook size.
+"""
+
+import hashlib
+import re
+import shutil
+import tempfile
+
+from openpyxl import load_workbook
+
+from import_report import NullReport
+
+WORKBOOK = 'Stock List 2024-2025.xlsx'
+
+# Default directory for parsed-sheet Arrow files (parse_cache.py)
+PARSE_CACHE = '.parse-cache'
+
+# Header row and float columns per sheet (matching how pd.read_excel() reads them)
+# and, for the importer sheets, the row-index offset used for ITEM-nnnn fallback codes.
+# Sheets not listed read with header=0.
+SHEETS = {
+    'RM': {'header': 1, 'numeric': ('Current Stock',), 'code_offset': 1},
+    'CombineSFG': {'header': 0, 'numeric': (), 'code_offset': 1000},
+    'S-BOM': {'header': 1, 'numeric': ('UNITS', 'UoM'), 'code_offset': 2000},
+    'MRP': {'header': 1},
+    'A-BOM': {'header': 1, 'numeric': ('QUANTITY',)},
+    'FG': {'header': 1},
+    'S-FG': {'header': 1},
+    'PO': {'header': 1},
+    'Inv': {'header': 1},
+    'Data': {'header': 1},
+    'GRN': {'header': 1},
+    'Issue': {'header': 1},
+    'PR-BOM': {'header': 1, 'numeric': ('REMAINING',)},
+    'Parts List': {'header': 2},
+}
+
+# Header rows of the RM and FG sheets, for workbooks written in the same layout
+RM_HEADER = [
+    'Sl No.', 'RAW MATERIAL NAME', 'Stock as on today', 'quantity to be ordered desired production',
+    'Order Status as of 21-11-24', 'PART #', 'UNIT OF MEASURE', 'COST', 'SUPPLIER', 'Required for Single SaifSeas',
+    'Required in desired no of SS', 'STARTING INVENTORY', 'Current Stock', "Received in Nov'24", "Received in Dec'24",
+    "Received in Jan'25", 'Received in February', 'Received In March', "Used in Mar'25", 'Stock as on Today',
+    'Received in April', 'Used in April',
+]
+FG_HEADER = ['SL NO', 'PRODUCT NAME', 'PART #', 'UoM', 'DESCRIPTION']
+
+# Why the clean stage drops a row, per importer sheet
+SKIP_REASONS = {
+    'RM': 'RM: blank RAW MATERIAL NAME',
+    'CombineSFG': 'CombineSFG: blank SEMI FINISHED GOODS',
+    'S-BOM': 'S-BOM: blank SUB ASSEMBLY NAME',
+}
+
+# Cell text pandas reads as NaN (pandas._libs.parsers.STR_NA_VALUES)
+NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+])
+
+
+def is_missing(value):
+    """True for empty cells (None) and NaN"""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def clean_string(s):
+    """Clean string for SQL insertion"""
+    if is_missing(s):
+        return None
+    s = str(s).strip()
+    # Escape single quotes
+    s = s.replace("'", "''")
+    return s if s else None
+
+
+def clean_number(n):
+    """Clean number for SQL insertion"""
+    if is_missing(n) or n == '':
+        return None
+    try:
+        return float(n)
+    except (TypeError, ValueError):
+        return None
+
+
+def unquote(s):
+    """Undo clean_string() quote escaping (COPY data is not SQL-escaped)"""
+    return s.replace("''", "'") if s is not None else None
+
+
+def split_vendors(vendor_string):
+    """Split vendor string by / or , and return list of vendor names"""
+    if is_missing(vendor_string) or not vendor_string:
+        return []
+    vendors = re.split(r'[/,]', str(vendor_string))
+    return [v.strip() for v in vendors if v.strip()]
+
+
+def generate_code(name):
+    """Generate vendor code from name"""
+    return re.sub(r'[^a-zA-Z0-9]', '', name.upper().replace(' ', '_'))[:20]
+
+
+def generate_item_code(name, index):
+    """Generate item code from name"""
+    if is_missing(name):
+        return f"ITEM-{index:04d}"
+    # Remove special characters and take first 3 words
+    clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', str(name))
+    words = clean_name.upper().split()[:3]
+    code = '-'.join(words) if words else f"ITEM-{index:04d}"
+    return code[:50]  # Limit length
+
+
+def workbook_hash(path=WORKBOOK):
+    """sha256 of the workbook file contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# =============================================================================
+# READ: lazy sheet rows
+# =============================================================================
+
+def open_workbook(path=WORKBOOK):
+    """Open the workbook for streaming reads (same flags pandas uses)"""
+    return load_workbook(path, read_only=True, data_only=True, keep_links=False)
+
+
+class SheetRow:
+    """One worksheet row, indexed by header name like a DataFrame row"""
+
+    __slots__ = ('columns', 'values', 'numeric')
+
+    def __init__(self, columns, values, numeric):
+        self.columns = columns
+        self.values = values
+        self.numeric = numeric
+
+    def __getitem__(self, name):
+        pos = self.columns[name]
+        value = self.values[pos] if pos < len(self.values) else None
+        if isinstance(value, str) and value in NA_VALUES:
+            return None
+        if name in self.numeric and isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        return value
+
+
+def iter_sheet(workbook, sheet, header=None, numeric=None):
+    """
+    Yield (index, row) for every row below the header row.
+
+    Mirrors pd.read_excel(..., header=header): the index counts from 0 after
+    the header row (blank rows included), a duplicated column name refers to
+    its first occurrence, NA strings read as None and integer cells in
+    numeric columns read as float. Defaults come from SHEETS.
+    """
+    spec = SHEETS.get(sheet, {})
+    header = spec.get('header', 0) if header is None else header
+    numeric = frozenset(spec.get('numeric', ()) if numeric is None else numeric)
+    rows = workbook[sheet].iter_rows(values_only=True)
+    for _ in range(header):
+        next(rows, None)
+    columns = {}
+    for pos, name in enumerate(next(rows, ())):
+        if name is not None:
+            columns.setdefault(str(name), pos)
+    for idx, values in enumerate(rows):
+        yield idx, SheetRow(columns, values, numeric)
+
+
+# =============================================================================
+# CLEAN + CODE: generator stages shared by both importers
+# =============================================================================
+
+def iter_suppliers(rows):
+    """Raw (uncleaned) SUPPLIER values of the RM sheet"""
+    for _, row in rows:
+        supplier = row['SUPPLIER']
+        if not is_missing(supplier):
+            yield supplier
+
+
+def clean_rm_rows(rows):
+    """RM sheet rows -> cleaned raw material records"""
+    for idx, row in rows:
+        item_name = clean_string(row['RAW MATERIAL NAME'])
+        if not item_name:
+            continue
+        supplier = clean_string(row['SUPPLIER'])
+        yield {
+            'index': idx,
+            'name': item_name,
+            'uom': clean_string(row['UNIT OF MEASURE']) or 'PCS',
+            'cost': clean_number(row['COST']) or 0,
+            'supplier': supplier,
+            'vendors': split_vendors(supplier) if supplier else [],
+            'current_stock': clean_number(row['Current Stock']) or 0,
+            'part_number': clean_string(row['PART #']),
+        }
+
+
+def clean_sfg_rows(rows):
+    """CombineSFG sheet rows -> cleaned sub-assembly records"""
+    for idx, row in rows:
+        item_name = clean_string(row['SEMI FINISHED GOODS'])
+        if not item_name or item_name == 'nan':
+            continue
+        yield {
+            'index': idx,
+            'name': item_name,
+            'uom': clean_string(row['UoM']) or 'PCS',
+        }
+
+
+def clean_bom_rows(rows):
+    """S-BOM sheet rows -> cleaned BOM line records (rm_name is None for header-only rows)"""
+    for idx, row in rows:
+        assembly_name = clean_string(row['SUB ASSEMBLY NAME'])
+        if not assembly_name or assembly_name == 'nan':
+            continue
+        rm_name = clean_string(row['RAW MATERIAL NAME'])
+        if rm_name == 'nan':
+            rm_name = None
+        yield {
+            'index': idx,
+            'assembly_name': assembly_name,
+            'rm_name': rm_name,
+            'quantity': (clean_number(row['UNITS']) or 1) if rm_name else None,
+            'uom': (clean_string(row['UoM']) or 'PCS') if rm_name else None,
+        }
+
+
+def with_item_codes(records, offset):
+    """Code stage: add the generated item code (index offset per sheet)"""
+    for rec in records:
+        rec['code'] = generate_item_code(rec['name'], rec['index'] + offset)
+        yield rec
+
+
+def with_assembly_codes(records, offset):
+    """Code stage for BOM lines: flag the first line of each assembly group"""
+    current_assembly = None
+    for rec in records:
+        rec['new_assembly'] = rec['assembly_name'] != current_assembly
+        if rec['new_assembly']:
+            current_assembly = rec['assembly_name']
+            assembly_code = generate_item_code(current_assembly, rec['index'] + offset)
+        rec['assembly_code'] = assembly_code
+        yield rec
+
+
+class StreamSource:
+    """Default engine: per-row stages over lazily read sheets"""
+
+    def __init__(self, path=WORKBOOK, report=None):
+        self.report = report or NullReport()
+        with self.report.stage('read'):
+            self.workbook = open_workbook(path)
+
+    def _rows(self, sheet):
+        return self.report.timed('read', iter_sheet(self.workbook, sheet), count_in=True)
+
+    def _records(self, sheet, clean, code):
+        """read -> clean -> code for one sheet; rows dropped by clean are counted as skipped"""
+        read, cleaned = self.report.get('read'), self.report.get('clean')
+        read_before, clean_before = read.rows_out, cleaned.rows_out
+        records = self.report.timed('clean', clean(self._rows(sheet)))
+        yield from self.report.timed('code', code(records, SHEETS[sheet]['code_offset']), count_in=True)
+        rows = read.rows_out - read_before
+        cleaned.rows_in += rows
+        if rows > cleaned.rows_out - clean_before:
+            cleaned.skip(SKIP_REASONS[sheet], rows - (cleaned.rows_out - clean_before))
+
+    def suppliers(self):
+        """Unique raw SUPPLIER values in first-seen order"""
+        with self.report.stage('vendor split') as stage:
+            values = list(iter_suppliers(self._rows('RM')))
+            suppliers = list(dict.fromkeys(values))
+            stage.rows_in += len(values)
+            stage.rows_out = len(suppliers)
+        return suppliers
+
+    def vendor_names(self):
+        """Sorted unique vendor names after splitting multi-vendor entries"""
+        names = set()
+        with self.report.stage('vendor split') as stage:
+            for supplier in iter_suppliers(self._rows('RM')):
+                stage.rows_in += 1
+                names.update(split_vendors(supplier))
+            stage.rows_out = len(names)
+        return sorted(names)
+
+    def vendor_codes(self, names):
+        """Vendor name -> generated vendor code"""
+        return {name: generate_code(name) for name in names if clean_string(name)}
+
+    def rm_records(self):
+        return self._records('RM', clean_rm_rows, with_item_codes)
+
+    def sfg_records(self):
+        return self._records('CombineSFG', clean_sfg_rows, with_item_codes)
+
+    def bom_records(self):
+        return self._records('S-BOM', clean_bom_rows, with_assembly_codes)
+
+
+def open_source(path=WORKBOOK, engine='stream', cache_dir=None, report=None):
+    """
+    Record source for the importers: 'stream' (per row) or 'vectorized'
+    (pandas columns; cache_dir keeps its parsed sheets, see parse_cache.py).
+    report (import_report.RunReport) collects per-stage timings and counts.
+    """
+    if engine == 'vectorized':
+        from excel_vectorized import FrameSource
+        return FrameSource(path, cache_dir=cache_dir, report=report)
+    return StreamSource(path, report)
+
+
+# =============================================================================
+# WRITE: sections go straight to the output file (or a spool file)
+# =============================================================================
+
+class Section:
+    """A commented block of statements, joined like '\\n'.join(header + statements)"""
+
+    def __init__(self, f, header):
+        self.f = f
+        self.count = 0
+        f.write('\n'.join(header))
+
+    def add(self, statement):
+        self.f.write('\n')
+        self.f.write(statement)
+        self.count += 1
+
+    def close(self):
+        self.f.write('\n\n')
+
+
+def copy_field(value):
+    """Format one value for COPY ... WITH (FORMAT csv); None becomes NULL"""
+    if value is None:
+        return ''
+    if isinstance(value, (int, float)):
+        return str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+# Checkpoint table for chunked output: one row per committed chunk
+IMPORT_RUNS_DDL = """CREATE TABLE IF NOT EXISTS import_runs (
+    run_id TEXT NOT NULL,
+    chunk TEXT NOT NULL,
+    chunk_hash TEXT NOT NULL,
+    statements INT NOT NULL,
+    committed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (run_id, chunk)
+);
+"""
+
+CHUNK_QUOTE = '$import_chunk$'
+
+
+class ChunkedSection(Section):
+    """
+    A Section committed in chunks of `size` statements.
+
+    Each chunk is its own transaction: a DO block that runs the statements
+    and records (run_id, chunk, hash) in import_runs. A chunk already
+    recorded is skipped, so re-running the file after a failure resumes at
+    the first chunk that did not commit. A recorded chunk whose content has
+    changed raises instead of running twice.
+    """
+
+    def __init__(self, f, header, run_id, entity, size):
+        super().__init__(f, header)
+        self.run_id = run_id
+        self.entity = entity
+        self.size = size
+        self.chunks = 0
+        self.pending = []
+
+    def add(self, statement):
+        self.pending.append(statement)
+        self.count += 1
+        if len(self.pending) >= self.size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        self.chunks += 1
+        chunk = f"{self.entity}:{self.chunks}"
+        body = '\n'.join(self.pending)
+        if CHUNK_QUOTE in body:
+            raise ValueError(f"{chunk}: statement contains {CHUNK_QUOTE}")
+        digest = hashlib.sha1(body.encode('utf-8')).hexdigest()[:16]
+        first = self.count - len(self.pending) + 1
+        self.f.write(f"""
+-- chunk {chunk} (statements {first}-{self.count})
+BEGIN;
+DO {CHUNK_QUOTE}
+DECLARE
+    committed_hash TEXT;
+BEGIN
+    SELECT chunk_hash INTO committed_hash FROM import_runs WHERE run_id = '{self.run_id}' AND chunk = '{chunk}';
+    IF committed_hash = '{digest}' THEN
+        RETURN;
+    ELSIF committed_hash IS NOT NULL THEN
+        RAISE EXCEPTION 'import run {self.run_id}: chunk {chunk} was committed with different statements, generate the file under a new --run-id';
+    END IF;
+
+{body}
+    INSERT INTO import_runs (run_id, chunk, chunk_hash, statements)
+    VALUES ('{self.run_id}', '{chunk}', '{digest}', {len(self.pending)});
+END
+{CHUNK_QUOTE};
+COMMIT;
+""")
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class CopyBlock:
+    """A COPY ... FROM STDIN (csv) data block; rows are numbered by an ord column"""
+
+    def __init__(self, f, table, columns):
+        self.f = f
+        self.count = 0
+        f.write(f"COPY {table} (ord, {', '.join(columns)}) FROM STDIN WITH (FORMAT csv);\n")
+
+    def add(self, row):
+        self.count += 1
+        self.f.write(','.join(copy_field(v) for v in (self.count,) + tuple(row)) + '\n')
+
+    def close(self):
+        self.f.write("\\.\n\n")
+
+
+def spool():
+    """Temporary file for a section that is written later than it is produced"""
+    return tempfile.TemporaryFile('w+', encoding='utf-8')
+
+
+def append_spool(f, spooled):
+    """Copy a spooled section into the output file"""
+    spooled.seek(0)
+    shutil.copyfileobj(spooled, f)
@@ -0,0 +1,243 @@
+"""
+Vectorized clean/code stages for the Excel importers (--engine=vectorized)
+
+Produces the same records as the per-row stages in excel_import.py, but the
+quote escaping, NaN handling, numeric coercion, code generation and the
+multi-vendor explode ("Robu / Vyom" -> two rows) run as whole-column pandas
+operations on sheets read with pd.read_excel. Sheets are parsed in parallel
+worker processes when more than one CPU is available (read_sheets).
+"""
+
+import os
+import posixpath
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+import pandas as pd
+
+from excel_import import SHEETS, SKIP_REASONS, WORKBOOK, clean_number
+from import_report import NullReport
+
+XLSX_NS = {
+    'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'rel': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'pkg': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+
+# Workbook opened once per worker process (see _open_worker)
+_worker_book = None
+
+
+def sheet_sizes(path=WORKBOOK):
+    """Sheet name -> uncompressed XML size, in workbook order (a cheap proxy for parse cost)"""
+    with zipfile.ZipFile(path) as z:
+        book = ElementTree.fromstring(z.read('xl/workbook.xml'))
+        rels = ElementTree.fromstring(z.read('xl/_rels/workbook.xml.rels'))
+        targets = {rel.get('Id'): rel.get('Target') for rel in rels.findall('pkg:Relationship', XLSX_NS)}
+        sizes = {}
+        for sheet in book.findall('main:sheets/main:sheet', XLSX_NS):
+            target = targets[sheet.get(f"{{{XLSX_NS['rel']}}}id")]
+            member = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+            sizes[sheet.get('name')] = z.getinfo(member).file_size
+        return sizes
+
+
+def compact(df):
+    """Drop trailing all-empty rows and all-empty unnamed columns (row index is unchanged)"""
+    empty = [col for col in df.columns if str(col).startswith('Unnamed:') and df[col].isna().all()]
+    df = df.drop(columns=empty)
+    filled = df.notna().any(axis=1).to_numpy().nonzero()[0]
+    return df.iloc[:filled[-1] + 1] if len(filled) else df.iloc[:0]
+
+
+def read_sheet(xl, name):
+    """One sheet as a compact DataFrame, using the sheet's header row from SHEETS"""
+    return compact(pd.read_excel(xl, name, header=SHEETS.get(name, {}).get('header', 0)))
+
+
+def _open_worker(path):
+    global _worker_book
+    _worker_book = pd.ExcelFile(path)
+
+
+def _read_in_worker(name):
+    return read_sheet(_worker_book, name)
+
+
+def read_sheets(path=WORKBOOK, sheets=('RM', 'CombineSFG', 'S-BOM'), workers=None):
+    """
+    Read sheets into DataFrames using each sheet's header row.
+
+    Sheets are independent, so with more than one worker they are parsed in
+    a process pool (XML parsing is CPU-bound): each worker opens the workbook
+    once and takes the largest remaining sheet next. workers defaults to the
+    CPU count; 1 reads in this process. Under the 'spawn' start method
+    (Windows, macOS) the workers re-import the calling script, so it must keep
+    its run behind an `if __name__ == '__main__'` guard.
+    """
+    sheets = list(sheets)
+    workers = min(workers or os.cpu_count() or 1, len(sheets))
+    if workers <= 1:
+        with pd.ExcelFile(path) as xl:
+            return {name: read_sheet(xl, name) for name in sheets}
+
+    sizes = sheet_sizes(path)
+    missing = [name for name in sheets if name not in sizes]
+    if missing:
+        raise ValueError(f"Worksheet(s) not found: {', '.join(missing)}")
+    with ProcessPoolExecutor(workers, initializer=_open_worker, initargs=(path,)) as pool:
+        futures = {name: pool.submit(_read_in_worker, name) for name in sorted(sheets, key=sizes.get, reverse=True)}
+        return {name: futures[name].result() for name in sheets}
+
+
+def read_workbook(path=WORKBOOK, workers=None):
+    """Every sheet of the workbook (see read_sheets)"""
+    return read_sheets(path, sheet_sizes(path), workers)
+
+
+def clean_string_col(s):
+    """clean_string() for a column: strip, escape quotes, NaN/empty -> None"""
+    text = s.astype(str).str.strip().str.replace("'", "''", regex=False).astype(object)
+    return text.where(s.notna() & text.ne(''), None)
+
+
+def clean_number_col(s, default):
+    """`clean_number(n) or default` for a column (0 and unparseable -> default)"""
+    num = pd.to_numeric(s, errors='coerce').astype(float)
+    # float() accepts a few spellings to_numeric() rejects ('1_000', ' 1e3 ', ...)
+    leftover = num.isna() & s.notna()
+    if leftover.any():
+        num[leftover] = s[leftover].map(clean_number).astype(float)
+    return num.astype(object).where(num.notna() & num.ne(0), default)
+
+
+def generate_item_code_col(names, index):
+    """generate_item_code() for a column of names and their row indexes"""
+    words = names.str.replace(r'[^a-zA-Z0-9\s]', '', regex=True).str.upper().str.split().str[:3]
+    code = words.str.join('-')
+    fallback = 'ITEM-' + pd.Series(index, index=names.index).astype(str).str.zfill(4)
+    return code.where(code.ne(''), fallback).str[:50].astype(object)
+
+
+def generate_code_col(names):
+    """generate_code() for a column of vendor names"""
+    return names.str.upper().str.replace(' ', '_', regex=False).str.replace(r'[^a-zA-Z0-9]', '', regex=True).str[:20]
+
+
+def split_vendors_col(s):
+    """split_vendors() as an explode: one row per vendor, indexed by the source row"""
+    vendors = s.dropna().astype(str).str.split(r'[/,]', regex=True).explode().str.strip()
+    return vendors[vendors.notna() & vendors.ne('')]
+
+
+class FrameSource:
+    """Vectorized engine: whole-column stages over DataFrames (same records as StreamSource)"""
+
+    def __init__(self, path=WORKBOOK, workers=None, cache_dir=None, report=None):
+        self.report = report or NullReport()
+        sheets = ('RM', 'CombineSFG', 'S-BOM')
+        with self.report.stage('read') as stage:
+            if cache_dir:
+                from parse_cache import ParseCache
+                self.cache = ParseCache(path, cache_dir)
+                self.frames = self.cache.read_sheets(sheets, workers)
+            else:
+                self.cache = None
+                self.frames = read_sheets(path, sheets, workers)
+            stage.rows_in += sum(len(df) for df in self.frames.values())
+            stage.rows_out = stage.rows_in
+
+    def _cleaned(self, sheet, out, keep):
+        """Count the clean stage for one sheet (keep: mask of rows that survive)"""
+        stage = self.report.get('clean')
+        stage.rows_in += len(keep)
+        stage.rows_out += int(keep.sum())
+        if not keep.all():
+            stage.skip(SKIP_REASONS[sheet], int((~keep).sum()))
+        return out[keep]
+
+    def _records(self, out):
+        with self.report.stage('code') as stage:
+            records = out.to_dict('records')
+            stage.rows_in += len(records)
+            stage.rows_out += len(records)
+        return iter(records)
+
+    def suppliers(self):
+        """Unique raw SUPPLIER values in first-seen order"""
+        with self.report.stage('vendor split') as stage:
+            values = self.frames['RM']['SUPPLIER'].dropna()
+            suppliers = list(values.unique())
+            stage.rows_in += len(values)
+            stage.rows_out = len(suppliers)
+        return suppliers
+
+    def vendor_names(self):
+        """Sorted unique vendor names after splitting multi-vendor entries"""
+        with self.report.stage('vendor split') as stage:
+            supplier = self.frames['RM']['SUPPLIER']
+            names = sorted(set(split_vendors_col(supplier)))
+            stage.rows_in += int(supplier.notna().sum())
+            stage.rows_out = len(names)
+        return names
+
+    def vendor_codes(self, names):
+        """Vendor name -> generated vendor code"""
+        names = pd.Series(names, dtype=object)
+        names = names[clean_string_col(names).notna()]
+        return dict(zip(names, generate_code_col(names.astype(str))))
+
+    def rm_records(self):
+        df = self.frames['RM']
+        with self.report.stage('clean'):
+            name = clean_string_col(df['RAW MATERIAL NAME'])
+            supplier = clean_string_col(df['SUPPLIER'])
+            links = split_vendors_col(supplier).groupby(level=0).agg(list)
+            out = self._cleaned('RM', pd.DataFrame({
+                'index': df.index,
+                'name': name,
+                'uom': clean_string_col(df['UNIT OF MEASURE']).where(lambda c: c.notna(), 'PCS'),
+                'cost': clean_number_col(df['COST'], 0),
+                'supplier': supplier,
+                'vendors': links.reindex(df.index),
+                'current_stock': clean_number_col(df['Current Stock'], 0),
+                'part_number': clean_string_col(df['PART #']),
+            }), name.notna())
+            out['vendors'] = out['vendors'].map(lambda v: v if isinstance(v, list) else [])
+        with self.report.stage('code'):
+            out['code'] = generate_item_code_col(out['name'], out['index'] + SHEETS['RM']['code_offset'])
+        return self._records(out)
+
+    def sfg_records(self):
+        df = self.frames['CombineSFG']
+        with self.report.stage('clean'):
+            name = clean_string_col(df['SEMI FINISHED GOODS'])
+            out = self._cleaned('CombineSFG', pd.DataFrame({
+                'index': df.index,
+                'name': name,
+                'uom': clean_string_col(df['UoM']).where(lambda c: c.notna(), 'PCS'),
+            }), name.notna() & name.ne('nan'))
+        with self.report.stage('code'):
+            out['code'] = generate_item_code_col(out['name'], out['index'] + SHEETS['CombineSFG']['code_offset'])
+        return self._records(out)
+
+    def bom_records(self):
+        df = self.frames['S-BOM']
+        with self.report.stage('clean'):
+            assembly = clean_string_col(df['SUB ASSEMBLY NAME'])
+            rm_name = clean_string_col(df['RAW MATERIAL NAME'])
+            rm_name = rm_name.where(rm_name.ne('nan'), None)
+            has_rm = rm_name.notna()
+            out = self._cleaned('S-BOM', pd.DataFrame({
+                'index': df.index,
+                'assembly_name': assembly,
+                'rm_name': rm_name,
+                'quantity': clean_number_col(df['UNITS'], 1).where(has_rm, None),
+                'uom': clean_string_col(df['UoM']).where(lambda c: c.notna(), 'PCS').where(has_rm, None),
+            }), assembly.notna() & assembly.ne('nan'))
+        with self.report.stage('code'):
+            out['new_assembly'] = out['assembly_name'].ne(out['assembly_name'].shift())
+            codes = generate_item_code_col(out['assembly_name'], out['index'] + SHEETS['S-BOM']['code_offset'])
+            out['assembly_code'] = codes.where(out['new_assembly']).ffill()
+        return self._records(out)
@@ -0,0 +1,225 @@
+"""
+Export live stock and masters to a workbook in the Stock List layout
+
+Writes the RM, Inv, FG and GRN sheets of Stock List 2024-2025.xlsx, with the
+same title and header rows, from items, stock_entries, item_vendors / vendors
+and grns / grn_items:
+
+    RM    raw materials: PART # (item code), UoM, COST (priority-1 vendor
+          price), SUPPLIER (vendors by priority, "A / B"), Current Stock (on
+          hand) and Stock as on today (available)
+    Inv   every active item with its last purchase (date, rate) and today's
+          available stock
+    FG    finished goods
+    GRN   one row per received GRN line
+
+Each sheet is one query read through a server-side cursor (--fetch rows per
+round trip) and appended to an openpyxl write-only workbook, which spools
+rows to a temp file; stock is summed per item in Postgres. Memory stays flat
+however many stock rows there are. The RM sheet reads back through the
+importers, so an export can be edited in Excel and imported again.
+
+Usage:
+    python scripts/export_stock_list.py --dsn "$DATABASE_URL" [--tenant TENANT_ID]
+    python scripts/export_stock_list.py --dsn "$DATABASE_URL" --output stock-2025-06.xlsx --sheets RM GRN
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from erp_db import ACCEPTED_COLUMNS, PRICE_COLUMNS, TENANT, column, stream  # noqa: E402
+from excel_import import FG_HEADER, RM_HEADER  # noqa: E402
+from import_report import peak_rss_mb  # noqa: E402
+
+OUTPUT = 'stock-list-export.xlsx'
+FETCH = 2000
+
+INV_TITLE = [None, None, 'Excess stock', 'Normal Stock', '30-10% Stock', None, 'Below 10%', 'LAST PURCHASE', None,
+             'TODAY']
+INV_HEADER = ['S.No.', 'Item Code', 'Description', 'Avg monthly consumption', 'Lead Time', 'Safety Factor',
+              'MAX Level']
+GRN_HEADER = ['RECEIVED DATE', 'SUPPLIER NAME', 'BILL NO', 'RAW MATERIAL', 'QUANTITY', 'COST', 'NOTES']
+
+STOCK = f"""
+    LEFT JOIN (
+        SELECT item_id, SUM(quantity) AS on_hand, SUM(available_quantity) AS available
+        FROM stock_entries se
+        WHERE {TENANT.format(alias='se')}
+        GROUP BY item_id
+    ) s ON s.item_id = i.id"""
+
+RM_SQL = f"""
+    SELECT i.name, s.available, i.code, i.uom, v.price, v.suppliers, s.on_hand
+    FROM items i
+    {STOCK}
+    LEFT JOIN LATERAL (
+        SELECT string_agg(v.name, ' / ' ORDER BY iv.priority, v.name) AS suppliers,
+               (array_agg(iv.unit_price ORDER BY iv.priority) FILTER (WHERE iv.unit_price IS NOT NULL))[1] AS price
+        FROM item_vendors iv
+        JOIN vendors v ON v.id = iv.vendor_id
+        WHERE iv.item_id = i.id AND iv.is_active
+    ) v ON true
+    WHERE i.type = 'RAW_MATERIAL' AND i.is_active AND {TENANT.format(alias='i')}
+    ORDER BY i.code"""
+
+LAST_PURCHASE = """
+    LEFT JOIN LATERAL (
+        SELECT g.receipt_date, {price} AS unit_price
+        FROM grn_items gi
+        JOIN grns g ON g.id = gi.grn_id
+        WHERE gi.item_id = i.id AND g.status <> 'CANCELLED'
+        ORDER BY g.receipt_date DESC, g.created_at DESC
+        LIMIT 1
+    ) p ON true"""
+
+INV_SQL = """
+    SELECT i.code, i.name, {purchase}, s.available
+    FROM items i
+    {stock}
+    {join}
+    WHERE i.is_active AND {tenant}
+    ORDER BY i.code"""
+
+FG_SQL = f"""
+    SELECT i.name, i.code, i.uom, NULL
+    FROM items i
+    WHERE i.type = 'FINISHED_GOODS' AND i.is_active AND {TENANT.format(alias='i')}
+    ORDER BY i.code"""
+
+GRN_SQL = f"""
+    SELECT g.receipt_date, v.name, g.invoice_number, i.name, {{accepted}}, {{price}},
+           concat_ws('; ', g.grn_number, gi.batch_number, gi.notes)
+    FROM grns g
+    JOIN grn_items gi ON gi.grn_id = g.id
+    JOIN items i ON i.id = gi.item_id
+    LEFT JOIN vendors v ON v.id = g.vendor_id
+    WHERE g.status <> 'CANCELLED' AND {TENANT.format(alias='g')}
+    ORDER BY g.receipt_date, g.grn_number, gi.created_at"""
+
+SHEETS = ('RM', 'Inv', 'FG', 'GRN')
+
+
+def number(value):
+    return None if value is None else float(value)
+
+
+def grn_columns(conn) -> dict[str, str]:
+    """grn_items accepted quantity and price expressions, NULL for a column this database lacks"""
+    with conn.cursor() as cur:
+        accepted = column(cur, 'grn_items', ACCEPTED_COLUMNS)
+        price = column(cur, 'grn_items', PRICE_COLUMNS)
+    return {'accepted': f"gi.{accepted}" if accepted else 'NULL', 'price': f"gi.{price}" if price else 'NULL'}
+
+
+def has_grns(conn) -> bool:
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass('grns') IS NOT NULL AND to_regclass('grn_items') IS NOT NULL")
+        return cur.fetchone()[0]
+
+
+# =============================================================================
+# SHEETS (each appends its rows and returns how many)
+# =============================================================================
+
+def write_rm(ws, rows) -> int:
+    ws.append([None, 'RAW MATERIALS'])
+    ws.append(RM_HEADER)
+    n = 0
+    for n, (name, available, code, uom, price, suppliers, on_hand) in enumerate(rows, start=1):
+        ws.append([n, name, number(available), None, None, code, uom, number(price), suppliers,
+                   None, None, None, number(on_hand)])
+    return n
+
+
+def write_inv(ws, rows, today: date) -> int:
+    ws.append(INV_TITLE + [today])
+    ws.append(INV_HEADER)
+    ws.append([None] * 7 + ['Date', 'Rate'])
+    n = 0
+    for n, (code, name, purchased, rate, available) in enumerate(rows, start=1):
+        ws.append([n, code, name, None, None, None, None, purchased, number(rate), number(available)])
+    return n
+
+
+def write_fg(ws, rows) -> int:
+    ws.append([None, 'FINISHED GOODS NAME SHEET'])
+    ws.append(FG_HEADER)
+    n = 0
+    for n, (name, code, uom, description) in enumerate(rows, start=1):
+        ws.append([n, name, code, uom, description])
+    return n
+
+
+def write_grn(ws, rows) -> int:
+    ws.append(['GOODS RECEIVED SHEET'])
+    ws.append(GRN_HEADER)
+    n = 0
+    for n, (received, supplier, bill, item, quantity, cost, notes) in enumerate(rows, start=1):
+        ws.append([received, supplier, bill, item, number(quantity), number(cost), notes])
+    return n
+
+
+def export(dsn: str, path: str = OUTPUT, tenant_id: str | None = None, sheets=SHEETS, fetch: int = FETCH,
+           log=print) -> dict[str, int]:
+    """Write the workbook; returns rows written per sheet"""
+    import psycopg2
+    from openpyxl import Workbook
+
+    params = {'tenant': tenant_id}
+    wb = Workbook(write_only=True)
+    written = {}
+    with psycopg2.connect(dsn) as conn:
+        grns = has_grns(conn)
+        if not grns and ('GRN' in sheets or 'Inv' in sheets):
+            log("-- no grns / grn_items tables: GRN sheet and Inv last purchase left empty")
+        grn = grn_columns(conn) if grns else {}
+        for name in SHEETS:
+            if name not in sheets:
+                continue
+            ws = wb.create_sheet(name)
+            cursor = f"export_{name.lower()}"
+            start = time.perf_counter()
+            if name == 'RM':
+                written[name] = write_rm(ws, stream(conn, cursor, RM_SQL, params, fetch))
+            elif name == 'Inv':
+                sql = INV_SQL.format(purchase='p.receipt_date, p.unit_price' if grns else 'NULL, NULL',
+                                     stock=STOCK, join=LAST_PURCHASE.format(**grn) if grns else '',
+                                     tenant=TENANT.format(alias='i'))
+                written[name] = write_inv(ws, stream(conn, cursor, sql, params, fetch), date.today())
+            elif name == 'FG':
+                written[name] = write_fg(ws, stream(conn, cursor, FG_SQL, params, fetch))
+            else:
+                written[name] = write_grn(ws, stream(conn, cursor, GRN_SQL.format(**grn), params, fetch) if grns else ())
+            log(f"   {name:<4} {written[name]:>8} rows  {time.perf_counter() - start:7.2f}s  "
+                f"peak RSS {peak_rss_mb()} MB")
+
+    tmp = path + '.tmp'
+    wb.save(tmp)
+    os.replace(tmp, path)
+    return written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True, help='Postgres database to export from')
+    parser.add_argument('--tenant', help='Tenant id to export (default: all rows)')
+    parser.add_argument('--output', default=OUTPUT, help=f'Workbook to write (default {OUTPUT})')
+    parser.add_argument('--sheets', nargs='+', choices=SHEETS, default=list(SHEETS), help='Sheets to write')
+    parser.add_argument('--fetch', type=int, default=FETCH, help='Rows per server-side cursor round trip')
+    args = parser.parse_args()
+    if args.fetch < 1:
+        parser.error('--fetch must be at least 1')
+
+    print(f"Exporting {', '.join(args.sheets)} to {args.output}")
+    written = export(args.dsn, args.output, args.tenant, args.sheets, args.fetch)
+    print(f"✅ {sum(written.values())} rows written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,283 @@
+"""
+Set-based loading for generate-import-sql-v2.py
+
+Every sheet is staged into temp tables, tenant and warehouse are resolved
+once, and each target table is loaded with one MERGE. The staging rows can be
+written to a file as COPY blocks (--mode=bulk, run with psql) or sent straight
+to Postgres with batched parameterized inserts (--apply DSN).
+"""
+
+import time
+
+from excel_import import CopyBlock, append_spool, spool, unquote
+
+# Staging table -> columns (every table also gets an ord column for "first occurrence wins")
+STAGING_TABLES = {
+    'stage_vendors': [('code', 'TEXT'), ('name', 'TEXT')],
+    'stage_items': [('code', 'TEXT'), ('name', 'TEXT'), ('type', 'TEXT'), ('uom', 'TEXT')],
+    'stage_item_vendors': [('item_code', 'TEXT'), ('vendor_code', 'TEXT'), ('priority', 'INT'), ('unit_price', 'NUMERIC')],
+    'stage_bom_headers': [('assembly_name', 'TEXT')],
+    'stage_bom_items': [('assembly_name', 'TEXT'), ('component_name', 'TEXT'), ('quantity', 'NUMERIC')],
+    'stage_stock': [('item_code', 'TEXT'), ('quantity', 'NUMERIC')],
+}
+
+
+
+def context_sql(tenant_id=None, on_commit_drop=True):
+    """
+    import_ctx: the tenant (the first one without tenant_id) and its warehouse,
+    resolved once per import. A tenant_id that does not exist raises.
+    """
+    tenant = f"SELECT id FROM tenants WHERE id = '{tenant_id}'" if tenant_id else "SELECT id FROM tenants LIMIT 1"
+    sql = f"""CREATE TEMP TABLE import_ctx{' ON COMMIT DROP' if on_commit_drop else ''} AS
+SELECT t.id AS tenant_id,
+       (SELECT w.id FROM warehouses w WHERE w.tenant_id = t.id LIMIT 1) AS warehouse_id
+FROM ({tenant}) t;
+"""
+    if tenant_id:
+        sql += f"""DO $$ BEGIN
+    IF NOT EXISTS (SELECT 1 FROM import_ctx) THEN
+        RAISE EXCEPTION 'tenant {tenant_id} not found';
+    END IF;
+END $$;
+"""
+    return sql
+
+# Target table -> MERGE (first occurrence of a code wins, as in statement mode)
+MERGES = {
+    'vendors': """MERGE INTO vendors v
+USING (
+    SELECT DISTINCT ON (s.code) c.tenant_id, s.code, s.name
+    FROM stage_vendors s CROSS JOIN import_ctx c
+    ORDER BY s.code, s.ord
+) s
+ON v.tenant_id = s.tenant_id AND v.code = s.code
+WHEN NOT MATCHED THEN
+    INSERT (tenant_id, code, name, legal_name, is_active, created_at, updated_at)
+    VALUES (s.tenant_id, s.code, s.name, s.name, true, NOW(), NOW());
+""",
+    'items': """MERGE INTO items i
+USING (
+    SELECT DISTINCT ON (s.code) c.tenant_id, s.code, s.name, s.type::item_type AS type, s.uom
+    FROM stage_items s CROSS JOIN import_ctx c
+    ORDER BY s.code, s.ord
+) s
+ON i.tenant_id = s.tenant_id AND i.code = s.code
+WHEN NOT MATCHED THEN
+    INSERT (tenant_id, code, name, type, uom, is_active, created_at, updated_at)
+    VALUES (s.tenant_id, s.code, s.name, s.type, s.uom, true, NOW(), NOW());
+""",
+    'item_vendors': """MERGE INTO item_vendors iv
+USING (
+    SELECT DISTINCT ON (i.id, v.id) i.id AS item_id, v.id AS vendor_id, s.priority, s.unit_price
+    FROM stage_item_vendors s
+    CROSS JOIN import_ctx c
+    JOIN items i ON i.tenant_id = c.tenant_id AND i.code = s.item_code
+    JOIN vendors v ON v.tenant_id = c.tenant_id AND v.code = s.vendor_code
+    ORDER BY i.id, v.id, s.ord
+) s
+ON iv.item_id = s.item_id AND iv.vendor_id = s.vendor_id
+WHEN NOT MATCHED THEN
+    INSERT (item_id, vendor_id, priority, unit_price, is_active, created_at, updated_at)
+    VALUES (s.item_id, s.vendor_id, s.priority, s.unit_price, true, NOW(), NOW());
+""",
+    'bom_headers': """MERGE INTO bom_headers bh
+USING (
+    SELECT DISTINCT ON (i.id) c.tenant_id, i.id AS item_id
+    FROM stage_bom_headers s
+    CROSS JOIN import_ctx c
+    JOIN items i ON i.tenant_id = c.tenant_id AND i.name = s.assembly_name
+                AND i.type IN ('SUB_ASSEMBLY'::item_type, 'FINISHED_GOODS'::item_type)
+    ORDER BY i.id, s.ord
+) s
+ON bh.item_id = s.item_id
+WHEN NOT MATCHED THEN
+    INSERT (tenant_id, item_id, version, is_active, created_at, updated_at)
+    VALUES (s.tenant_id, s.item_id, 1, true, NOW(), NOW());
+""",
+    'bom_items': """MERGE INTO bom_items bi
+USING (
+    SELECT DISTINCT ON (bh.id, i.id) bh.id AS bom_id, i.id AS item_id, s.quantity
+    FROM stage_bom_items s
+    CROSS JOIN import_ctx c
+    JOIN items a ON a.tenant_id = c.tenant_id AND a.name = s.assembly_name AND a.type = 'SUB_ASSEMBLY'::item_type
+    JOIN bom_headers bh ON bh.item_id = a.id
+    JOIN items i ON i.tenant_id = c.tenant_id AND i.name = s.component_name
+    ORDER BY bh.id, i.id, s.ord
+) s
+ON bi.bom_id = s.bom_id AND bi.item_id = s.item_id
+WHEN NOT MATCHED THEN
+    INSERT (bom_id, item_id, quantity, created_at)
+    VALUES (s.bom_id, s.item_id, s.quantity, NOW());
+""",
+    'stock_entries': """MERGE INTO stock_entries se
+USING (
+    SELECT DISTINCT ON (i.id) c.tenant_id, i.id AS item_id, c.warehouse_id, s.quantity
+    FROM stage_stock s
+    CROSS JOIN import_ctx c
+    JOIN items i ON i.tenant_id = c.tenant_id AND i.code = s.item_code
+    ORDER BY i.id, s.ord
+) s
+ON se.item_id = s.item_id AND se.warehouse_id = s.warehouse_id
+WHEN NOT MATCHED THEN
+    INSERT (tenant_id, item_id, warehouse_id, quantity, available_quantity, allocated_quantity, created_at, updated_at)
+    VALUES (s.tenant_id, s.item_id, s.warehouse_id, s.quantity, s.quantity, 0, NOW(), NOW());
+""",
+}
+
+
+def staging_ddl():
+    """CREATE TEMP TABLE statements for all staging tables (dropped at COMMIT)"""
+    lines = []
+    for table, columns in STAGING_TABLES.items():
+        cols = ', '.join(['ord INT'] + [f"{name} {type_}" for name, type_ in columns])
+        lines.append(f"CREATE TEMP TABLE {table} ({cols}) ON COMMIT DROP;")
+    return '\n'.join(lines) + '\n'
+
+
+def stage_rows(source, vendor_map, open_stage):
+    """
+    Feed every staging table from the record source.
+
+    open_stage(table) returns a sink with add(row) / close(); rows are raw
+    (unescaped) values. Returns rows staged per table.
+    """
+    sinks = {table: open_stage(table) for table in STAGING_TABLES}
+
+    for vendor, vendor_code in vendor_map.items():
+        sinks['stage_vendors'].add((vendor_code, vendor))
+
+    for rec in source.rm_records():
+        sinks['stage_items'].add((rec['code'], unquote(rec['name']), 'RAW_MATERIAL', unquote(rec['uom'])))
+        for priority, vendor_name in enumerate(rec['vendors'], start=1):
+            vendor_code = vendor_map.get(vendor_name)
+            if vendor_code:
+                sinks['stage_item_vendors'].add(
+                    (rec['code'], vendor_code, priority, rec['cost'] if priority == 1 else None))
+        if rec['current_stock'] > 0:
+            sinks['stage_stock'].add((rec['code'], rec['current_stock']))
+
+    for rec in source.sfg_records():
+        sinks['stage_items'].add((rec['code'], unquote(rec['name']), 'SUB_ASSEMBLY', unquote(rec['uom'])))
+
+    for rec in source.bom_records():
+        if rec['new_assembly']:
+            sinks['stage_bom_headers'].add((unquote(rec['assembly_name']),))
+        if rec['rm_name']:
+            sinks['stage_bom_items'].add((unquote(rec['assembly_name']), unquote(rec['rm_name']), rec['quantity']))
+
+    for sink in sinks.values():
+        sink.close()
+    return {table: sink.count for table, sink in sinks.items()}
+
+
+def write_bulk(f, source, vendor_map, tenant_id=None):
+    """--mode=bulk: staging DDL, one COPY block per staging table, then the MERGEs"""
+    f.write("-- ============================================================================\n")
+    f.write("-- STAGING TABLES (dropped at COMMIT)\n")
+    f.write("-- ============================================================================\n\n")
+    f.write(staging_ddl())
+    f.write("\n")
+
+    spools = {table: spool() for table in STAGING_TABLES}
+    try:
+        counts = stage_rows(source, vendor_map, lambda table: CopyBlock(
+            spools[table], table, [name for name, _ in STAGING_TABLES[table]]))
+        for table in STAGING_TABLES:
+            append_spool(f, spools[table])
+    finally:
+        for spooled in spools.values():
+            spooled.close()
+
+    f.write("-- ============================================================================\n")
+    f.write("-- RESOLVE TENANT AND WAREHOUSE ONCE\n")
+    f.write("-- ============================================================================\n\n")
+    f.write(context_sql(tenant_id))
+    f.write("\n")
+    f.write("-- ============================================================================\n")
+    f.write("-- SET-BASED LOAD (first occurrence of a code wins, as in statement mode)\n")
+    f.write("-- ============================================================================\n\n")
+    for sql in MERGES.values():
+        f.write(sql)
+        f.write("\n")
+    return counts
+
+
+# =============================================================================
+# --apply DSN: straight to Postgres
+# =============================================================================
+
+class TableSink:
+    """Buffers staging rows and sends them with execute_values() in batches"""
+
+    def __init__(self, cur, table, batch_size):
+        from psycopg2.extras import execute_values
+
+        self.execute_values = execute_values
+        self.cur = cur
+        self.sql = f"INSERT INTO {table} (ord, {', '.join(name for name, _ in STAGING_TABLES[table])}) VALUES %s"
+        self.batch_size = batch_size
+        self.batch = []
+        self.count = 0
+        self.seconds = 0.0
+
+    def add(self, row):
+        self.count += 1
+        self.batch.append((self.count,) + tuple(row))
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.batch:
+            start = time.perf_counter()
+            self.execute_values(self.cur, self.sql, self.batch, page_size=self.batch_size)
+            self.seconds += time.perf_counter() - start
+            self.batch = []
+
+    def close(self):
+        self.flush()
+
+
+def connect(dsn):
+    """The one connection an import runs on (everything is one transaction)"""
+    try:
+        import psycopg2
+    except ImportError:
+        raise SystemExit("--apply needs psycopg2: pip install psycopg2-binary")
+    return psycopg2.connect(dsn)
+
+
+def rate(rows, seconds):
+    return f"{rows / seconds:,.0f} rows/s" if seconds > 0 else "-"
+
+
+def apply_import(conn, source, vendor_map, batch_size=1000, log=print, tenant_id=None):
+    """
+    Stage and MERGE everything in one transaction on conn (into tenant_id,
+    or the first tenant).
+
+    Values are bound by psycopg2, nothing is SQL-escaped by hand. Returns
+    {table: (rows, seconds)} for the staging loads and the MERGEs.
+    """
+    stats = {}
+    with conn, conn.cursor() as cur:
+        cur.execute(staging_ddl())
+        sinks = {}
+
+        def open_stage(table):
+            sinks[table] = TableSink(cur, table, batch_size)
+            return sinks[table]
+
+        stage_rows(source, vendor_map, open_stage)
+        for table, sink in sinks.items():
+            stats[table] = (sink.count, sink.seconds)
+            log(f"   {table:<20} {sink.count:>7} rows  {sink.seconds:6.2f}s  {rate(sink.count, sink.seconds)}")
+
+        cur.execute(context_sql(tenant_id))
+        for table, sql in MERGES.items():
+            start = time.perf_counter()
+            cur.execute(sql)
+            seconds = time.perf_counter() - start
+            stats[table] = (cur.rowcount, seconds)
+            log(f"   {table:<20} {cur.rowcount:>7} rows  {seconds:6.2f}s  {rate(cur.rowcount, seconds)}")
+    return stats
@@ -0,0 +1,104 @@
+"""
+Delta manifest for generate-import-sql-v2.py --delta
+
+Stores a content hash per imported row, keyed by vendor code, item code,
+(item code, vendor code) link, stock item code, BOM assembly and
+(assembly, component) BOM line. The next run compares against it and only
+emits SQL for inserted, changed and removed rows. Removed rows are kept as
+tombstones, so a row that comes back later is restored (reactivated, its stock
+put back) rather than inserted, which the WHERE NOT EXISTS inserts would skip.
+"""
+
+import hashlib
+import json
+import os
+from collections import Counter
+from datetime import datetime
+
+MANIFEST = 'import-manifest.json'
+
+# Row kinds, in the order their removals are applied (children first)
+KINDS = ('bom_item', 'item_vendor', 'stock', 'bom_header', 'item', 'vendor')
+
+
+def content_hash(fields):
+    """Stable short hash of a row's imported values"""
+    data = json.dumps(fields, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()[:16]
+
+
+def row_key(key):
+    """Manifest key: plain string, or a JSON array for composite keys"""
+    return json.dumps(list(key), ensure_ascii=False) if isinstance(key, tuple) else key
+
+
+def parse_key(key):
+    return tuple(json.loads(key)) if key.startswith('[') else key
+
+
+class Manifest:
+    """Per-row hashes of the previous run (read) and of this run (collected)"""
+
+    def __init__(self, path=MANIFEST):
+        self.path = path
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        self.previous = data.get('rows', {})
+        self.tombstones = data.get('removed', {})
+        self.rows = {kind: {} for kind in KINDS}
+        self.counts = Counter()
+
+    def change(self, kind, key, fields, **keep):
+        """
+        Record a row of this run and classify it against the previous run.
+
+        Returns 'insert', 'update', 'restore' (removed by an earlier run and
+        back now) or None (unchanged, or a repeated key: the first occurrence
+        wins, as with the WHERE NOT EXISTS inserts). Extra
+        keyword values are stored with the hash (e.g. the stock quantity, to
+        apply changes as a difference later).
+        """
+        key = row_key(key)
+        if key in self.rows[kind]:
+            return None
+        entry = {'hash': content_hash(fields), **keep}
+        self.rows[kind][key] = entry
+        old = self.previous.get(kind, {}).get(key)
+        if old is None:
+            action = 'restore' if key in self.tombstones.get(kind, {}) else 'insert'
+        elif old['hash'] != entry['hash']:
+            action = 'update'
+        else:
+            return None
+        self.counts[action] += 1
+        return action
+
+    def old(self, kind, key):
+        """Previous entry for a row (None if it is new)"""
+        return self.previous.get(kind, {}).get(row_key(key))
+
+    def removed(self, kind):
+        """(key, previous entry) for rows of the previous run missing from this one"""
+        for key, entry in self.previous.get(kind, {}).items():
+            if key not in self.rows[kind]:
+                self.counts['delete'] += 1
+                yield parse_key(key), entry
+
+    def save(self, workbook):
+        # Tombstones: rows removed by this run or an earlier one that are still absent
+        removed = {kind: {key: entry
+                          for rows in (self.tombstones.get(kind, {}), self.previous.get(kind, {}))
+                          for key, entry in rows.items() if key not in self.rows[kind]}
+                   for kind in KINDS}
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated': datetime.now().isoformat(timespec='seconds'),
+                'workbook': os.path.basename(workbook),
+                'rows': self.rows,
+                'removed': removed,
+            }, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.path)
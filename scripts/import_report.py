@@ -0,0 +1,232 @@
+"""
+Per-stage instrumentation for the Excel importers (--report, --profile)
+
+Stages are timed exclusively: the record stages are chained generators, so
+the time spent inside a nested stage (e.g. read, while clean pulls its next
+row) is charged to that stage and not to the one that called it. Each stage
+counts rows in, rows out and skipped rows by reason; the report adds
+rows/sec, bytes written and peak RSS, and is saved as JSON next to the
+other import logs (import-log.json).
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+REPORT = 'import-report.json'
+PROFILE = 'import-profile.prof'
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far (None where getrusage is missing)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def iso_now():
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+class Stage:
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.rows_in = 0
+        self.rows_out = 0
+        self.skipped = Counter()
+        self.bytes = 0
+        self.peak_rss_mb = None
+
+    def skip(self, reason, n=1):
+        self.skipped[reason] += n
+
+    def to_json(self):
+        rows = max(self.rows_in, self.rows_out)
+        data = {
+            'seconds': round(self.seconds, 4),
+            'rowsIn': self.rows_in,
+            'rowsOut': self.rows_out,
+            'skipped': dict(self.skipped),
+            'rowsPerSec': round(rows / self.seconds) if self.seconds > 0 and rows else None,
+            'peakRssMb': self.peak_rss_mb,
+        }
+        if self.bytes:
+            data['bytes'] = self.bytes
+            data['mbPerSec'] = round(self.bytes / 1e6 / self.seconds, 1) if self.seconds > 0 else None
+        return data
+
+
+class NullStage:
+    """Stand-in when instrumentation is off: every counter update is a no-op"""
+
+    rows_in = rows_out = bytes = 0
+
+    def __setattr__(self, name, value):
+        pass
+
+    def skip(self, reason, n=1):
+        pass
+
+
+class RunReport:
+    """Stages of one importer run, in first-use order"""
+
+    def __init__(self, **info):
+        self.info = info
+        self.start = iso_now()
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.totals = {}
+        self._stack = []
+        self._mark = 0.0
+
+    def get(self, name):
+        if name not in self.stages:
+            self.stages[name] = Stage(name)
+        return self.stages[name]
+
+    def _enter(self, stage):
+        now = time.perf_counter()
+        if self._stack:
+            self._stack[-1].seconds += now - self._mark
+        self._stack.append(stage)
+        self._mark = now
+
+    def _exit(self):
+        now = time.perf_counter()
+        stage = self._stack.pop()
+        stage.seconds += now - self._mark
+        self._mark = now
+        return stage
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block as `name` (exclusive of stages entered inside it)"""
+        stage = self.get(name)
+        self._enter(stage)
+        try:
+            yield stage
+        finally:
+            self._exit().peak_rss_mb = peak_rss_mb()
+
+    def timed(self, name, iterable, count_in=False):
+        """
+        Wrap a generator stage: time spent producing each item is charged to
+        `name` and every item counts as a row out (and in, with count_in).
+        """
+        stage = self.get(name)
+        iterator = iter(iterable)
+        while True:
+            self._enter(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self._exit().peak_rss_mb = peak_rss_mb()
+                return
+            except BaseException:
+                self._exit()
+                raise
+            self._exit()
+            stage.rows_out += 1
+            if count_in:
+                stage.rows_in += 1
+            yield item
+
+    def writer(self, f, name='write'):
+        return CountingWriter(self, f, name)
+
+    def to_json(self):
+        seconds = time.perf_counter() - self.started
+        return {
+            'startTime': self.start,
+            'endTime': iso_now(),
+            **self.info,
+            'seconds': round(seconds, 4),
+            'peakRssMb': peak_rss_mb(),
+            'bytesWritten': sum(stage.bytes for stage in self.stages.values()),
+            'stages': {name: stage.to_json() for name, stage in self.stages.items()},
+            'totals': self.totals,
+        }
+
+    def save(self, path=REPORT):
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def summary(self):
+        """One line per stage for the console"""
+        lines = []
+        for name, stage in self.stages.items():
+            data = stage.to_json()
+            rate = f"{data['rowsPerSec']:>9,} rows/s" if data['rowsPerSec'] else ' ' * 16
+            if stage.bytes:
+                rate = f"{stage.bytes / 1e6:>9.2f} MB     "
+            skipped = ', '.join(f"{reason}: {n}" for reason, n in stage.skipped.items())
+            lines.append(f"   {name:<14} {stage.seconds:8.3f}s  {stage.rows_in:>7} in  {stage.rows_out:>7} out  "
+                         f"{rate}{'  ' + skipped if skipped else ''}")
+        return '\n'.join(lines)
+
+
+class NullReport:
+    """Instrumentation off: stages pass through untouched"""
+
+    def get(self, name):
+        return NullStage()
+
+    @contextmanager
+    def stage(self, name):
+        yield NullStage()
+
+    def timed(self, name, iterable, count_in=False):
+        return iterable
+
+    def writer(self, f, name='write'):
+        return f
+
+
+class CountingWriter:
+    """File wrapper charging write() time and bytes written (UTF-8) to a stage"""
+
+    def __init__(self, report, f, name):
+        self.report = report
+        self.f = f
+        self.stage = report.get(name)
+
+    def write(self, text):
+        self.report._enter(self.stage)
+        try:
+            self.stage.bytes += len(text.encode('utf-8'))
+            return self.f.write(text)
+        finally:
+            self.report._exit()
+
+    def __getattr__(self, name):
+        return getattr(self.f, name)
+
+
+class Profiler:
+    """--profile: cProfile over the whole run, stats saved for snakeviz / pstats"""
+
+    def __init__(self, path=PROFILE):
+        self.path = path
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self, top=20):
+        self.profile.disable()
+        self.profile.dump_stats(self.path)
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats('cumulative').print_stats(top)
+        return out.getvalue()
@@ -0,0 +1,132 @@
+"""
+Import workbooks for several tenants in parallel (generate-import-sql-v2.py --tenant)
+
+Each tenant -> workbook pair runs as its own generate-import-sql-v2.py
+process, at most --workers at a time: with --apply every tenant loads in its
+own transaction, otherwise each gets its own SQL file. Inside every import
+the tenant and its warehouse are resolved once (import_ctx) and all lookups
+are scoped to that tenant. The deprecated generate-import-sql.py (v1) has no
+--tenant and is not offered here.
+
+Per tenant, <dir>/<tenant>.sql (or nothing with --apply), <tenant>.log and
+<tenant>-report.json are written to --output-dir. Options after -- are
+passed to every import.
+
+Usage:
+    python scripts/import_tenants.py --tenant 1b7e...=plant-a.xlsx --tenant 9c21...=plant-b.xlsx
+    python scripts/import_tenants.py --tenants tenants.csv --apply "$DATABASE_URL" --workers 4
+    python scripts/import_tenants.py --tenants tenants.csv -- --mode=bulk --engine=vectorized
+
+tenants.csv holds one "tenant_id,workbook" per line (# comments allowed).
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORTER = os.path.join(ROOT, 'generate-import-sql-v2.py')
+OUTPUT_DIR = 'tenant-imports'
+
+
+class TenantImport:
+    def __init__(self, tenant, workbook):
+        self.tenant = tenant
+        self.workbook = workbook
+        self.returncode = None
+        self.seconds = 0.0
+        self.last_line = ''
+
+
+def read_pairs(pairs, tenants_file):
+    """tenant -> workbook from --tenant ID=WORKBOOK values and a tenants file"""
+    lines = list(pairs)
+    if tenants_file:
+        with open(tenants_file, encoding='utf-8') as f:
+            lines += [line.split('#', 1)[0].strip().replace(',', '=', 1) for line in f]
+    imports = {}
+    for line in filter(None, lines):
+        tenant, sep, workbook = line.partition('=')
+        if not sep or not workbook.strip():
+            raise SystemExit(f"expected TENANT_ID=WORKBOOK, got {line!r}")
+        try:
+            tenant = str(uuid.UUID(tenant.strip()))
+        except ValueError:
+            raise SystemExit(f"not a tenant id: {tenant.strip()!r}")
+        if tenant in imports:
+            raise SystemExit(f"tenant {tenant} is listed twice")
+        imports[tenant] = TenantImport(tenant, workbook.strip())
+    return list(imports.values())
+
+
+def command(job, args, extra):
+    path = os.path.join(args.output_dir, job.tenant)
+    cmd = [sys.executable, IMPORTER, '--tenant', job.tenant, '--workbook', job.workbook,
+           '--report', path + '-report.json']
+    if args.apply:
+        cmd += ['--apply', args.apply]
+    else:
+        cmd += ['--output', path + '.sql']
+    if args.delta:
+        cmd += ['--delta', path + '-manifest.json']
+    return cmd + extra
+
+
+def run(job, cmd, log_path):
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        job.returncode = subprocess.call(cmd, stdout=log, stderr=subprocess.STDOUT)
+    job.seconds = time.perf_counter() - start
+    with open(log_path, encoding='utf-8') as log:
+        lines = [line.strip() for line in log if line.strip()]
+    done = [line for line in lines if line.startswith('✅')]
+    job.last_line = (done or lines or [''])[-1]
+    return job
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tenant', action='append', default=[], metavar='TENANT_ID=WORKBOOK',
+                        help='Tenant and the workbook to import into it (repeatable)')
+    parser.add_argument('--tenants', metavar='FILE', help='File of "tenant_id,workbook" lines')
+    parser.add_argument('--apply', metavar='DSN', help='Load straight into this Postgres database')
+    parser.add_argument('--delta', action='store_true', help='Per-tenant --delta manifests in --output-dir')
+    parser.add_argument('--workers', type=int, default=4, help='Imports running at the same time')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help=f'SQL files, logs and reports (default {OUTPUT_DIR})')
+    argv, extra = sys.argv[1:], []
+    if '--' in argv:
+        argv, extra = argv[:argv.index('--')], argv[argv.index('--') + 1:]
+    args = parser.parse_args(argv)
+
+    jobs = read_pairs(args.tenant, args.tenants)
+    if not jobs:
+        parser.error('give --tenant TENANT_ID=WORKBOOK or --tenants FILE')
+    missing = [job.workbook for job in jobs if not os.path.exists(job.workbook)]
+    if missing:
+        parser.error(f"workbook(s) not found: {', '.join(missing)}")
+    os.makedirs(args.output_dir, exist_ok=True)
+    args.output_dir = os.path.abspath(args.output_dir)
+
+    workers = max(1, min(args.workers, len(jobs)))
+    print(f"Importing {len(jobs)} tenant(s), {workers} at a time")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [pool.submit(run, job, command(job, args, extra), os.path.join(args.output_dir, job.tenant + '.log'))
+                   for job in jobs]
+        for future in futures:
+            job = future.result()
+            status = 'ok' if job.returncode == 0 else f'FAILED ({job.returncode})'
+            print(f"  {job.tenant}  {job.workbook:<32} {job.seconds:7.1f}s  {status}  {job.last_line[:80]}")
+
+    failed = [job for job in jobs if job.returncode != 0]
+    print(f"\n{len(jobs) - len(failed)} of {len(jobs)} tenant(s) imported in {time.perf_counter() - start:.1f}s "
+          f"(logs in {args.output_dir})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
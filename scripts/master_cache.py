@@ -0,0 +1,186 @@
+"""
+On-disk cache of API master data (item code -> id, vendors, warehouses)
+
+Each dataset is one list endpoint, stored in SQLite per tenant as key -> JSON
+value together with the response's ETag / Last-Modified. Within the TTL the
+cache answers without a request; after it, the list is revalidated with
+If-None-Match / If-Modified-Since and only downloaded again when the server
+does not answer 304. The API has no updated_at filter, so validators stand in
+for a high-water mark. Only the most recently used tenants are kept.
+
+Usage:
+    python scripts/master_cache.py items --token "$API_TOKEN"    # refresh and print counts
+    python scripts/master_cache.py --clear
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from api_client import BASE, ApiClient, token_tenant, unwrap  # noqa: E402
+
+CACHE = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "saif-erp",
+                     "master-data.sqlite")
+
+# Dataset -> (list path, query params, key field, value fields)
+DATASETS = {
+    "items": ("/items", {"includeInactive": "true"}, "code", ("id", "name", "type", "uom", "is_active")),
+    "vendors": ("/purchase/vendors", {}, "code", ("id", "name", "is_active")),
+    "warehouses": ("/inventory/warehouses", {}, "code", ("id", "name")),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    tenant TEXT NOT NULL,
+    name TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (tenant, name)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    tenant TEXT NOT NULL,
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (tenant, name, key)
+);
+"""
+
+
+class MasterDataCache:
+    """
+    Per-tenant master data with a TTL and conditional revalidation.
+
+    Stats count what each lookup cost: 'hit' (no request), 'revalidated'
+    (304), 'fetched' (full list) and 'added' (single rows put by callers).
+    """
+
+    def __init__(self, client: ApiClient, tenant: str, path: str = CACHE, ttl: float = 3600.0,
+                 max_tenants: int = 8):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.client = client
+        self.tenant = tenant
+        self.ttl = ttl
+        self.max_tenants = max_tenants
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        self.stats = {"hit": 0, "revalidated": 0, "fetched": 0, "added": 0}
+
+    def get(self, name: str) -> dict[str, dict]:
+        """key -> value for a dataset, refreshed from the API when the TTL has passed"""
+        now = time.time()
+        row = self.db.execute("SELECT etag, last_modified, fetched_at FROM datasets WHERE tenant = ? AND name = ?",
+                              (self.tenant, name)).fetchone()
+        if row is None or now - row[2] >= self.ttl:
+            self._refresh(name, row, now)
+        else:
+            self.stats["hit"] += 1
+        with self.db:
+            self.db.execute("UPDATE datasets SET used_at = ? WHERE tenant = ? AND name = ?", (now, self.tenant, name))
+        return {key: json.loads(value) for key, value in self.db.execute(
+            "SELECT key, value FROM entries WHERE tenant = ? AND name = ?", (self.tenant, name))}
+
+    def put(self, name: str, key: str, value: dict) -> None:
+        """Add one row looked up outside the list (kept until the next full fetch)"""
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                            (self.tenant, name, key, json.dumps(value, ensure_ascii=False)))
+        self.stats["added"] += 1
+
+    def clear(self) -> None:
+        with self.db:
+            self.db.execute("DELETE FROM entries")
+            self.db.execute("DELETE FROM datasets")
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _refresh(self, name: str, row: tuple | None, now: float) -> None:
+        path, params, key_field, fields = DATASETS[name]
+        headers = {}
+        if row is not None:
+            etag, last_modified, _ = row
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        status, response_headers, raw = self.client.get(path, params, headers)
+
+        if status == 304 and row is not None:
+            with self.db:
+                self.db.execute("UPDATE datasets SET fetched_at = ? WHERE tenant = ? AND name = ?",
+                                (now, self.tenant, name))
+            self.stats["revalidated"] += 1
+            return
+        if status != 200:
+            if row is not None:  # stale beats nothing; retry on the next lookup
+                return
+            raise RuntimeError(f"{path}: status={status} {raw[:500]}")
+
+        entries = {}
+        for record in unwrap(json.loads(raw)):
+            key = record.get(key_field)
+            if key and key not in entries:
+                entries[key] = json.dumps({f: record.get(f) for f in fields}, ensure_ascii=False)
+        with self.db:
+            self.db.execute("DELETE FROM entries WHERE tenant = ? AND name = ?", (self.tenant, name))
+            self.db.executemany("INSERT INTO entries VALUES (?, ?, ?, ?)",
+                                [(self.tenant, name, key, value) for key, value in entries.items()])
+            self.db.execute("INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?, ?, ?)",
+                            (self.tenant, name, response_headers.get("etag"),
+                             response_headers.get("last-modified"), now, now))
+            self._evict()
+        self.stats["fetched"] += 1
+
+    def _evict(self) -> None:
+        """Drop the least recently used tenants beyond max_tenants"""
+        stale = [tenant for tenant, in self.db.execute(
+            "SELECT tenant FROM datasets GROUP BY tenant ORDER BY MAX(used_at) DESC LIMIT -1 OFFSET ?",
+            (self.max_tenants,))]
+        for tenant in stale:
+            self.db.execute("DELETE FROM entries WHERE tenant = ?", (tenant,))
+            self.db.execute("DELETE FROM datasets WHERE tenant = ?", (tenant,))
+
+
+def open_cache(client: ApiClient, base: str, token: str | None, path: str = CACHE, ttl: float = 3600.0,
+               max_tenants: int = 8) -> MasterDataCache:
+    """Cache scoped to the token's tenant (the API base URL when the token has none)"""
+    return MasterDataCache(client, token_tenant(token) or base, path, ttl, max_tenants)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("datasets", nargs="*", help=f"Datasets to refresh: {', '.join(DATASETS)} (default: all)")
+    parser.add_argument("--base", default=BASE, help="API base URL (env API_BASE)")
+    parser.add_argument("--token", default=os.environ.get("API_TOKEN"), help="Bearer token (env API_TOKEN)")
+    parser.add_argument("--cache", default=CACHE, help="Cache file")
+    parser.add_argument("--ttl", type=float, default=0, help="Seconds a cached list is used without revalidating")
+    parser.add_argument("--clear", action="store_true", help="Empty the cache and exit")
+    args = parser.parse_args()
+    unknown = set(args.datasets) - set(DATASETS)
+    if unknown:
+        parser.error(f"unknown dataset(s): {', '.join(sorted(unknown))}")
+
+    client = ApiClient(args.base, args.token)
+    cache = open_cache(client, args.base, args.token, args.cache, args.ttl)
+    if args.clear:
+        cache.clear()
+        print(f"Cleared {args.cache}")
+        return 0
+    for name in args.datasets or DATASETS:
+        start = time.perf_counter()
+        entries = cache.get(name)
+        print(f"{name:<12} {len(entries):>6} entries  {(time.perf_counter() - start) * 1000:7.1f} ms")
+    print(", ".join(f"{k}={v}" for k, v in cache.stats.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
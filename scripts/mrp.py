@@ -0,0 +1,223 @@
+"""
+MRP / net requirements for a production plan.
+
+Reproduces the workbook's MRP columns ("Required in desired no of SS",
+"quantity to be ordered desired production", "How Many Crafts can be done
+from the available Stock?") from the BOM and stock, as NumPy array
+operations over the whole catalogue:
+
+    gross     = B @ demand                        (B: leaf item x product, per-unit rollups)
+    usable    = available - allocated - threshold
+    net       = max(gross - usable, 0)
+    buildable = floor(min over B[:, p] > 0 of (available - allocated) / B[:, p])
+
+B comes from the memoized BOM rollups in bom_explosion.py. Net quantities
+are grouped into purchase suggestions per preferred vendor (lowest
+item_vendors.priority; in the workbook, the first SUPPLIER listed).
+
+Usage:
+    python scripts/mrp.py "Saif Seas Life - DSR=30"
+    python scripts/mrp.py --pr-bom                         # plan = PR-BOM rows still REMAINING
+    python scripts/mrp.py FG-001=5 --dsn "$DATABASE_URL" [--tenant TENANT_ID] [--csv mrp.csv]
+"""
+
+import argparse
+import csv
+import math
+import os
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bom_explosion import BomCycleError, BomGraph, from_database, from_workbook  # noqa: E402
+from excel_import import (  # noqa: E402
+    WORKBOOK, StreamSource, clean_number, is_missing, iter_sheet, open_workbook, unquote,
+)
+
+
+class MrpResult:
+    """Per leaf item arrays (aligned with .items) and buildable units per product"""
+
+    def __init__(self, items, gross, available, allocated, threshold, net, buildable):
+        self.items = items
+        self.gross = gross
+        self.available = available
+        self.allocated = allocated
+        self.threshold = threshold
+        self.net = net
+        self.buildable = buildable
+
+
+def bom_matrix(graph: BomGraph, products: list[str]) -> tuple[list[str], np.ndarray]:
+    """Leaf items and the leaf x product matrix of per-unit requirements"""
+    rollups = [graph.rollup(product) for product in products]
+    items = sorted({leaf for rollup in rollups for leaf in rollup})
+    row = {item: i for i, item in enumerate(items)}
+    matrix = np.zeros((len(items), len(products)))
+    for col, rollup in enumerate(rollups):
+        rows = [row[leaf] for leaf in rollup]
+        matrix[rows, col] = list(rollup.values())
+    return items, matrix
+
+
+def net_requirements(graph: BomGraph, plan: dict[str, float], stock: dict[str, tuple[float, float]],
+                     thresholds: dict[str, float]) -> MrpResult:
+    """Explode the plan and net it against (available, allocated) stock and threshold stock"""
+    products = list(plan)
+    items, matrix = bom_matrix(graph, products)
+    demand = np.array([plan[p] for p in products], dtype=float)
+    position = np.array([stock.get(item, (0.0, 0.0)) for item in items], dtype=float).reshape(-1, 2)
+    available, allocated = position[:, 0], position[:, 1]
+    threshold = np.array([thresholds.get(item, 0.0) for item in items], dtype=float)
+
+    gross = matrix @ demand
+    net = np.maximum(gross - (available - allocated - threshold), 0.0)
+
+    free = np.maximum(available - allocated, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        per_product = np.where(matrix > 0, free[:, None] / matrix, np.inf)
+    buildable = np.floor(per_product.min(axis=0)) if len(items) else np.zeros(len(products))
+    return MrpResult(items, gross, available, allocated, threshold, net,
+                     dict(zip(products, buildable)))
+
+
+def purchase_suggestions(result: MrpResult, vendors: dict[str, tuple[str, float | None]]) -> dict[str, list[dict]]:
+    """Net quantities grouped by preferred vendor ({item: (vendor, unit_price)}); no vendor -> '(none)'"""
+    by_vendor: dict[str, list[dict]] = defaultdict(list)
+    for i in np.flatnonzero(result.net > 0):
+        item = result.items[i]
+        vendor, price = vendors.get(item, ('(none)', None))
+        qty = float(result.net[i])
+        by_vendor[vendor].append({
+            'item': item,
+            'quantity': qty,
+            'unit_price': price,
+            'value': qty * price if price is not None else None,
+        })
+    return dict(by_vendor)
+
+
+# =============================================================================
+# LOAD: stock, thresholds and preferred vendors
+# =============================================================================
+
+def workbook_inputs(path: str) -> tuple[dict, dict, dict]:
+    """RM sheet: Current Stock (nothing allocated, no threshold) and first SUPPLIER at COST"""
+    stock, vendors = {}, {}
+    for rec in StreamSource(path).rm_records():
+        name = unquote(rec['name'])
+        stock.setdefault(name, (rec['current_stock'], 0.0))
+        if rec['vendors']:
+            vendors.setdefault(name, (rec['vendors'][0], rec['cost'] or None))
+    return stock, {}, vendors
+
+
+def database_inputs(dsn: str, tenant_id: str | None) -> tuple[dict, dict, dict]:
+    """stock_entries totals, items.reorder_level and the priority-1 item_vendors row per item"""
+    import psycopg2
+
+    params = {'tenant': tenant_id}
+    tenant = "(%(tenant)s::uuid IS NULL OR {}.tenant_id = %(tenant)s::uuid)"
+    with psycopg2.connect(dsn) as conn, conn.cursor() as cur:
+        cur.execute(f"""SELECT item_id::text, SUM(available_quantity), SUM(COALESCE(allocated_quantity, 0))
+                        FROM stock_entries se WHERE {tenant.format('se')} GROUP BY item_id""", params)
+        stock = {item: (float(available), float(allocated)) for item, available, allocated in cur}
+        cur.execute(f"""SELECT id::text, reorder_level FROM items i
+                        WHERE reorder_level IS NOT NULL AND {tenant.format('i')}""", params)
+        thresholds = {item: float(level) for item, level in cur}
+        cur.execute(f"""SELECT DISTINCT ON (iv.item_id) iv.item_id::text, v.code, iv.unit_price
+                        FROM item_vendors iv
+                        JOIN vendors v ON v.id = iv.vendor_id
+                        WHERE iv.is_active AND {tenant.format('v')}
+                        ORDER BY iv.item_id, iv.priority, iv.unit_price NULLS LAST""", params)
+        vendors = {item: (code, float(price) if price is not None else None) for item, code, price in cur}
+    return stock, thresholds, vendors
+
+
+def pr_bom_plan(path: str) -> dict[str, float]:
+    """PR-BOM sheet: REMAINING quantity per product still to be built"""
+    plan: dict[str, float] = defaultdict(float)
+    for _, row in iter_sheet(open_workbook(path), 'PR-BOM', header=1, numeric=('REMAINING',)):
+        name, remaining = row['PRODUCT OR RAW MATERIAL NAME'], clean_number(row['REMAINING'])
+        if not is_missing(name) and remaining and remaining > 0:
+            plan[str(name).strip()] += remaining
+    return dict(plan)
+
+
+def parse_plan(pairs: list[str]) -> dict[str, float]:
+    plan: dict[str, float] = defaultdict(float)
+    for pair in pairs:
+        name, sep, qty = pair.rpartition('=')
+        if not sep or not name:
+            raise SystemExit(f"Plan entries are ITEM=QTY, got {pair!r}")
+        plan[name] += float(qty)
+    return dict(plan)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('plan', nargs='*', help='ITEM=QTY (item code with --dsn, name with the workbook)')
+    parser.add_argument('--pr-bom', action='store_true', help="Add the PR-BOM sheet's REMAINING quantities to the plan")
+    parser.add_argument('--workbook', default=WORKBOOK, help='Workbook with BOM, RM and PR-BOM sheets')
+    parser.add_argument('--dsn', help='Read BOMs, stock, thresholds and vendors from this Postgres database')
+    parser.add_argument('--tenant', help='Tenant id to read (--dsn)')
+    parser.add_argument('--csv', help='Write every leaf item row to this CSV file')
+    args = parser.parse_args()
+
+    plan = parse_plan(args.plan)
+    if args.pr_bom:
+        for name, qty in pr_bom_plan(args.workbook).items():
+            plan[name] = plan.get(name, 0.0) + qty
+    if not plan:
+        parser.error('give ITEM=QTY entries or --pr-bom')
+
+    if args.dsn:
+        graph = from_database(args.dsn, args.tenant)
+        stock, thresholds, vendors = database_inputs(args.dsn, args.tenant)
+    else:
+        graph = from_workbook(args.workbook)
+        stock, thresholds, vendors = workbook_inputs(args.workbook)
+    by_label = {label: node for node, label in graph.labels.items()}
+    plan = {by_label.get(name, name): qty for name, qty in plan.items()}
+
+    start = time.perf_counter()
+    try:
+        result = net_requirements(graph, plan, stock, thresholds)
+    except BomCycleError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    suggestions = purchase_suggestions(result, vendors)
+
+    print(f"MRP for {len(plan)} product(s): {len(result.items)} items, "
+          f"{int((result.net > 0).sum())} to order ({elapsed * 1000:.1f} ms)")
+    for product, units in result.buildable.items():
+        units = 'unlimited' if math.isinf(units) else f"{units:g}"
+        print(f"  can build {graph.label(product)}: {units} (planned {plan[product]:g})")
+
+    for vendor, lines in sorted(suggestions.items()):
+        total = sum(line['value'] or 0 for line in lines)
+        print(f"\n{vendor}: {len(lines)} item(s), order value {total:,.2f}")
+        for line in sorted(lines, key=lambda line: graph.label(line['item'])):
+            price = f"{line['unit_price']:,.2f}" if line['unit_price'] is not None else '-'
+            print(f"  {graph.label(line['item']):<50} {line['quantity']:>10,.2f} x {price}")
+
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['item', 'gross', 'available', 'allocated', 'threshold', 'net', 'vendor', 'unit_price'])
+            for i in sorted(range(len(result.items)), key=lambda i: graph.label(result.items[i])):
+                item = result.items[i]
+                vendor, price = vendors.get(item, ('', None))
+                writer.writerow([graph.label(item), result.gross[i], result.available[i], result.allocated[i],
+                                 result.threshold[i], result.net[i], vendor, price])
+        print(f"\nWrote {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
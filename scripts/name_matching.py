@@ -0,0 +1,365 @@
+"""
+Near-duplicate vendor and item names -> canonical-name mapping for the importers
+
+split_vendors() and the item sheets take names verbatim, so "Robu", "ROBU.in"
+and "Robu " become three vendors, and an item spelled with a double space or
+different case in RM, CombineSFG, S-BOM and Parts List becomes several items
+(or a BOM line that matches nothing). This finds those groups and writes a
+mapping (variant -> canonical name) that generate-import-sql*.py --names
+applies before any code is generated.
+
+Matching runs in two passes over the distinct names:
+
+    normalized  names equal after case folding and dropping punctuation and
+                spacing (vendors also drop a trailing domain, "Pvt. Ltd." etc.);
+                decimal points inside numbers are kept, "4.7" is not "4 7"
+    similar     typos: only the spacing differs ("Spring washer" /
+                "Springwasher"), or one word of 4+ letters differs by one
+                letter added, dropped, changed or two swapped ("Conector").
+                Different words ("Male" / "Female", "LHS" / "RHS") or numbers
+                (M4 / M5, 8AWG / 12AWG, 4.7uF / 47uF) never match, however
+                the names are spaced.
+
+Similar pairs are found through a blocking index instead of comparing every
+pair: each name is indexed under its spacing-free form and, for every word
+of 4+ letters, under (the other words, the word) and (the other words, the
+word with one letter deleted). Two names within one typo of each other
+always share one of these keys, so only names in the same block are
+compared; the work grows with the total length of the names, not with the
+square of their number.
+
+Groups are merged with union-find. The canonical name of a group is the one
+used by the importer sheets first (RM, then CombineSFG), then the most
+frequent spelling. Review the "groups" list in the output before importing.
+
+Usage:
+    python scripts/name_matching.py                      # writes import-names.json
+    python scripts/name_matching.py --no-similar
+    python generate-import-sql-v2.py --names import-names.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from excel_import import (  # noqa: E402
+    SHEETS, WORKBOOK, clean_bom_rows, clean_rm_rows, clean_sfg_rows, clean_string, generate_item_code,
+    is_missing, iter_sheet, iter_suppliers, open_workbook, split_vendors, unquote,
+)
+
+NAMES = 'import-names.json'
+
+# Item name columns outside the importer sheets, read for matching only
+EXTRA_ITEM_SHEETS = {'Parts List': 'RAW MATERIAL NAME'}
+
+# Sheets whose spelling wins when choosing a group's canonical item name
+ITEM_PRIORITY = ('RM', 'CombineSFG')
+
+VENDOR_SUFFIXES = re.compile(r'(\.(co\.in|com|in|net|org))?(\W+(pvt|private|ltd|limited|llp|inc))*\W*$', re.I)
+
+
+def normalize_item(name):
+    """Case-folded alphanumeric words, single spaced; a decimal point between digits stays ("4.7uf")"""
+    key = re.sub(r'[^0-9a-z.]+', ' ', name.casefold())
+    return ' '.join(re.sub(r'(?<!\d)\.|\.(?!\d)', ' ', key).split())
+
+
+def normalize_vendor(name):
+    """normalize_item() without a trailing web domain or company form ("ROBU.in", "Innovine Pvt. Ltd.")"""
+    return normalize_item(VENDOR_SUFFIXES.sub('', name)) or normalize_item(name)
+
+
+def numbers(key):
+    return re.findall(r'\d+(?:\.\d+)*', key)
+
+
+def one_edit(a, b):
+    """a and b differ by one inserted, deleted or replaced letter, or two adjacent letters swapped"""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:] or (a[i + 2:] == b[i + 2:] and a[i:i + 2] == b[i:i + 2][::-1])
+    return a[i + 1:] == b[i:] if len(a) > len(b) else a[i:] == b[i + 1:]
+
+
+def blocks(key):
+    """Blocking keys shared by any two keys that typo() matches"""
+    yield '', key.replace(' ', '')
+    words = key.split()
+    for w, word in enumerate(words):
+        if len(word) < 4 or numbers(word):
+            continue
+        rest = ' '.join(words[:w] + ['*'] + words[w + 1:])
+        yield rest, word
+        for c in range(len(word)):
+            yield rest, word[:c] + word[c + 1:]
+
+
+def typo(a, b):
+    """Normalized keys that only differ by spacing or by a one-letter typo in one word"""
+    if numbers(a) != numbers(b):
+        return False
+    if a.replace(' ', '') == b.replace(' ', ''):
+        return True
+    words = [(x, y) for x, y in zip(a.split(), b.split()) if x != y]
+    if len(a.split()) != len(b.split()) or len(words) != 1:
+        return False
+    x, y = words[0]
+    return min(len(x), len(y)) >= 4 and not numbers(x + y) and one_edit(x, y)
+
+
+class UnionFind:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, x):
+        parent = self.parent.setdefault(x, x)
+        if parent != x:
+            parent = self.parent[x] = self.find(parent)
+        return parent
+
+    def union(self, a, b):
+        self.parent[self.find(a)] = self.find(b)
+
+
+class NameMatcher:
+    """
+    Collects name occurrences (name, rank) and groups near-duplicates.
+
+    rank orders the candidates for canonical name (lower wins, then the
+    most frequent, then first seen).
+    """
+
+    def __init__(self, normalize, similar=True):
+        self.normalize = normalize
+        self.similar = similar
+        self.names = {}  # name -> [best rank, count, first seen]
+        self.stats = Counter()
+
+    def add(self, name, rank=len(ITEM_PRIORITY)):
+        entry = self.names.get(name)
+        if entry is None:
+            self.names[name] = [rank, 1, len(self.names)]
+        else:
+            entry[0] = min(entry[0], rank)
+            entry[1] += 1
+
+    def groups(self):
+        """[(canonical, [variants], how)] for every group of two or more names ('normalized' or 'similar')"""
+        by_key = defaultdict(list)
+        for name in self.names:
+            key = self.normalize(name)
+            if key:
+                by_key[key].append(name)
+        links = UnionFind()
+        similar = set()
+        for key, names in by_key.items():
+            for name in names[1:]:
+                links.union(name, names[0])
+        if self.similar:
+            for a, b in self._similar_keys(list(by_key)):
+                links.union(by_key[a][0], by_key[b][0])
+                similar.add(by_key[b][0])
+
+        members = defaultdict(list)
+        for key, names in by_key.items():
+            for name in names:
+                members[links.find(name)].append(name)
+        result = []
+        for names in members.values():
+            if len(names) < 2:
+                continue
+            names.sort(key=lambda n: (self.names[n][0], -self.names[n][1], self.names[n][2]))
+            result.append((names[0], names[1:], 'similar' if similar.intersection(names) else 'normalized'))
+        result.sort(key=lambda group: self.names[group[0]][2])
+        return result
+
+    def _similar_keys(self, keys):
+        """(key, key) for keys that are typos of each other, compared only within their blocks"""
+        index = defaultdict(list)
+        for i, key in enumerate(keys):
+            candidates = set()
+            for block in set(blocks(key)):
+                candidates.update(index[block])
+                index[block].append(i)
+            self.stats['candidates'] += len(candidates)
+            for j in candidates:
+                self.stats['compared'] += 1
+                if typo(key, keys[j]):
+                    yield keys[j], key
+
+
+# =============================================================================
+# WORKBOOK
+# =============================================================================
+
+def workbook_names(path=WORKBOOK, similar=True):
+    """Vendor and item matchers filled from the sheets the importers read (plus Parts List)"""
+    vendors = NameMatcher(normalize_vendor, similar)
+    items = NameMatcher(normalize_item, similar)
+    workbook = open_workbook(path)
+    for supplier in iter_suppliers(iter_sheet(workbook, 'RM')):
+        for name in split_vendors(supplier):
+            vendors.add(name)
+    for rec in clean_rm_rows(iter_sheet(workbook, 'RM')):
+        items.add(unquote(rec['name']), ITEM_PRIORITY.index('RM'))
+    for rec in clean_sfg_rows(iter_sheet(workbook, 'CombineSFG')):
+        items.add(unquote(rec['name']), ITEM_PRIORITY.index('CombineSFG'))
+    for rec in clean_bom_rows(iter_sheet(workbook, 'S-BOM')):
+        items.add(unquote(rec['assembly_name']))
+        if rec['rm_name']:
+            items.add(unquote(rec['rm_name']))
+    for sheet, column in EXTRA_ITEM_SHEETS.items():
+        if sheet in workbook.sheetnames:
+            for _, row in iter_sheet(workbook, sheet):
+                name = clean_string(row[column]) if not is_missing(row[column]) else None
+                if name:
+                    items.add(unquote(name))
+    return vendors, items
+
+
+def mapping(groups):
+    return {variant: canonical for canonical, variants, _ in groups for variant in variants}
+
+
+def save_names(path, workbook, vendor_groups, item_groups):
+    data = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'workbook': workbook,
+        'vendors': mapping(vendor_groups),
+        'items': mapping(item_groups),
+        'groups': [{'kind': kind, 'canonical': canonical, 'variants': variants, 'how': how}
+                   for kind, groups in (('vendor', vendor_groups), ('item', item_groups))
+                   for canonical, variants, how in groups],
+    }
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+# =============================================================================
+# APPLY: canonical names in the importers' record source
+# =============================================================================
+
+class CanonicalNames:
+    """
+    Variant -> canonical mapping of a --names file, applied as a stage after
+    the code stage: renamed items and assemblies get the code of their
+    canonical name.
+    """
+
+    def __init__(self, path=NAMES):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.raw_vendors = data.get('vendors', {})
+        # records carry clean_string() names (quotes escaped)
+        self.vendors = {clean_string(k): clean_string(v) for k, v in self.raw_vendors.items()}
+        self.items = {clean_string(k): clean_string(v) for k, v in data.get('items', {}).items()}
+        self.renamed = Counter()
+
+    def vendor(self, name):
+        """Canonical spelling of a raw vendor name (as split from SUPPLIER)"""
+        return self.raw_vendors.get(name, name)
+
+    def item(self, name):
+        canonical = self.items.get(name)
+        if canonical is None:
+            return name
+        self.renamed['items'] += 1
+        return canonical
+
+    def item_records(self, records, offset):
+        """RM / CombineSFG records: canonical item name (and code), canonical vendors"""
+        for rec in records:
+            name = self.item(rec['name'])
+            if name != rec['name']:
+                rec['name'] = name
+                rec['code'] = generate_item_code(name, rec['index'] + offset)
+            if rec.get('vendors'):
+                rec['vendors'] = list(dict.fromkeys(self.vendors.get(v, v) for v in rec['vendors']))
+            yield rec
+
+    def bom_records(self, records, offset):
+        """S-BOM records: canonical names, assembly groups and codes recomputed"""
+        current_assembly = None
+        for rec in records:
+            rec['assembly_name'] = self.item(rec['assembly_name'])
+            if rec['rm_name']:
+                rec['rm_name'] = self.item(rec['rm_name'])
+            rec['new_assembly'] = rec['assembly_name'] != current_assembly
+            if rec['new_assembly']:
+                current_assembly = rec['assembly_name']
+                assembly_code = generate_item_code(current_assembly, rec['index'] + offset)
+            rec['assembly_code'] = assembly_code
+            yield rec
+
+
+class CanonicalSource:
+    """Record source (StreamSource / FrameSource) with the names of a --names file applied"""
+
+    def __init__(self, source, path=NAMES):
+        self.source = source
+        self.names = CanonicalNames(path)
+
+    def __getattr__(self, name):
+        return getattr(self.source, name)
+
+    def suppliers(self):
+        """Unique raw SUPPLIER values in first-seen order (a whole value that is a variant is replaced)"""
+        return list(dict.fromkeys(self.names.vendor(s) for s in self.source.suppliers()))
+
+    def vendor_names(self):
+        names = self.source.vendor_names()
+        self.names.renamed['vendors'] = sum(name in self.names.raw_vendors for name in names)
+        return sorted({self.names.vendor(name) for name in names})
+
+    def vendor_codes(self, names):
+        return self.source.vendor_codes(names)
+
+    def rm_records(self):
+        return self.names.item_records(self.source.rm_records(), SHEETS['RM']['code_offset'])
+
+    def sfg_records(self):
+        return self.names.item_records(self.source.sfg_records(), SHEETS['CombineSFG']['code_offset'])
+
+    def bom_records(self):
+        return self.names.bom_records(self.source.bom_records(), SHEETS['S-BOM']['code_offset'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workbook', default=WORKBOOK, help='Source workbook')
+    parser.add_argument('--output', default=NAMES, help=f'Mapping file to write (default {NAMES})')
+    parser.add_argument('--no-similar', action='store_true', help='Only group names equal after normalization')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    vendors, items = workbook_names(args.workbook, not args.no_similar)
+    read = time.perf_counter() - start
+    vendor_groups, item_groups = vendors.groups(), items.groups()
+    matched = time.perf_counter() - start - read
+    save_names(args.output, args.workbook, vendor_groups, item_groups)
+
+    for kind, matcher, groups in (('Vendors', vendors, vendor_groups), ('Items', items, item_groups)):
+        print(f"\n=== {kind}: {len(matcher.names)} names, {len(groups)} groups "
+              f"({matcher.stats['compared']} pairs compared of {matcher.stats['candidates']} candidates) ===")
+        for canonical, variants, how in groups:
+            print(f"  {canonical!r} <- {', '.join(map(repr, variants))}  [{how}]")
+    print(f"\nRead {read:.2f}s, matched {matched:.3f}s. Mapping written to {args.output}; review it, then run "
+          f"generate-import-sql-v2.py --names {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+"""
+Columnar cache of parsed workbook sheets (Arrow IPC / Feather V2 files)
+
+Each parsed sheet is stored as <cache>/<workbook sha256>/<sheet>.arrow, so a
+changed workbook misses automatically; entries of the same workbook file
+under an older hash are removed when the new ones are written. Hits are read
+from a memory-mapped file instead of parsing the xlsx again; typed columns
+convert from Arrow in bulk, object columns are rebuilt cell by cell through
+to_pylist(), so the load copies and is not free for text-heavy sheets.
+
+Typed columns (float, int, str, datetime) are stored as Arrow columns with
+the pandas metadata, so they come back with the same dtype. Object columns
+(cells of mixed type, e.g. COST holding numbers and text) are split into one
+Arrow column per Python type and put back together as the same objects on
+load, so the importers see exactly what pd.read_excel returned.
+
+Needs pyarrow (pip install pyarrow).
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+from excel_import import PARSE_CACHE, SHEETS, WORKBOOK, workbook_hash
+from excel_vectorized import read_sheets
+
+# Bump when the stored layout or the parse (compact(), header handling) changes
+FORMAT = 1
+
+# Python type of an object-column cell -> suffix of its part column
+PART_TYPES = {str: 'str', bool: 'bool', int: 'int', float: 'float',
+              datetime.datetime: 'datetime', datetime.date: 'date', datetime.time: 'time',
+              datetime.timedelta: 'timedelta'}
+
+METADATA_KEY = b'saif.sheet'
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        raise SystemExit("The parse cache needs pyarrow: pip install pyarrow")
+    return pyarrow
+
+
+def sheet_file(name):
+    """File name for a sheet (sheet names may hold characters file systems reject)"""
+    safe = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+    return f"{safe}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}.arrow"
+
+
+def to_table(df, header=0):
+    """DataFrame -> Arrow table; object columns are split into per-type part columns"""
+    pa = _pyarrow()
+    objects = [col for col in df.columns if df[col].dtype == object]
+    typed = [col for col in df.columns if col not in objects]
+    table = pa.Table.from_pandas(df[typed], preserve_index=False)
+    pandas_meta = table.schema.metadata[b'pandas']
+
+    layout = []
+    for col in df.columns:
+        if col not in objects:
+            layout.append([col, None])
+            continue
+        values = df[col].tolist()
+        parts = []
+        for type_, suffix in PART_TYPES.items():
+            cells = [v if type(v) is type_ else None for v in values]
+            if any(v is not None for v in cells):
+                part = f"{col}\x00{suffix}"
+                table = table.append_column(part, pa.array(cells, from_pandas=False))
+                parts.append([part, suffix])
+        stray = {type(v).__name__ for v in values if v is not None and type(v) not in PART_TYPES}
+        if stray:
+            raise TypeError(f"column {col!r}: cannot store {', '.join(sorted(stray))} cells")
+        layout.append([col, parts])
+    meta = {'format': FORMAT, 'header': header, 'rows': len(df), 'columns': layout}
+    return table.replace_schema_metadata({b'pandas': pandas_meta, METADATA_KEY: json.dumps(meta).encode('utf-8')})
+
+
+def from_table(table):
+    """Arrow table written by to_table() -> the original DataFrame"""
+    meta = json.loads(table.schema.metadata[METADATA_KEY])
+    typed = [col for col, parts in meta['columns'] if parts is None]
+    df = table.select(typed).replace_schema_metadata({b'pandas': table.schema.metadata[b'pandas']}).to_pandas()
+    columns = {}
+    for col, parts in meta['columns']:
+        if parts is None:
+            columns[col] = df[col]
+            continue
+        values = [None] * meta['rows']
+        for part, _ in parts:
+            for i, v in enumerate(table.column(part).to_pylist()):
+                if v is not None:
+                    values[i] = v
+        columns[col] = pd.Series(values, dtype=object, name=col)
+    return pd.DataFrame(columns, index=pd.RangeIndex(meta['rows']))
+
+
+class ParseCache:
+    """Parsed sheets of one workbook file, keyed by its content hash"""
+
+    def __init__(self, path=WORKBOOK, cache_dir=PARSE_CACHE):
+        self.path = path
+        self.cache_dir = cache_dir
+        self.digest = workbook_hash(path)
+        self.dir = os.path.join(cache_dir, self.digest)
+        self.hits = []
+        self.misses = []
+
+    def _entry(self, name):
+        return os.path.join(self.dir, sheet_file(name))
+
+    def load(self, name):
+        """Cached frame for a sheet, or None"""
+        pa = _pyarrow()
+        try:
+            with pa.memory_map(self._entry(name)) as source:
+                table = pa.ipc.open_file(source).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return None
+        meta = json.loads(table.schema.metadata.get(METADATA_KEY, b'{}'))
+        header = SHEETS.get(name, {}).get('header', 0)
+        if meta.get('format') != FORMAT or meta.get('header') != header:
+            return None
+        return from_table(table)
+
+    def store(self, name, df):
+        pa = _pyarrow()
+        os.makedirs(self.dir, exist_ok=True)
+        table = to_table(df, SHEETS.get(name, {}).get('header', 0))
+        tmp = self._entry(name) + '.tmp'
+        with pa.OSFile(tmp, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, self._entry(name))
+        self._claim()
+
+    def _claim(self):
+        """Record which workbook this hash belongs to and drop its older hashes"""
+        source = os.path.abspath(self.path)
+        with open(os.path.join(self.dir, 'source.json'), 'w', encoding='utf-8') as f:
+            json.dump({'workbook': source}, f)
+        for entry in os.listdir(self.cache_dir):
+            if entry == self.digest:
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, entry, 'source.json'), encoding='utf-8') as f:
+                    owner = json.load(f).get('workbook')
+            except (OSError, ValueError):
+                continue
+            if owner == source:
+                shutil.rmtree(os.path.join(self.cache_dir, entry), ignore_errors=True)
+
+    def read_sheets(self, sheets, workers=None):
+        """Like excel_vectorized.read_sheets(): cached sheets are loaded, the rest parsed and stored"""
+        frames = {}
+        for name in sheets:
+            df = self.load(name)
+            if df is not None:
+                frames[name] = df
+                self.hits.append(name)
+        missing = [name for name in sheets if name not in frames]
+        if missing:
+            parsed = read_sheets(self.path, missing, workers)
+            for name, df in parsed.items():
+                try:
+                    self.store(name, df)
+                except TypeError as e:
+                    # stderr: stdout may be the generated SQL
+                    print(f"-- parse cache: not caching {name}: {e}", file=sys.stderr)
+            frames.update(parsed)
+            self.misses.extend(missing)
+        return {name: frames[name] for name in sheets}
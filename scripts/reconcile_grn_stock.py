@@ -0,0 +1,329 @@
+"""
+Reconcile GRN lines against the stock they posted, over the whole ledger
+
+Stock posted by a GRN (QC accept) carries the GRN number in
+stock_entries.metadata->>'grn_reference'. Every GRN line is read once into a
+hash table keyed by (GRN number, item); every stock entry with a GRN
+reference is then streamed past it and grouped under the same key. Both
+reads are single server-side cursor scans, so a year of receipts reconciles
+in seconds. Findings, per GRN and item:
+
+    duplicate  the accepted quantity was posted more than once: after the
+               entries that add up to it, each further entry repeats one of
+               their quantities (cleanup-duplicate-stock-entries.sql)
+    mismatch   the stock posted differs from the accepted quantity otherwise,
+               including stock for a cancelled GRN
+    missing    accepted quantity with no stock entry (GRNs past DRAFT)
+    orphan     a stock entry naming a GRN number, or an item, with no GRN line
+
+The fix-up plan (--plan) holds one guarded DO block per fixable finding, in
+a single transaction, for review before it is run:
+
+    duplicate  delete the surplus entries, if nothing has been allocated or
+               issued from them
+    mismatch   adjust the single, unallocated entry by the difference
+    missing    insert the entry the QC accept would have posted
+
+Each block raises if it touches a different number of rows than planned
+(the ledger moved since the plan was made). When adjust_inventory_stock()
+exists, inventory_stock is adjusted by the same amounts. Everything else is
+listed as a comment for review.
+
+Usage:
+    python scripts/reconcile_grn_stock.py --dsn "$DATABASE_URL" [--tenant TENANT_ID]
+    python scripts/reconcile_grn_stock.py --dsn "$DATABASE_URL" --plan grn-stock-fixup.sql --json grn-stock.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from erp_db import ACCEPTED_COLUMNS, PRICE_COLUMNS, TENANT, column, fmt, quote, stream  # noqa: E402
+
+PLAN = 'grn-stock-fixup.sql'
+FETCH = 5000
+
+KINDS = ('duplicate', 'mismatch', 'missing', 'orphan')
+
+FIX_QUOTE = '$fixup$'
+
+
+class Receipt:
+    """Accepted quantity of one item on one GRN (all its lines)"""
+
+    __slots__ = ('grn_number', 'item_id', 'code', 'status', 'accepted', 'lines', 'warehouse_id')
+
+    def __init__(self, grn_number: str, item_id: str, code: str | None, status: str | None, warehouse_id: str | None):
+        self.grn_number = grn_number
+        self.item_id = item_id
+        self.code = code
+        self.status = status
+        self.accepted = Decimal(0)
+        self.lines: list[str] = []
+        self.warehouse_id = warehouse_id
+
+
+class Posting:
+    """A stock entry carrying a grn_reference"""
+
+    __slots__ = ('id', 'quantity', 'available', 'allocated', 'created_at', 'code')
+
+    def __init__(self, id_, quantity, available, allocated, created_at, code):
+        self.id = id_
+        self.quantity = quantity
+        self.available = available
+        self.allocated = allocated or Decimal(0)
+        self.created_at = created_at
+        self.code = code
+
+    @property
+    def untouched(self) -> bool:
+        return not self.allocated and self.available == self.quantity
+
+
+class Finding:
+    def __init__(self, kind: str, grn_number: str, code: str, message: str, fix: str | None = None):
+        self.kind = kind
+        self.grn_number = grn_number
+        self.code = code
+        self.message = message
+        self.fix = fix
+
+    def __str__(self) -> str:
+        return f"{self.grn_number} {self.code}: {self.message}"
+
+    def to_json(self) -> dict:
+        return {'kind': self.kind, 'grn': self.grn_number, 'item': self.code, 'message': self.message,
+                'fixed': self.fix is not None}
+
+
+# =============================================================================
+# RECONCILE
+# =============================================================================
+
+class Reconciler:
+    """Hash join of GRN lines (build side) and GRN stock postings (probe side)"""
+
+    def __init__(self, conn, tenant_id: str | None = None, fetch: int = FETCH):
+        self.conn = conn
+        self.params = {'tenant': tenant_id}
+        self.fetch = fetch
+        self.receipts: dict[tuple[str, str], Receipt] = {}
+        self.postings: dict[tuple[str, str], list[Posting]] = {}
+        self.grn_numbers: set[str] = set()
+        self.counts = Counter()
+        with conn.cursor() as cur:
+            self.accepted = column(cur, 'grn_items', ACCEPTED_COLUMNS)
+            if self.accepted is None:
+                raise SystemExit("grn_items has no accepted quantity column (accepted_quantity or accepted_qty)")
+            self.price = column(cur, 'grn_items', PRICE_COLUMNS)
+            self.has_status = column(cur, 'grns', ('status',)) is not None
+            self.has_category = column(cur, 'items', ('category',)) is not None
+            cur.execute("SELECT to_regproc('adjust_inventory_stock') IS NOT NULL")
+            self.adjust_inventory = cur.fetchone()[0]
+
+    def load(self) -> None:
+        status = "g.status::text" if self.has_status else "NULL"
+        for grn_number, state, line_id, item_id, code, accepted, warehouse_id in stream(self.conn, 'reconcile_grn', f"""
+                SELECT g.grn_number, {status}, gi.id::text, gi.item_id::text, i.code, gi.{self.accepted},
+                       g.warehouse_id::text
+                FROM grns g
+                JOIN grn_items gi ON gi.grn_id = g.id
+                LEFT JOIN items i ON i.id = gi.item_id
+                WHERE {TENANT.format(alias='g')}""", self.params, self.fetch):
+            self.counts['grn lines'] += 1
+            self.grn_numbers.add(grn_number)
+            if item_id is None:
+                self.counts['grn lines without item_id'] += 1
+                continue
+            receipt = self.receipts.get((grn_number, item_id))
+            if receipt is None:
+                receipt = self.receipts[grn_number, item_id] = Receipt(grn_number, item_id, code, state, warehouse_id)
+            receipt.accepted += accepted or 0
+            if accepted and accepted > 0:
+                # insert_fix posts these lines only; a fully rejected line has nothing to post
+                receipt.lines.append(line_id)
+
+        for row in stream(self.conn, 'reconcile_stock', f"""
+                SELECT se.metadata->>'grn_reference', se.item_id::text, se.id::text, se.quantity,
+                       se.available_quantity, se.allocated_quantity, se.created_at, i.code
+                FROM stock_entries se
+                LEFT JOIN items i ON i.id = se.item_id
+                WHERE se.metadata->>'grn_reference' IS NOT NULL AND {TENANT.format(alias='se')}""",
+                          self.params, self.fetch):
+            self.counts['stock entries'] += 1
+            self.postings.setdefault((row[0], row[1]), []).append(Posting(*row[2:]))
+
+    def findings(self):
+        for key, receipt in self.receipts.items():
+            found = self.check(receipt, self.postings.get(key, []))
+            if found:
+                yield found
+        for (grn_number, item_id), entries in self.postings.items():
+            if (grn_number, item_id) in self.receipts:
+                continue
+            posted = sum(entry.quantity for entry in entries)
+            where = "an item not on the GRN" if grn_number in self.grn_numbers else "no such GRN"
+            yield Finding('orphan', grn_number, entries[0].code or item_id,
+                          f"{len(entries)} stock entr{'y' if len(entries) == 1 else 'ies'} ({fmt(posted)}) for {where}")
+
+    def check(self, receipt: Receipt, entries: list[Posting]) -> Finding | None:
+        expected = Decimal(0) if receipt.status == 'CANCELLED' else receipt.accepted
+        posted = sum((entry.quantity for entry in entries), Decimal(0))
+        code = receipt.code or receipt.item_id
+        if posted == expected:
+            return None
+        if not entries:
+            if receipt.status == 'DRAFT':
+                return None
+            message = f"accepted {fmt(expected)}, no stock entry"
+            if receipt.warehouse_id is None:
+                return Finding('missing', receipt.grn_number, code, message + " (GRN has no warehouse)")
+            return Finding('missing', receipt.grn_number, code, message, self.insert_fix(receipt))
+
+        entries.sort(key=lambda entry: (entry.created_at, entry.id))
+        kept, surplus, total = [], [], Decimal(0)
+        for entry in entries:
+            if total < expected:
+                kept.append(entry)
+                total += entry.quantity
+            else:
+                surplus.append(entry)
+        summary = f"accepted {fmt(expected)}, posted {fmt(posted)} in {len(entries)} entr{'y' if len(entries) == 1 else 'ies'}"
+        if receipt.status == 'CANCELLED':
+            summary = f"GRN cancelled, {fmt(posted)} posted in {len(entries)} entr{'y' if len(entries) == 1 else 'ies'}"
+
+        if total == expected and surplus and {e.quantity for e in surplus} <= {e.quantity for e in kept}:
+            if not all(entry.untouched for entry in surplus):
+                return Finding('duplicate', receipt.grn_number, code,
+                               f"{summary}; {len(surplus)} repeat posting(s) already allocated or issued from")
+            return Finding('duplicate', receipt.grn_number, code,
+                           f"{summary}; {len(surplus)} repeat posting(s) removed", self.delete_fix(receipt, surplus))
+
+        if len(entries) == 1 and receipt.status != 'CANCELLED':
+            entry, change = entries[0], expected - posted
+            if not entry.allocated and entry.available + change >= 0:
+                return Finding('mismatch', receipt.grn_number, code, f"{summary}; entry adjusted by {fmt(change)}",
+                               self.update_fix(receipt, entry, change))
+        return Finding('mismatch', receipt.grn_number, code, summary)
+
+    # -------------------------------------------------------------------------
+    # FIX-UP BLOCKS
+
+    def _adjusted(self) -> str:
+        """CTE tail: adjust inventory_stock for each changed row (tenant_id, item_id, warehouse_id, change)"""
+        if not self.adjust_inventory:
+            return "SELECT count(*) INTO n FROM changed"
+        category = ("COALESCE((SELECT category::text FROM items WHERE id = c.item_id), 'RAW_MATERIAL')"
+                    if self.has_category else "'RAW_MATERIAL'")
+        return ("SELECT count(*) INTO n FROM (SELECT adjust_inventory_stock(c.tenant_id, c.item_id, c.warehouse_id, "
+                f"NULL, c.change, {category}) FROM changed c) adjusted")
+
+    def _block(self, receipt: Receipt, rows: int, change_sql: str) -> str:
+        label = f"{receipt.grn_number} {receipt.code or receipt.item_id}".replace("'", "''").replace('%', '%%')
+        return (f"DO {FIX_QUOTE}\nDECLARE n integer;\nBEGIN\n"
+                f"    WITH changed AS (\n{change_sql}\n    )\n    {self._adjusted()};\n"
+                f"    IF n <> {rows} THEN\n"
+                f"        RAISE EXCEPTION '{label}: planned {rows} stock row(s), found % (ledger changed since the plan was made)', n;\n"
+                f"    END IF;\nEND {FIX_QUOTE};")
+
+    def delete_fix(self, receipt: Receipt, surplus: list[Posting]) -> str:
+        ids = ', '.join(quote(entry.id) for entry in surplus)
+        return self._block(receipt, len(surplus), f"""        DELETE FROM stock_entries
+        WHERE id IN ({ids})
+          AND COALESCE(allocated_quantity, 0) = 0 AND available_quantity = quantity
+        RETURNING tenant_id, item_id, warehouse_id, -quantity AS change""")
+
+    def update_fix(self, receipt: Receipt, entry: Posting, change: Decimal) -> str:
+        return self._block(receipt, 1, f"""        UPDATE stock_entries
+        SET quantity = quantity + {fmt(change)}, available_quantity = available_quantity + {fmt(change)},
+            updated_at = NOW()
+        WHERE id = {quote(entry.id)} AND quantity = {fmt(entry.quantity)} AND COALESCE(allocated_quantity, 0) = 0
+        RETURNING tenant_id, item_id, warehouse_id, {fmt(change)}::numeric AS change""")
+
+    def insert_fix(self, receipt: Receipt) -> str:
+        lines = ', '.join(quote(line) for line in receipt.lines)
+        price = f"gi.{self.price}" if self.price else "NULL"
+        return self._block(receipt, len(receipt.lines), f"""        INSERT INTO stock_entries (tenant_id, item_id, warehouse_id, quantity, available_quantity,
+                                   allocated_quantity, unit_price, batch_number, metadata)
+        SELECT g.tenant_id, gi.item_id, g.warehouse_id, gi.{self.accepted}, gi.{self.accepted}, 0, {price},
+               gi.batch_number,
+               jsonb_build_object('grn_reference', g.grn_number, 'grn_item_id', gi.id::text,
+                                  'created_from', 'GRN_RECONCILE')
+        FROM grn_items gi
+        JOIN grns g ON g.id = gi.grn_id
+        WHERE gi.id IN ({lines}) AND gi.{self.accepted} > 0
+          AND NOT EXISTS (SELECT 1 FROM stock_entries se
+                          WHERE se.item_id = gi.item_id AND se.metadata->>'grn_reference' = g.grn_number)
+        RETURNING tenant_id, item_id, warehouse_id, quantity AS change""")
+
+
+def write_plan(path: str, findings: list[Finding], inventory: bool) -> int:
+    """Fix-up SQL for review; returns the number of fixes in it"""
+    fixes = [finding for finding in findings if finding.fix]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("-- GRN vs stock reconciliation fix-up plan (scripts/reconcile_grn_stock.py)\n")
+        f.write(f"-- {len(fixes)} fix(es); review before running. Each block raises if the ledger moved.\n")
+        if inventory:
+            f.write("-- inventory_stock is adjusted with adjust_inventory_stock() by the same amounts.\n")
+        f.write("\nBEGIN;\n")
+        for finding in fixes:
+            f.write(f"\n-- {finding.kind}: {finding}\n{finding.fix}\n")
+        f.write("\nCOMMIT;\n")
+        review = [finding for finding in findings if not finding.fix]
+        if review:
+            f.write(f"\n-- Not fixed automatically ({len(review)}), review by hand:\n")
+            for finding in review:
+                f.write(f"--   {finding.kind}: {finding}\n")
+    return len(fixes)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True, help='Postgres database to reconcile')
+    parser.add_argument('--tenant', help='Tenant id to reconcile (default: all rows)')
+    parser.add_argument('--plan', default=PLAN, help=f'Fix-up SQL to write (default {PLAN})')
+    parser.add_argument('--json', metavar='PATH', help='Also write every finding to this JSON file')
+    parser.add_argument('--limit', type=int, default=20, help='Findings printed per kind (0 = all)')
+    parser.add_argument('--fetch', type=int, default=FETCH, help='Rows per server-side cursor round trip')
+    args = parser.parse_args()
+
+    import psycopg2
+
+    start = time.perf_counter()
+    with psycopg2.connect(args.dsn) as conn:
+        reconciler = Reconciler(conn, args.tenant, args.fetch)
+        reconciler.load()
+        findings = list(reconciler.findings())
+    seconds = time.perf_counter() - start
+
+    by_kind = Counter(finding.kind for finding in findings)
+    for kind in KINDS:
+        if not by_kind[kind]:
+            continue
+        print(f"\n{kind}: {by_kind[kind]}")
+        shown = [finding for finding in findings if finding.kind == kind]
+        for finding in shown[:args.limit or None]:
+            print(f"  {finding}")
+        if args.limit and len(shown) > args.limit:
+            print(f"  ... {len(shown) - args.limit} more")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([finding.to_json() for finding in findings], f, indent=2, ensure_ascii=False)
+    fixes = write_plan(args.plan, findings, reconciler.adjust_inventory)
+
+    counts = ', '.join(f"{name}: {n}" for name, n in reconciler.counts.items())
+    print(f"\n{len(findings)} finding(s) in {seconds:.1f}s ({counts})")
+    print(f"{fixes} fix(es) written to {args.plan} for review", file=sys.stderr)
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,295 @@
+"""
+Low-stock and job-order shortage scan over the whole catalogue
+
+The API checks one item (or one job order) per request: check-low-stock
+queries stock per item, the job-order stock check asks for each material's
+stock summary in turn. This scan reads everything in three queries and works
+on arrays aligned by item:
+
+    items       threshold stock (items.reorder_level, which the import fills
+                from the master list's "Threshold Stock" column), available
+                and allocated quantity (stock_entries totals)
+    job orders  remaining material per line (required - issued) of every
+                DRAFT / SCHEDULED / IN_PROGRESS job order
+
+and computes, in one vectorized pass:
+
+    free      = max(available - allocated, 0)
+    low       = threshold > 0 and free <= threshold       (the API's LOW_STOCK rule)
+    demand    = sum of remaining job-order lines per item
+    short     = per line, what free stock does not cover when it is handed
+                to job orders in order (priority, then due date)
+    to order  = max(demand + threshold - free, 0)
+
+Items are ranked: shortages that block a job order first (earliest due date
+first), then low stock by how little of threshold + demand is covered.
+--master-list reads the thresholds straight from the master list workbook
+instead, locating its columns through import-mapping.json.
+
+Usage:
+    python scripts/shortage_scan.py --dsn "$DATABASE_URL" [--tenant TENANT_ID]
+    python scripts/shortage_scan.py --dsn "$DATABASE_URL" --limit 0 --csv shortages.csv
+    python scripts/shortage_scan.py --dsn "$DATABASE_URL" --master-list "3. Master List of Raw Material Saif Automations (1).xlsx"
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from erp_db import TENANT, column  # noqa: E402
+from excel_import import clean_number, clean_string, iter_sheet, open_workbook  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAPPING = os.path.join(ROOT, 'import-mapping.json')
+OPEN_STATUSES = ('DRAFT', 'SCHEDULED', 'IN_PROGRESS')
+PRIORITIES = ('URGENT', 'HIGH', 'NORMAL', 'LOW')
+
+ITEMS_SQL = f"""
+    SELECT i.id::text, i.code, i.name, COALESCE(i.reorder_level, 0),
+           COALESCE(s.available, 0), COALESCE(s.allocated, 0)
+    FROM items i
+    LEFT JOIN (
+        SELECT item_id, SUM(available_quantity) AS available, SUM(COALESCE(allocated_quantity, 0)) AS allocated
+        FROM stock_entries se
+        WHERE {TENANT.format(alias='se')}
+        GROUP BY item_id
+    ) s ON s.item_id = i.id
+    WHERE i.is_active AND {TENANT.format(alias='i')}"""
+
+LINES_SQL = f"""
+    SELECT jo.id::text, jo.job_order_number, jo.item_code, jo.end_date, {{material}}::text,
+           GREATEST(m.required_quantity - COALESCE(m.issued_quantity, 0), 0)
+    FROM job_order_materials m
+    JOIN production_job_orders jo ON jo.id = m.job_order_id
+    WHERE jo.status::text = ANY(%(statuses)s) AND {TENANT.format(alias='jo')}
+    ORDER BY array_position(%(priorities)s, upper(jo.priority)), jo.end_date NULLS LAST, jo.start_date,
+             jo.job_order_number"""
+
+
+class ScanInputs:
+    """Item arrays (aligned with .ids) and job-order lines (material index, job index, remaining)"""
+
+    def __init__(self, ids, codes, names, threshold, available, allocated, jobs, line_item, line_job, remaining):
+        self.ids = ids
+        self.codes = codes
+        self.names = names
+        self.threshold = threshold
+        self.available = available
+        self.allocated = allocated
+        self.jobs = jobs                # [(job order number, product code, due date)] in allocation order
+        self.line_item = line_item
+        self.line_job = line_job
+        self.remaining = remaining
+
+
+class ShortageScan:
+    """Per item and per job-order results of scan()"""
+
+    def __init__(self, inputs, free, low, demand, short, to_order, line_short, first_due, rank):
+        self.inputs = inputs
+        self.free = free
+        self.low = low
+        self.demand = demand
+        self.short = short
+        self.to_order = to_order
+        self.line_short = line_short
+        self.first_due = first_due      # earliest due date (ordinal day) of a short line, inf if none
+        self.rank = rank                # indexes of reported items, most urgent first
+
+    def job_shortages(self) -> list[tuple[str, str, date | None, int, float]]:
+        """(job order, product, due, short lines, short quantity) for job orders missing material"""
+        inputs = self.inputs
+        lines = np.bincount(inputs.line_job, self.line_short > 0, minlength=len(inputs.jobs))
+        quantity = np.bincount(inputs.line_job, self.line_short, minlength=len(inputs.jobs))
+        return [(*inputs.jobs[j], int(lines[j]), float(quantity[j])) for j in np.flatnonzero(lines)]
+
+
+def cover_lines(free: np.ndarray, line_item: np.ndarray, remaining: np.ndarray) -> np.ndarray:
+    """
+    Shortfall of every job-order line when each item's free stock is handed
+    out to its lines in order: cumulative demand per item (a cumsum restarted
+    at every item's first line, via a stable sort by item) against free stock.
+    """
+    if not len(line_item):
+        return np.zeros(0)
+    order = np.argsort(line_item, kind='stable')
+    items, need = line_item[order], remaining[order]
+    cum = np.cumsum(need)
+    starts = np.r_[True, items[1:] != items[:-1]]
+    first = np.maximum.accumulate(np.where(starts, np.arange(len(items)), 0))
+    before = cum - need - (cum[first] - need[first])
+    short = np.empty_like(remaining)
+    short[order] = need - np.clip(free[items] - before, 0.0, need)
+    return short
+
+
+def scan(inputs: ScanInputs) -> ShortageScan:
+    n = len(inputs.ids)
+    free = np.maximum(inputs.available - inputs.allocated, 0.0)
+    low = (inputs.threshold > 0) & (free <= inputs.threshold)
+    demand = np.bincount(inputs.line_item, inputs.remaining, minlength=n)
+    line_short = cover_lines(free, inputs.line_item, inputs.remaining)
+    short = np.bincount(inputs.line_item, line_short, minlength=n)
+    to_order = np.maximum(demand + inputs.threshold - free, 0.0)
+
+    due = np.array([d.toordinal() if d else np.inf for _, _, d in inputs.jobs], dtype=float)
+    first_due = np.full(n, np.inf)
+    hit = line_short > 0
+    np.minimum.at(first_due, inputs.line_item[hit], due[inputs.line_job[hit]])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        covered = np.where(demand + inputs.threshold > 0, free / (demand + inputs.threshold), np.inf)
+
+    reported = np.flatnonzero((short > 0) | low | (to_order > 0))
+    rank = reported[np.lexsort((covered[reported], first_due[reported], short[reported] <= 0))]
+    return ShortageScan(inputs, free, low, demand, short, to_order, line_short, first_due, rank)
+
+
+# =============================================================================
+# LOAD
+# =============================================================================
+
+def database_inputs(dsn: str, tenant_id: str | None, log=print) -> ScanInputs:
+    """Items with stock totals in one query, open job-order lines in another"""
+    import psycopg2
+
+    params = {'tenant': tenant_id, 'statuses': list(OPEN_STATUSES), 'priorities': list(PRIORITIES)}
+    with psycopg2.connect(dsn) as conn, conn.cursor() as cur:
+        cur.execute(ITEMS_SQL, params)
+        rows = cur.fetchall()
+        ids = [row[0] for row in rows]
+        values = np.array([row[3:] for row in rows], dtype=float).reshape(-1, 3)
+        index = {item_id: i for i, item_id in enumerate(ids)}
+
+        cur.execute("SELECT to_regclass('production_job_orders') IS NOT NULL "
+                    "AND to_regclass('job_order_materials') IS NOT NULL")
+        jobs, job_index, line_item, line_job, remaining = [], {}, [], [], []
+        if cur.fetchone()[0]:
+            variant = column(cur, 'job_order_materials', ('selected_variant_id',))
+            material = f"COALESCE(m.{variant}, m.item_id)" if variant else 'm.item_id'
+            cur.execute(LINES_SQL.format(material=material), params)
+        else:
+            log("-- no production_job_orders / job_order_materials tables: low stock only")
+        for job_id, number, product, due, item_id, qty in cur:
+            if item_id not in index or not qty:
+                continue
+            if job_id not in job_index:
+                job_index[job_id] = len(jobs)
+                jobs.append((number, product, due.date() if isinstance(due, datetime) else due))
+            line_item.append(index[item_id])
+            line_job.append(job_index[job_id])
+            remaining.append(float(qty))
+
+    return ScanInputs(ids, [row[1] for row in rows], [row[2] for row in rows],
+                      values[:, 0], values[:, 1], values[:, 2], jobs,
+                      np.array(line_item, dtype=np.int64), np.array(line_job, dtype=np.int64),
+                      np.array(remaining, dtype=float))
+
+
+def mapped_headers(path: str = MAPPING) -> dict[str, str]:
+    """Master list header per database field: databaseMapping field -> columnMapping header"""
+    with open(path, encoding='utf-8') as f:
+        mapping = json.load(f)
+    by_key = {header.strip().lower().replace(' ', '_'): header for header in mapping['columnMapping'].values()}
+    return {field: by_key[source] for field, source in mapping['databaseMapping'].items() if source in by_key}
+
+
+def master_list_thresholds(path: str, mapping: str = MAPPING) -> dict[str, float]:
+    """Threshold Stock of the master list's RM sheet by SAS part number and by raw material name"""
+    headers = mapped_headers(mapping)
+    threshold, code, name = headers['reorder_level'], headers['part_number'], headers['name']
+    thresholds: dict[str, float] = {}
+    for _, row in iter_sheet(open_workbook(path), 'RM', header=1, numeric=(threshold,)):
+        level = clean_number(row[threshold])
+        if not level:
+            continue
+        for key in (clean_string(row[code]), clean_string(row[name])):
+            if key:
+                thresholds.setdefault(key, level)
+    return thresholds
+
+
+def apply_thresholds(inputs: ScanInputs, thresholds: dict[str, float]) -> int:
+    """Replace item thresholds found in thresholds (by code, else name); returns how many matched"""
+    levels = np.array([thresholds.get(code, thresholds.get(name, np.nan))
+                       for code, name in zip(inputs.codes, inputs.names)], dtype=float).reshape(-1)
+    found = ~np.isnan(levels)
+    inputs.threshold = np.where(found, levels, inputs.threshold)
+    return int(found.sum())
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def item_rows(result: ShortageScan) -> list[list]:
+    inputs = result.inputs
+    rows = []
+    for i in result.rank:
+        due = date.fromordinal(int(result.first_due[i])) if np.isfinite(result.first_due[i]) else None
+        rows.append([inputs.codes[i], inputs.names[i], float(result.free[i]), float(inputs.threshold[i]),
+                     float(result.demand[i]), float(result.short[i]), float(result.to_order[i]),
+                     bool(result.low[i]), due])
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', required=True, help='Postgres database to scan')
+    parser.add_argument('--tenant', help='Tenant id to scan (default: all rows)')
+    parser.add_argument('--master-list', metavar='WORKBOOK', help='Take Threshold Stock from this master list workbook')
+    parser.add_argument('--limit', type=int, default=50, help='Items to print, most urgent first (0 = all)')
+    parser.add_argument('--csv', metavar='PATH', help='Write every reported item to this CSV file')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    inputs = database_inputs(args.dsn, args.tenant)
+    loaded = time.perf_counter() - start
+    if args.master_list:
+        matched = apply_thresholds(inputs, master_list_thresholds(args.master_list))
+        print(f"Threshold Stock from {args.master_list}: {matched} of {len(inputs.ids)} items matched")
+
+    start = time.perf_counter()
+    result = scan(inputs)
+    elapsed = time.perf_counter() - start
+    rows = item_rows(result)
+    jobs = result.job_shortages()
+
+    print(f"Scanned {len(inputs.ids)} items and {len(inputs.remaining)} lines of {len(inputs.jobs)} open job "
+          f"order(s) (loaded in {loaded:.2f}s, scanned in {elapsed * 1000:.1f} ms)")
+    print(f"  {int((result.short > 0).sum())} item(s) short for job orders, {int(result.low.sum())} at or below "
+          f"threshold, {len(rows)} to order")
+    shown = rows if args.limit <= 0 else rows[:args.limit]
+    if shown:
+        print(f"\n  {'#':>4} {'ITEM':<24} {'FREE':>10} {'THRESHOLD':>10} {'JOBS NEED':>10} {'SHORT':>10} "
+              f"{'TO ORDER':>10}  DUE")
+    for n, (code, name, free, threshold, demand, short, to_order, low, due) in enumerate(shown, start=1):
+        flag = ' LOW' if low else ''
+        print(f"  {n:>4} {code or name:<24.24} {free:>10,.2f} {threshold:>10,.2f} {demand:>10,.2f} {short:>10,.2f} "
+              f"{to_order:>10,.2f}  {str(due or ''):<10}{flag}")
+    if len(shown) < len(rows):
+        print(f"  ... {len(rows) - len(shown)} more (--limit 0 or --csv for all)")
+    if jobs:
+        print(f"\n{len(jobs)} job order(s) missing material:")
+        for number, product, due, lines, quantity in jobs:
+            print(f"  {number:<20} {product or '':<24} due {str(due or '-'):<10}  {lines} line(s) short, {quantity:,.2f} units")
+
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['rank', 'code', 'name', 'free', 'threshold', 'job_demand', 'short_for_jobs', 'to_order',
+                             'low_stock', 'first_short_due'])
+            writer.writerows([n, *row] for n, row in enumerate(rows, start=1))
+        print(f"\n{len(rows)} row(s) written to {args.csv}")
+    return 1 if rows else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,472 @@
+"""
+Point-in-time stock from the movements ledger, with periodic checkpoints
+
+Stock movements (stock_movements, or GET /inventory/movements) are replayed
+once into a local SQLite file as compact deltas, (time, key, quantity) with
+one key per (item, warehouse): a movement takes its quantity out of
+from_warehouse and puts it into to_warehouse, as the API's stock update does.
+At every period boundary (month start by default) the running position is
+stored as a checkpoint: one float64 array indexed by key.
+
+    as of T     nearest checkpoint at or before T + the deltas between it
+                and T (one index range scan)
+    sync        fetches only movements newer than the last sync, appends
+                their deltas and extends the checkpoints from the latest one;
+                a movement dated before existing checkpoints (back-dated
+                entry) is added into those checkpoints instead of rebuilding
+
+Syncing from the database follows created_at, so back-dated movements are
+picked up; the API only filters on movement_date, so through the API a
+movement entered later with an earlier date is missed until --rebuild (as is
+a deleted movement with either source). Stock that never went through a
+movement (e.g. the Excel import's opening stock) is not in the ledger.
+
+Usage:
+    python scripts/stock_snapshots.py sync --dsn "$DATABASE_URL" [--tenant TENANT_ID]
+    python scripts/stock_snapshots.py sync --token "$API_TOKEN"                # through the API
+    python scripts/stock_snapshots.py as-of 2025-03-31 --item RM-0012 [--warehouse MAIN]
+    python scripts/stock_snapshots.py valuation 2025-03-31 --dsn "$DATABASE_URL" --csv march.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from api_client import BASE, ApiClient, to_float, token_tenant, unwrap  # noqa: E402
+from erp_db import database_source  # noqa: E402
+
+SNAPSHOTS = 'stock-snapshots.sqlite'
+PERIODS = ('month', 'week', 'day')
+FETCH = 5000
+API_PAGE = 5000
+API_START = datetime(2000, 1, 1)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS keys (
+    idx INTEGER PRIMARY KEY,
+    item_id TEXT NOT NULL,
+    warehouse_id TEXT NOT NULL,
+    item_code TEXT,
+    warehouse_code TEXT,
+    UNIQUE (item_id, warehouse_id)
+);
+CREATE TABLE IF NOT EXISTS deltas (at TEXT NOT NULL, key INTEGER NOT NULL, delta REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS deltas_at ON deltas (at);
+CREATE INDEX IF NOT EXISTS deltas_key_at ON deltas (key, at);
+CREATE TABLE IF NOT EXISTS checkpoints (at TEXT PRIMARY KEY, quantities BLOB NOT NULL);
+"""
+
+
+class Movement(NamedTuple):
+    id: str
+    at: datetime            # movement_date
+    cursor: datetime        # sync order: created_at (database) or movement_date (API)
+    item_id: str
+    item_code: str | None
+    from_warehouse: str | None
+    from_code: str | None
+    to_warehouse: str | None
+    to_code: str | None
+    quantity: float
+
+
+def stamp(value: datetime) -> str:
+    """Fixed-width text that sorts like the timestamp (naive UTC)"""
+    return value.strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+
+def parse_time(value) -> datetime:
+    """API / database timestamp -> naive UTC datetime"""
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, date):
+        moment = datetime(value.year, value.month, value.day)
+    else:
+        moment = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def end_of(day: str) -> datetime:
+    """'2025-03-31' -> the instant after that day (a full timestamp is taken as is)"""
+    moment = parse_time(day)
+    return moment + timedelta(days=1) if len(day) == 10 else moment
+
+
+def next_boundary(moment: datetime, period: str) -> datetime:
+    """First period start strictly after moment"""
+    day = datetime(moment.year, moment.month, moment.day)
+    if period == 'day':
+        return day + timedelta(days=1)
+    if period == 'week':
+        return day + timedelta(days=7 - day.weekday())
+    return datetime(moment.year + moment.month // 12, moment.month % 12 + 1, 1)
+
+
+class SnapshotStore:
+    """Deltas, keys and checkpoints of one source (database + tenant, or API tenant)"""
+
+    def __init__(self, path: str = SNAPSHOTS, source: str | None = None, period: str = 'month'):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        stored = self.meta('source')
+        if source is not None and stored not in (None, source):
+            raise SystemExit(f"{path} holds snapshots of {stored}, not {source} (use another --snapshots file "
+                             f"or --rebuild)")
+        self.source = stored or source
+        self.period = self.meta('period', period)
+        self.keys: dict[tuple[str, str], int] = {
+            (item, warehouse): idx for idx, item, warehouse in self.db.execute("SELECT idx, item_id, warehouse_id FROM keys")}
+        with self.db:
+            self.set_meta('source', self.source)
+            self.set_meta('period', self.period)
+
+    def meta(self, name: str, default=None):
+        row = self.db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_meta(self, name: str, value) -> None:
+        self.db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (name, json.dumps(value)))
+
+    def _key(self, item_id: str, warehouse_id: str, item_code: str | None, warehouse_code: str | None) -> int:
+        key = self.keys.get((item_id, warehouse_id))
+        if key is None:
+            key = self.keys[item_id, warehouse_id] = len(self.keys)
+            self.db.execute("INSERT INTO keys VALUES (?, ?, ?, ?, ?)",
+                            (key, item_id, warehouse_id, item_code, warehouse_code))
+        return key
+
+    def _vector(self, blob: bytes) -> np.ndarray:
+        """Checkpoint array padded to the current number of keys"""
+        stored = np.frombuffer(blob, dtype=np.float64)
+        vector = np.zeros(len(self.keys))
+        vector[:len(stored)] = stored
+        return vector
+
+    # -------------------------------------------------------------------------
+    # SYNC
+
+    def append(self, movements: Iterable[Movement]) -> int:
+        """
+        Store new movements (already-synced ids at the high-water mark are
+        skipped) and patch checkpoints later than any back-dated ones.
+        Returns the number stored; call extend() afterwards.
+        """
+        mark = self.meta('cursor')
+        seen = set(self.meta('cursor_ids', []))
+        latest = self.db.execute("SELECT max(at) FROM checkpoints").fetchone()[0]
+        rows, backdated, stored = [], [], 0
+        with self.db:
+            for m in movements:
+                cursor = stamp(m.cursor)
+                if mark is not None and (cursor < mark or (cursor == mark and m.id in seen)):
+                    continue
+                if mark is None or cursor > mark:
+                    mark, seen = cursor, set()
+                seen.add(m.id)
+                stored += 1
+                at = stamp(m.at)
+                for warehouse, code, sign in ((m.from_warehouse, m.from_code, -1), (m.to_warehouse, m.to_code, 1)):
+                    if warehouse:
+                        rows.append((at, self._key(m.item_id, warehouse, m.item_code, code), sign * m.quantity))
+                        if latest is not None and at < latest:
+                            backdated.append(rows[-1])
+                if len(rows) >= FETCH:
+                    self.db.executemany("INSERT INTO deltas VALUES (?, ?, ?)", rows)
+                    rows = []
+            self.db.executemany("INSERT INTO deltas VALUES (?, ?, ?)", rows)
+            if backdated:
+                self._patch(backdated)
+            if mark is not None:
+                self.set_meta('cursor', mark)
+                self.set_meta('cursor_ids', sorted(seen))
+        return stored
+
+    def _patch(self, deltas: list[tuple[str, int, float]]) -> None:
+        """Add back-dated deltas into every checkpoint taken after them"""
+        at = np.array([d[0] for d in deltas])
+        keys = np.array([d[1] for d in deltas], dtype=np.int64)
+        values = np.array([d[2] for d in deltas])
+        for cp_at, blob in self.db.execute("SELECT at, quantities FROM checkpoints WHERE at > ?",
+                                           (min(d[0] for d in deltas),)).fetchall():
+            vector = self._vector(blob)
+            before = at < cp_at
+            np.add.at(vector, keys[before], values[before])
+            self.db.execute("UPDATE checkpoints SET quantities = ? WHERE at = ?", (vector.tobytes(), cp_at))
+
+    def extend(self) -> int:
+        """Checkpoints for every period boundary up to the latest delta, from the latest checkpoint; returns how many"""
+        row = self.db.execute("SELECT at, quantities FROM checkpoints ORDER BY at DESC LIMIT 1").fetchone()
+        newest = self.db.execute("SELECT max(at) FROM deltas").fetchone()[0]
+        if newest is None:
+            return 0
+        if row is None:
+            since, vector = None, np.zeros(len(self.keys))
+            start = self.db.execute("SELECT min(at) FROM deltas").fetchone()[0]
+        else:
+            since, vector = row[0], self._vector(row[1])
+            start = since
+        bounds = []
+        boundary = next_boundary(parse_time(start), self.period)
+        while stamp(boundary) <= newest:
+            bounds.append(stamp(boundary))
+            boundary = next_boundary(boundary, self.period)
+        if not bounds:
+            return 0
+
+        cur = self.db.execute("SELECT at, key, delta FROM deltas WHERE at >= ? AND at < ? ORDER BY at",
+                              (since or '', bounds[-1]))
+        pending = list(bounds)
+        with self.db:
+            while True:
+                chunk = cur.fetchmany(FETCH)
+                if not chunk:
+                    break
+                at = np.array([d[0] for d in chunk])
+                keys = np.array([d[1] for d in chunk], dtype=np.int64)
+                values = np.array([d[2] for d in chunk])
+                done = 0
+                while pending and at[-1] >= pending[0]:
+                    cut = int(np.searchsorted(at, pending[0]))
+                    np.add.at(vector, keys[done:cut], values[done:cut])
+                    done = cut
+                    self.db.execute("INSERT INTO checkpoints VALUES (?, ?)", (pending.pop(0), vector.tobytes()))
+                np.add.at(vector, keys[done:], values[done:])
+            for boundary in pending:
+                self.db.execute("INSERT INTO checkpoints VALUES (?, ?)", (boundary, vector.tobytes()))
+        return len(bounds)
+
+    # -------------------------------------------------------------------------
+    # QUERIES
+
+    def checkpoint(self, at: datetime) -> tuple[str | None, np.ndarray]:
+        row = self.db.execute("SELECT at, quantities FROM checkpoints WHERE at <= ? ORDER BY at DESC LIMIT 1",
+                              (stamp(at),)).fetchone()
+        return (row[0], self._vector(row[1])) if row else (None, np.zeros(len(self.keys)))
+
+    def as_of(self, at: datetime) -> np.ndarray:
+        """Quantity per key after every movement before `at`"""
+        since, vector = self.checkpoint(at)
+        tail = self.db.execute("SELECT key, delta FROM deltas WHERE at >= ? AND at < ?",
+                               (since or '', stamp(at))).fetchall()
+        if tail:
+            keys, values = np.array(tail).T
+            np.add.at(vector, keys.astype(np.int64), values)
+        return vector
+
+    def quantity(self, item_id: str, warehouse_id: str, at: datetime) -> float:
+        """One (item, warehouse) as of `at`: its checkpoint value + its own tail (key index scan)"""
+        key = self.keys.get((item_id, warehouse_id))
+        if key is None:
+            return 0.0
+        since, vector = self.checkpoint(at)
+        tail = self.db.execute("SELECT COALESCE(sum(delta), 0) FROM deltas WHERE key = ? AND at >= ? AND at < ?",
+                               (key, since or '', stamp(at))).fetchone()[0]
+        return float(vector[key] + tail)
+
+    def labels(self) -> list[tuple[str, str, str, str]]:
+        """(item id, warehouse id, item code, warehouse code) per key index"""
+        rows = self.db.execute("SELECT item_id, warehouse_id, item_code, warehouse_code FROM keys ORDER BY idx")
+        return [(item, warehouse, item_code or item, warehouse_code or warehouse)
+                for item, warehouse, item_code, warehouse_code in rows]
+
+    def close(self) -> None:
+        self.db.close()
+
+
+# =============================================================================
+# SOURCES
+# =============================================================================
+
+def forget_dsn(path: str, dsn: str, tenant_id: str | None) -> None:
+    """Rekey a snapshot file whose stored source is the full DSN, password included"""
+    if not os.path.exists(path):
+        return
+    db = sqlite3.connect(path)
+    with db:
+        rekeyed = db.execute("UPDATE meta SET value = ? WHERE name = 'source' AND value = ?",
+                             (json.dumps(database_source(dsn, tenant_id)),
+                              json.dumps(f"dsn:{dsn}:{tenant_id or ''}"))).rowcount
+    if rekeyed:
+        db.execute("VACUUM")  # the old value stays in the freed page otherwise
+    db.close()
+
+
+def database_movements(dsn: str, tenant_id: str | None, since: str | None) -> Iterator[Movement]:
+    """stock_movements with created_at at or after the high-water mark, in created_at order (server-side cursor)"""
+    import psycopg2
+
+    with psycopg2.connect(dsn) as conn, conn.cursor(name='stock_snapshots') as cur:
+        cur.itersize = FETCH
+        cur.execute("""
+            SELECT m.id::text, m.movement_date, COALESCE(m.created_at, m.movement_date), m.item_id::text, i.code,
+                   m.from_warehouse_id::text, fw.code, m.to_warehouse_id::text, tw.code, m.quantity
+            FROM stock_movements m
+            LEFT JOIN items i ON i.id = m.item_id
+            LEFT JOIN warehouses fw ON fw.id = m.from_warehouse_id
+            LEFT JOIN warehouses tw ON tw.id = m.to_warehouse_id
+            WHERE (%(tenant)s::uuid IS NULL OR m.tenant_id = %(tenant)s::uuid)
+              AND (%(since)s::timestamp IS NULL OR COALESCE(m.created_at, m.movement_date) >= %(since)s::timestamp)
+            ORDER BY 3, 1
+        """, {'tenant': tenant_id, 'since': since})
+        for row in cur:
+            yield Movement(row[0], row[1], row[2], *row[3:9], float(row[9]))
+
+
+def database_prices(dsn: str, tenant_id: str | None) -> dict[str, float]:
+    """Item id -> quantity-weighted unit_price of its current stock_entries"""
+    import psycopg2
+
+    with psycopg2.connect(dsn) as conn, conn.cursor() as cur:
+        cur.execute("""
+            SELECT item_id::text, SUM(quantity * unit_price) / NULLIF(SUM(quantity), 0)
+            FROM stock_entries
+            WHERE unit_price IS NOT NULL AND (%(tenant)s::uuid IS NULL OR tenant_id = %(tenant)s::uuid)
+            GROUP BY item_id
+        """, {'tenant': tenant_id})
+        return {item: float(price) for item, price in cur if price is not None}
+
+
+def api_movement(record: dict) -> Movement | None:
+    if not record.get('id') or not record.get('item_id') or not record.get('movement_date'):
+        return None
+    at = parse_time(record['movement_date'])
+    code = lambda nested: (record.get(nested) or {}).get('code')  # noqa: E731
+    return Movement(str(record['id']), at, at, str(record['item_id']), code('items'),
+                    record.get('from_warehouse_id'), code('from_warehouse'),
+                    record.get('to_warehouse_id'), code('to_warehouse'), to_float(record.get('quantity')))
+
+
+def api_movements(client: ApiClient, since: str | None, page: int = API_PAGE) -> Iterator[Movement]:
+    """
+    GET /inventory/movements from the high-water mark to now. The endpoint
+    returns the newest `limit` rows of a movement_date range, so a range
+    that comes back full is split in half until every part fits.
+    """
+    found: dict[str, Movement] = {}
+    ranges = [(parse_time(since) if since else API_START, datetime.utcnow() + timedelta(days=1))]
+    while ranges:
+        lo, hi = ranges.pop()
+        status, body, raw = client.fetch_json('/inventory/movements', {
+            'from_date': lo.isoformat(), 'to_date': hi.isoformat(), 'limit': str(page)})
+        if status != 200:
+            raise SystemExit(f"/inventory/movements: status={status} {raw[:500]}")
+        records = unwrap(body)
+        if len(records) >= page and hi - lo > timedelta(seconds=1):
+            middle = lo + (hi - lo) / 2
+            ranges += [(middle, hi), (lo, middle)]
+            continue
+        for record in records:
+            movement = api_movement(record)
+            if movement is not None:
+                found[movement.id] = movement
+    yield from sorted(found.values(), key=lambda m: (m.cursor, m.id))
+
+
+def api_prices(client: ApiClient) -> dict[str, float]:
+    status, body, raw = client.fetch_json('/inventory/stock')
+    if status != 200:
+        raise SystemExit(f"/inventory/stock: status={status} {raw[:500]}")
+    totals: dict[str, list[float]] = {}
+    for row in unwrap(body):
+        item, price, qty = row.get('item_id'), row.get('unit_price'), to_float(row.get('quantity'))
+        if item and price is not None and qty:
+            value = totals.setdefault(str(item), [0.0, 0.0])
+            value[0] += qty * to_float(price)
+            value[1] += qty
+    return {item: value / qty for item, (value, qty) in totals.items() if qty}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=('sync', 'as-of', 'valuation'))
+    parser.add_argument('date', nargs='?', help="as-of / valuation date (end of that day) or timestamp")
+    parser.add_argument('--snapshots', default=SNAPSHOTS, help=f'Snapshot file (default {SNAPSHOTS})')
+    parser.add_argument('--dsn', help='Read stock_movements from this Postgres database')
+    parser.add_argument('--tenant', help='Tenant id to read (--dsn)')
+    parser.add_argument('--base', default=BASE, help='API base URL (env API_BASE), without --dsn')
+    parser.add_argument('--token', default=os.environ.get('API_TOKEN'), help='Bearer token (env API_TOKEN)')
+    parser.add_argument('--period', choices=PERIODS, default='month', help='Checkpoint interval of a new file')
+    parser.add_argument('--rebuild', action='store_true', help='Drop everything stored and replay from the start')
+    parser.add_argument('--item', help='Item code (or id) to report')
+    parser.add_argument('--warehouse', help='Warehouse code (or id) to report')
+    parser.add_argument('--csv', metavar='PATH', help='Also write the rows to this CSV file')
+    args = parser.parse_args()
+
+    if args.command != 'sync' and not args.date:
+        parser.error(f'{args.command} needs a date')
+    client = None if args.dsn else ApiClient(args.base, args.token)
+    source = database_source(args.dsn, args.tenant) if args.dsn else f"api:{args.base}:{token_tenant(args.token) or ''}"
+    if args.command == 'sync' and args.rebuild and os.path.exists(args.snapshots):
+        os.remove(args.snapshots)
+    if args.dsn:
+        forget_dsn(args.snapshots, args.dsn, args.tenant)
+    store = SnapshotStore(args.snapshots, source if args.command == 'sync' else None, args.period)
+
+    if args.command == 'sync':
+        start = time.perf_counter()
+        since = store.meta('cursor')
+        movements = database_movements(args.dsn, args.tenant, since) if args.dsn else api_movements(client, since)
+        stored = store.append(movements)
+        made = store.extend()
+        total = store.db.execute("SELECT count(*) FROM checkpoints").fetchone()[0]
+        print(f"✅ {stored} new movement(s), {made} checkpoint(s) added ({total} in all, per {store.period}), "
+              f"{len(store.keys)} item/warehouse keys in {time.perf_counter() - start:.2f}s")
+        return 0
+
+    at = end_of(args.date)
+    start = time.perf_counter()
+    quantities = store.as_of(at)
+    seconds = time.perf_counter() - start
+    rows = sorted([item_code, warehouse_code, float(qty), item]
+                  for (item, warehouse, item_code, warehouse_code), qty in zip(store.labels(), quantities)
+                  if (not args.item or args.item in (item, item_code))
+                  and (not args.warehouse or args.warehouse in (warehouse, warehouse_code))
+                  and abs(qty) > 1e-9)
+    header = ['item', 'warehouse', 'quantity']
+    total_value = 0.0
+    if args.command == 'valuation':
+        prices = database_prices(args.dsn, args.tenant) if args.dsn else api_prices(client)
+        header += ['unit_price', 'value']
+        for row in rows:
+            price = prices.get(row.pop())
+            row += [price, None if price is None else row[2] * price]
+            total_value += row[4] or 0.0
+    else:
+        for row in rows:
+            row.pop()
+
+    for row in rows:
+        line = f"  {row[0]:<30} {row[1]:<12} {row[2]:>12,.2f}"
+        if args.command == 'valuation':
+            line += f"  {row[3]:>10,.2f}  {row[4]:>14,.2f}" if row[3] is not None else '  (no price)'
+        print(line)
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+    print(f"\n{len(rows)} item/warehouse position(s) as of the end of {args.date}, replayed in {seconds * 1000:.1f} ms"
+          + (f"; value {total_value:,.2f} at current unit prices" if args.command == 'valuation' else ''))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,285 @@
+"""
+Pre-flight referential checks on the workbook before generating import SQL
+
+Problems that the generated SQL would otherwise swallow silently (an INSERT
+that matches nothing, or a row dropped by WHERE NOT EXISTS) are reported up
+front, each with its sheet and Excel row:
+
+    dangling reference    S-BOM assembly / component that names no workbook
+                          item of the right type, or an item-vendor link whose
+                          vendor gets no vendor code
+    code collision        different names truncated to the same item code
+                          (generate_item_code: 3 words, 50 chars) or vendor
+                          code (generate_code: 20 chars); the later one is
+                          never inserted and its BOM lines attach to the first
+    duplicate item        the same item name again (first row wins), also
+                          across RM and CombineSFG
+    duplicate vendor      a vendor spelled differently (case, spaces,
+                          punctuation) or listed twice in one SUPPLIER cell
+    non-numeric quantity  COST / Current Stock / UNITS text that the importers
+                          replace with 0 (or 1 for UNITS)
+
+The sheets go through the same read -> clean -> code stages as the
+importers, once each; names, codes and vendors are kept in dicts, so the run
+is linear in the number of rows.
+
+Usage:
+    python scripts/validate_workbook.py
+    python scripts/validate_workbook.py --fail-fast
+    python scripts/validate_workbook.py --json preflight.json --limit 0
+    python scripts/validate_workbook.py --names import-names.json     # after name_matching.py
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from excel_import import (  # noqa: E402
+    SHEETS, WORKBOOK, clean_bom_rows, clean_number, clean_rm_rows, clean_sfg_rows, clean_string,
+    generate_code, is_missing, iter_sheet, open_workbook, split_vendors, with_assembly_codes,
+    with_item_codes,
+)
+from name_matching import CanonicalNames  # noqa: E402
+
+KINDS = ('dangling reference', 'code collision', 'duplicate item', 'duplicate vendor', 'non-numeric quantity')
+
+# Numeric columns the importers read with clean_number(), per sheet
+QUANTITIES = {
+    'RM': ('COST', 'Current Stock'),
+    'S-BOM': ('UNITS',),
+}
+
+ITEM_SHEETS = (('RM', clean_rm_rows, 'RAW_MATERIAL'), ('CombineSFG', clean_sfg_rows, 'SUB_ASSEMBLY'))
+
+
+class Issue:
+    def __init__(self, kind: str, sheet: str, row: int, message: str):
+        self.kind = kind
+        self.sheet = sheet
+        self.row = row
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"{self.sheet}!{self.row}: {self.message}"
+
+    def to_json(self) -> dict:
+        return {'kind': self.kind, 'sheet': self.sheet, 'row': self.row, 'message': self.message}
+
+
+class ValidationFailed(Exception):
+    """First issue found with fail_fast"""
+
+    def __init__(self, issue: Issue):
+        self.issue = issue
+        super().__init__(f"{issue.kind}: {issue}")
+
+
+def excel_row(sheet: str, index: int) -> int:
+    """Worksheet row number of a record index (index 0 is the row below the header)"""
+    return index + SHEETS[sheet]['header'] + 2
+
+
+def vendor_key(name: str) -> str:
+    """What generate_code() keeps of a vendor name, before truncation"""
+    return re.sub(r'[^A-Z0-9]', '', name.upper())
+
+
+class WorkbookValidator:
+    """
+    One pass over RM, CombineSFG and S-BOM.
+
+    Items are indexed by cleaned name and by code, vendors by name and by
+    code, as the importers key them; BOM references are checked against the
+    item index once both item sheets have been read.
+    """
+
+    def __init__(self, path: str = WORKBOOK, fail_fast: bool = False, names: str | None = None):
+        self.path = path
+        self.fail_fast = fail_fast
+        self.names = CanonicalNames(names) if names else None
+        self.issues: list[Issue] = []
+        self.items: dict[str, tuple[str, str, int]] = {}  # name -> (code, type, row)
+        self.codes: dict[str, tuple[str, str, int]] = {}  # item code -> (name, sheet, row)
+        self.vendor_codes: dict[str, str] = {}  # vendor name -> code, as vendor_map in the importers
+        self.vendor_keys: dict[str, str] = {}  # vendor_key() -> first name
+        self.vendor_names: dict[str, str] = {}  # vendor code -> first name
+        self.suppliers: set = set()
+        self.links: list[tuple[str, str, int]] = []  # (vendor, item name, row)
+        self.rows = Counter()
+
+    def issue(self, kind: str, sheet: str, row: int, message: str) -> None:
+        found = Issue(kind, sheet, row, message)
+        self.issues.append(found)
+        if self.fail_fast:
+            raise ValidationFailed(found)
+
+    def run(self) -> list[Issue]:
+        workbook = open_workbook(self.path)
+        for sheet, clean, item_type in ITEM_SHEETS:
+            self._items(workbook, sheet, clean, item_type)
+        self._links()
+        self._boms(workbook)
+        return self.issues
+
+    def _records(self, workbook, sheet, clean, code, each_row=None):
+        """
+        (record, raw row) through the importer stages. clean and code are
+        one-to-one generators, so the last row read is the record's row.
+        each_row sees every raw row, including those clean drops.
+        """
+        last = {}
+
+        def tap(rows):
+            for idx, row in rows:
+                last['row'] = row
+                self.rows[sheet] += 1
+                if each_row:
+                    each_row(idx, row)
+                yield idx, row
+
+        offset = SHEETS[sheet]['code_offset']
+        records = code(clean(tap(iter_sheet(workbook, sheet))), offset)
+        if self.names:
+            rename = self.names.bom_records if code is with_assembly_codes else self.names.item_records
+            records = rename(records, offset)
+        for rec in records:
+            yield rec, last['row']
+
+    def _quantities(self, sheet: str, rec: dict, row) -> None:
+        for column in QUANTITIES.get(sheet, ()):
+            value = row[column]
+            if not is_missing(value) and clean_number(value) is None:
+                self.issue('non-numeric quantity', sheet, excel_row(sheet, rec['index']),
+                           f"{column} {value!r} for {rec.get('name') or rec.get('rm_name')!r}")
+
+    # -------------------------------------------------------------------------
+
+    def _supplier(self, idx: int, row) -> None:
+        """Vendor names as the importers split raw SUPPLIER values, checked for respellings and code clashes"""
+        supplier = row['SUPPLIER']
+        if is_missing(supplier) or supplier in self.suppliers:
+            return
+        self.suppliers.add(supplier)
+        line = excel_row('RM', idx)
+        names = split_vendors(supplier)
+        if self.names:
+            names = [self.names.vendor(name) for name in names]
+        repeated = [name for name, n in Counter(names).items() if n > 1]
+        if repeated:
+            self.issue('duplicate vendor', 'RM', line,
+                       f"SUPPLIER {str(supplier)!r} lists {', '.join(map(repr, repeated))} more than once")
+        for name in names:
+            if name in self.vendor_codes or not clean_string(name):
+                continue
+            code = self.vendor_codes[name] = generate_code(name)
+            key = vendor_key(name)
+            if key in self.vendor_keys:
+                self.issue('duplicate vendor', 'RM', line,
+                           f"vendor {name!r} is {self.vendor_keys[key]!r} spelled differently (both code {code!r})")
+                continue
+            self.vendor_keys[key] = name
+            if code in self.vendor_names:
+                self.issue('code collision', 'RM', line,
+                           f"vendors {self.vendor_names[code]!r} and {name!r} both get vendor code {code!r}")
+                continue
+            self.vendor_names[code] = name
+
+    def _items(self, workbook, sheet: str, clean, item_type: str) -> None:
+        each_row = self._supplier if sheet == 'RM' else None
+        for rec, row in self._records(workbook, sheet, clean, with_item_codes, each_row):
+            line = excel_row(sheet, rec['index'])
+            self._quantities(sheet, rec, row)
+            name, code = rec['name'], rec['code']
+            for vendor in rec.get('vendors', ()):
+                self.links.append((vendor, name, line))
+
+            if name in self.items:
+                first_code, first_type, first_row = self.items[name]
+                where = f"row {first_row}" if first_type == item_type else f"row {first_row} as {first_type}"
+                self.issue('duplicate item', sheet, line, f"{name!r} already imported from {where}; this row is ignored")
+                continue
+            self.items[name] = (code, item_type, line)
+            if code in self.codes:
+                other, other_sheet, other_row = self.codes[code]
+                self.issue('code collision', sheet, line,
+                           f"{name!r} and {other!r} ({other_sheet}!{other_row}) both get item code {code!r}; "
+                           f"{name!r} is not inserted")
+                continue
+            self.codes[code] = (name, sheet, line)
+
+    def _links(self) -> None:
+        """Item-vendor links are dropped when the cleaned vendor name has no code (e.g. quotes in the name)"""
+        for vendor, name, line in self.links:
+            if vendor not in self.vendor_codes:
+                self.issue('dangling reference', 'RM', line,
+                           f"vendor {vendor!r} of {name!r} has no vendor code; the item-vendor link is skipped")
+
+    def _boms(self, workbook) -> None:
+        sheet = 'S-BOM'
+        for rec, row in self._records(workbook, sheet, clean_bom_rows, with_assembly_codes):
+            line = excel_row(sheet, rec['index'])
+            self._quantities(sheet, rec, row)
+            assembly = self.items.get(rec['assembly_name'])
+            if rec['new_assembly'] and (assembly is None or assembly[1] != 'SUB_ASSEMBLY'):
+                found = f"a {assembly[1]} item" if assembly else "no item"
+                self.issue('dangling reference', sheet, line,
+                           f"assembly {rec['assembly_name']!r} names {found}, not a CombineSFG sub-assembly")
+            if rec['rm_name'] and rec['rm_name'] not in self.items:
+                self.issue('dangling reference', sheet, line,
+                           f"component {rec['rm_name']!r} of {rec['assembly_name']!r} names no RM or CombineSFG item")
+
+
+def validate_workbook(path: str = WORKBOOK, fail_fast: bool = False, names: str | None = None) -> list[Issue]:
+    """
+    Every issue in the workbook (raises ValidationFailed on the first one with
+    fail_fast); names is a name_matching.py mapping applied first, as with --names.
+    """
+    return WorkbookValidator(path, fail_fast, names).run()
+
+
+def print_issues(issues: list[Issue], limit: int = 20) -> None:
+    """Issues grouped by kind, at most `limit` per kind (0 = all)"""
+    by_kind = Counter(issue.kind for issue in issues)
+    for kind in KINDS:
+        if not by_kind[kind]:
+            continue
+        print(f"\n{kind}: {by_kind[kind]}")
+        shown = [issue for issue in issues if issue.kind == kind]
+        for issue in shown[:limit or None]:
+            print(f"  {issue}")
+        if limit and len(shown) > limit:
+            print(f"  ... {len(shown) - limit} more")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workbook', default=WORKBOOK, help='Workbook to check')
+    parser.add_argument('--fail-fast', action='store_true', help='Stop at the first issue')
+    parser.add_argument('--limit', type=int, default=20, help='Issues printed per kind (0 = all)')
+    parser.add_argument('--json', metavar='PATH', help='Also write every issue to this JSON file')
+    parser.add_argument('--names', metavar='PATH', help='Apply a canonical-name mapping first (name_matching.py)')
+    args = parser.parse_args()
+
+    validator = WorkbookValidator(args.workbook, args.fail_fast, args.names)
+    try:
+        issues = validator.run()
+    except ValidationFailed as e:
+        print(f"FAILED {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([issue.to_json() for issue in issues], f, indent=2, ensure_ascii=False)
+    print_issues(issues, args.limit)
+    checked = ', '.join(f"{sheet} {n}" for sheet, n in validator.rows.items())
+    print(f"\n{len(issues)} issue(s) in {args.workbook} (rows checked: {checked})")
+    return 1 if issues else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
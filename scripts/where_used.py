@@ -0,0 +1,297 @@
+"""
+Where-used queries over the BOM graph: which assemblies and finished goods use a component.
+
+The index inverts the BomGraph of bom_explosion.py (database bom_items, or
+the workbook A-BOM / S-BOM sheets) into component -> {assembly: quantity per
+assembly}. It is built once and answers:
+
+    direct       assemblies whose own BOM lists the component (the
+                 workbook's hand-kept Where Used sheet)
+    transitive   every assembly above it, with the quantity of the component
+                 in one unit of each (summed over all paths), up to the
+                 top-level finished goods
+    batch        the finished goods hit by a list of components (e.g. this
+                 week's shortages), with which of them each one needs
+
+Each component's upward closure is memoized, so assemblies shared by many
+components are walked once per batch. When one BOM changes, update() swaps
+its lines in the index and drops only the memoized closures below it instead
+of rebuilding; --refresh does this for BOMs re-read from the database into a
+saved --index.
+
+Usage:
+    python scripts/where_used.py "4mm Female Bullet connector"
+    python scripts/where_used.py RM-0012 RM-0031 --dsn "$DATABASE_URL" [--tenant TENANT_ID] --top
+    python scripts/where_used.py --file shortages.txt --json
+    python scripts/where_used.py RM-0012 --dsn "$DATABASE_URL" --index where-used.json --refresh FG-001
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import Iterable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bom_explosion import BomCycleError, BomGraph, bom_lines, from_database, from_workbook  # noqa: E402
+from erp_db import TENANT, database_source  # noqa: E402
+from excel_import import WORKBOOK  # noqa: E402
+
+INDEX = 'where-used.json'
+
+
+class WhereUsedIndex:
+    """Component -> {assembly: quantity per assembly}, kept in step with its BomGraph"""
+
+    def __init__(self, graph: BomGraph) -> None:
+        self.graph = graph
+        self.parents: dict[str, dict[str, float]] = defaultdict(dict)
+        self._closures: dict[str, dict[str, float]] = {}
+        for parent, lines in graph.children.items():
+            self._link(parent, lines)
+
+    def _link(self, parent: str, lines: Iterable[tuple[str, float]]) -> None:
+        for child, qty in lines:
+            uses = self.parents[child]
+            uses[parent] = uses.get(parent, 0.0) + qty
+
+    def _unlink(self, parent: str, lines: Iterable[tuple[str, float]]) -> None:
+        for child, _ in lines:
+            uses = self.parents.get(child)
+            if uses is not None:
+                uses.pop(parent, None)
+                if not uses:
+                    del self.parents[child]
+
+    @property
+    def computed(self) -> int:
+        """Number of memoized component closures"""
+        return len(self._closures)
+
+    def is_top_level(self, node: str) -> bool:
+        return node not in self.parents
+
+    def used_in(self, node: str) -> dict[str, float]:
+        """Assemblies listing node directly -> quantity per assembly"""
+        return dict(self.parents.get(node, {}))
+
+    def where_used(self, node: str) -> dict[str, float]:
+        """
+        Every assembly above node -> quantity of node in one unit of it.
+
+        Post-order walk up the inverted edges with an explicit stack (the
+        mirror of BomGraph.rollup); each closure is memoized, an assembly
+        already on the current path is a cycle.
+        """
+        if node in self._closures:
+            return self._closures[node]
+        if node not in self.parents:
+            return {}
+
+        path = [node]
+        on_path = {node}
+        stack = [iter(self.parents[node])]
+        while stack:
+            for parent in stack[-1]:
+                if parent in on_path:
+                    raise BomCycleError((path[path.index(parent):] + [parent])[::-1])
+                if parent in self.parents and parent not in self._closures:
+                    path.append(parent)
+                    on_path.add(parent)
+                    stack.append(iter(self.parents[parent]))
+                    break
+            else:
+                stack.pop()
+                done = path.pop()
+                on_path.discard(done)
+                totals: dict[str, float] = defaultdict(float)
+                for parent, qty in self.parents[done].items():
+                    totals[parent] += qty
+                    for ancestor, per_unit in self._closures.get(parent, {}).items():
+                        totals[ancestor] += qty * per_unit
+                self._closures[done] = dict(totals)
+        return self._closures[node]
+
+    def top_level(self, node: str) -> dict[str, float]:
+        """Finished goods (assemblies used in nothing) above node -> quantity of node per unit"""
+        return {fg: qty for fg, qty in self.where_used(node).items() if self.is_top_level(fg)}
+
+    def impact(self, nodes: Iterable[str]) -> dict[str, dict[str, float]]:
+        """Batch query: finished good -> {component: quantity per unit} for the given components"""
+        hit: dict[str, dict[str, float]] = defaultdict(dict)
+        for node in nodes:
+            for fg, qty in self.top_level(node).items():
+                hit[fg][node] = qty
+        return dict(hit)
+
+    def update(self, parent: str, lines: Iterable[tuple[str, float]]) -> int:
+        """
+        Replace parent's BOM (no lines = BOM removed) in the graph and the
+        index. Only the memoized closures of components below parent, before
+        or after the change, are dropped; returns how many.
+        """
+        lines = list(lines)
+        old = self.graph.replace(parent, lines)
+        self._unlink(parent, old)
+        self._link(parent, lines)
+
+        dropped = 0
+        seen = set()
+        stack = [child for child, _ in old + lines]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if self._closures.pop(node, None) is not None:
+                dropped += 1
+            stack.extend(child for child, _ in self.graph.children.get(node, ()))
+        return dropped
+
+    def refresh(self, cur, item_ids: list[str], tenant_id: str | None = None) -> int:
+        """Re-read these items' active BOMs from the database (bom_explosion.bom_lines) and update()"""
+        fresh: dict[str, list[tuple[str, float]]] = {item_id: [] for item_id in item_ids}
+        for parent, component, quantity, scrap in bom_lines(cur, tenant_id, item_ids):
+            fresh[parent].append((component, float(quantity) * (1 + float(scrap) / 100)))
+        # Items created after the index was saved have no label yet
+        unlabelled = {child for lines in fresh.values() for child, _ in lines} - self.graph.labels.keys()
+        if unlabelled:
+            cur.execute("SELECT id::text, code FROM items WHERE id = ANY(%s::uuid[])", (sorted(unlabelled),))
+            self.graph.labels.update(cur.fetchall())
+        return sum(self.update(parent, lines) for parent, lines in fresh.items())
+
+    # -------------------------------------------------------------------------
+
+    def to_json(self, source: str) -> dict:
+        return {
+            'source': source,
+            'labels': self.graph.labels,
+            'boms': {parent: [[child, qty] for child, qty in lines] for parent, lines in self.graph.children.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'WhereUsedIndex':
+        graph = BomGraph()
+        for parent, lines in data['boms'].items():
+            graph.children[parent] = [(child, qty) for child, qty in lines]
+        graph.labels = data['labels']
+        return cls(graph)
+
+
+def save_index(index: WhereUsedIndex, source: str, path: str = INDEX) -> None:
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index.to_json(source), f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def load_index(source: str, path: str = INDEX) -> WhereUsedIndex | None:
+    """Saved index built from the same source, or None"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return WhereUsedIndex.from_json(data) if data.get('source') == source else None
+
+
+def database_items(cur, names: Iterable[str], tenant_id: str | None = None) -> dict[str, str]:
+    """Item id -> code for codes / ids given on the command line, whether or not they are in a BOM yet"""
+    names = list(names)
+    cur.execute(f"""SELECT i.id::text, i.code FROM items i
+                    WHERE (i.code = ANY(%(names)s) OR i.id::text = ANY(%(names)s)) AND {TENANT.format(alias='i')}""",
+                {'names': names, 'tenant': tenant_id})
+    items = dict(cur.fetchall())
+    missing = set(names) - set(items) - set(items.values())
+    if missing:
+        raise SystemExit(f"No such item: {', '.join(sorted(missing))}")
+    return items
+
+
+def resolve(index: WhereUsedIndex, names: Iterable[str]) -> list[str]:
+    """Map codes / names given on the command line to graph nodes (any item in some BOM)"""
+    by_label = {label: node for node, label in index.graph.labels.items()}
+    nodes = []
+    for name in names:
+        node = by_label.get(name, name)
+        if node not in index.parents and not index.graph.is_assembly(node):
+            raise SystemExit(f"{name!r} is in no BOM")
+        nodes.append(node)
+    return nodes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('components', nargs='*', help='Item codes (--dsn) or names (workbook) to look up')
+    parser.add_argument('--file', help='File with one component per line (added to the arguments)')
+    parser.add_argument('--top', action='store_true', help='Only list the top-level finished goods')
+    parser.add_argument('--json', action='store_true', help='Print {component: {assembly: quantity}} as JSON')
+    parser.add_argument('--workbook', default=WORKBOOK, help='Workbook with A-BOM / S-BOM sheets')
+    parser.add_argument('--dsn', help='Read bom_headers / bom_items from this Postgres database instead')
+    parser.add_argument('--tenant', help='Tenant id to read (--dsn)')
+    parser.add_argument('--index', nargs='?', const=INDEX, metavar='PATH',
+                        help=f'Reuse the index saved here, building and saving it when missing (default {INDEX})')
+    parser.add_argument('--refresh', nargs='+', default=[], metavar='ITEM',
+                        help='Re-read these BOMs from --dsn into the index instead of rebuilding it')
+    args = parser.parse_args()
+
+    if args.refresh and not args.dsn:
+        parser.error('--refresh re-reads BOMs from --dsn')
+    names = list(args.components)
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            names += [line.strip() for line in f if line.strip()]
+
+    source = database_source(args.dsn, args.tenant) if args.dsn else f"workbook:{os.path.abspath(args.workbook)}"
+    index = load_index(source, args.index) if args.index else None
+    if index is None:
+        index = WhereUsedIndex(from_database(args.dsn, args.tenant) if args.dsn else from_workbook(args.workbook))
+    elif args.refresh:
+        import psycopg2
+
+        with psycopg2.connect(args.dsn) as conn, conn.cursor() as cur:
+            items = database_items(cur, args.refresh, args.tenant)
+            index.graph.labels.update(items)
+            dropped = index.refresh(cur, list(items), args.tenant)
+        print(f"Refreshed {len(items)} BOM(s), {dropped} memoized closure(s) dropped", file=sys.stderr)
+    if args.index:
+        save_index(index, source, args.index)
+
+    if not names:
+        if args.refresh:
+            return 0
+        parser.error('give components to look up, or --file')
+    nodes = resolve(index, names)
+    label = index.graph.label
+
+    try:
+        results = {node: index.top_level(node) if args.top else index.where_used(node) for node in nodes}
+    except BomCycleError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps({label(node): {label(a): qty for a, qty in sorted(used.items(), key=lambda kv: label(kv[0]))}
+                          for node, used in results.items()}, indent=2))
+        return 0
+
+    for node, used in results.items():
+        direct = index.used_in(node)
+        print(f"{label(node)}: used in {len(direct)} BOM(s) directly, {len(used)} "
+              f"{'finished good(s)' if args.top else 'assemblies in all'}")
+        for assembly, qty in sorted(used.items(), key=lambda kv: label(kv[0])):
+            flags = ('direct ' if assembly in direct else '       ') + ('FG' if index.is_top_level(assembly) else '  ')
+            print(f"  {label(assembly):<50} {qty:>12,.3f}  {flags}")
+    if len(nodes) > 1:
+        impact = index.impact(nodes)
+        print(f"\n{len(impact)} finished good(s) affected by {len(nodes)} components:")
+        for fg, parts in sorted(impact.items(), key=lambda kv: label(kv[0])):
+            print(f"  {label(fg):<50} {len(parts)} of them")
+    print(f"\n{index.computed} component closures computed", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())